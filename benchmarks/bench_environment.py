@@ -0,0 +1,60 @@
+"""
+benchmarks/bench_environment.py
+
+Microbenchmarks for reading variables from a .env file with dotenv.load_dotenv and os.getenv on
+every call, as get_environment used to, versus ConfigurationManager.get_environment and
+get_environment_many, which cache the parsed file and only check its modification time.
+
+Usage:
+    python -m benchmarks.bench_environment
+"""
+
+import os
+import tempfile
+import timeit
+
+import dotenv
+
+from jsonpycraft.manager.configuration import ConfigurationManager
+
+VARIABLES = (10, 100)
+NUMBER = 200
+
+
+def bench(label, statement):
+    seconds = min(timeit.repeat(statement, number=NUMBER, repeat=3))
+    print(f"{label:>36} {seconds / NUMBER * 1e6:>10.1f} us")
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    for count in VARIABLES:
+        env_path = os.path.join(directory, f"{count}.env")
+        names = [f"BENCH_VARIABLE_{i}" for i in range(count)]
+        with open(env_path, "w") as env_file:
+            env_file.writelines(f"{name}=value{i}\n" for i, name in enumerate(names))
+
+        ConfigurationManager._instances = {}
+        config = ConfigurationManager(os.path.join(directory, "bench.json"))
+        config.set_value("env", {"type": "file", "path": env_path})
+        wanted = names[:5]
+
+        def load_each_time():
+            dotenv.load_dotenv(env_path)
+            return [os.getenv(name) for name in wanted]
+
+        print(f"{count} variables in .env, reading 5")
+        bench("load_dotenv + os.getenv", load_each_time)
+        bench(
+            "get_environment x5",
+            lambda: [config.get_environment(n, "env") for n in wanted],
+        )
+        bench(
+            "get_environment_many", lambda: config.get_environment_many(wanted, "env")
+        )
+        for name in names:
+            os.environ.pop(name, None)
+
+
+if __name__ == "__main__":
+    main()
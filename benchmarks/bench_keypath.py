@@ -0,0 +1,59 @@
+"""
+benchmarks/bench_keypath.py
+
+Microbenchmarks for nested reads and writes on JSONMapTemplate with variadic keys versus
+precompiled KeyPath objects, and for dotted-key lookups through ConfigurationManager.
+
+Usage:
+    python -m benchmarks.bench_keypath
+"""
+
+import timeit
+
+from jsonpycraft.json.map import JSONMapTemplate
+from jsonpycraft.json.path import KeyPath
+from jsonpycraft.manager.configuration import ConfigurationManager
+
+DEPTHS = (2, 8, 32)
+NUMBER = 200_000
+
+
+def nested(depth):
+    keys = tuple(f"level{i}" for i in range(depth))
+    data = value = {}
+    for key in keys[:-1]:
+        value[key] = {}
+        value = value[key]
+    value[keys[-1]] = "leaf"
+    return keys, data
+
+
+def bench(label, statement):
+    seconds = min(timeit.repeat(statement, number=NUMBER, repeat=3))
+    print(f"{label:>36} {seconds / NUMBER * 1e9:>10.0f} ns")
+
+
+def main():
+    for depth in DEPTHS:
+        keys, data = nested(depth)
+        template = JSONMapTemplate("bench.json", initial_data=data)
+        path = KeyPath(keys)
+        dotted = ".".join(keys)
+        ConfigurationManager._instances = {}
+        config = ConfigurationManager("bench.json", initial_data=data)
+
+        print(f"depth {depth}")
+        bench("read_nested(*keys)", lambda: template.read_nested(*keys))
+        bench("read_nested(KeyPath)", lambda: template.read_nested(path))
+        bench("KeyPath.from_dotted (cached)", lambda: KeyPath.from_dotted(dotted))
+        bench("update_nested(*keys)", lambda: template.update_nested(1, *keys))
+        bench("update_nested(KeyPath)", lambda: template.update_nested(1, path))
+        bench("get_value(dotted)", lambda: config.get_value(dotted))
+        bench(
+            "get_value(dotted), cache cleared",
+            lambda: (config.clear_cache(), config.get_value(dotted)),
+        )
+
+
+if __name__ == "__main__":
+    main()
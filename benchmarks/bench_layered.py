@@ -0,0 +1,57 @@
+"""
+benchmarks/bench_layered.py
+
+Microbenchmarks for keeping the merged view of layered configuration up to date after a change,
+by rebuilding the whole merged dictionary with deep_merge versus refreshing only the changed
+path with LayeredMap.
+
+Usage:
+    python -m benchmarks.bench_layered
+"""
+
+import timeit
+
+from jsonpycraft.json.layered import LayeredMap
+from jsonpycraft.json.merge import deep_merge
+
+SIZES = (100, 1_000, 10_000)
+LAYERS = 4
+NUMBER = 20
+
+
+def layer(size, offset):
+    return {
+        f"section{i}": {"host": f"host{i + offset}", "port": i, "tags": ["a", "b"]}
+        for i in range(size)
+    }
+
+
+def bench(label, statement, number=NUMBER):
+    seconds = min(timeit.repeat(statement, number=number, repeat=3))
+    print(f"{label:>32} {seconds / number * 1e6:>12.1f} us")
+
+
+def main():
+    for size in SIZES:
+        layers = [layer(size, offset) for offset in range(LAYERS)]
+        view = LayeredMap((f"layer{i}", data) for i, data in enumerate(layers))
+        top = layers[-1]
+
+        def rebuild():
+            top["section0"]["port"] += 1
+            merged = {}
+            for data in layers:
+                deep_merge(merged, data)
+            return merged
+
+        def refresh():
+            top["section0"]["port"] += 1
+            view.refresh(("section0", "port"))
+
+        print(f"{LAYERS} layers of {size} sections")
+        bench("rebuild with deep_merge", rebuild)
+        bench("LayeredMap.refresh", refresh, number=NUMBER * 1_000)
+
+
+if __name__ == "__main__":
+    main()
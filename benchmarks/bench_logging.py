@@ -0,0 +1,87 @@
+"""
+benchmarks/bench_logging.py
+
+Microbenchmarks for the latency of a logging call writing to a file on the calling thread with
+FileHandler, as get_logger does by default, versus putting the record on the bounded queue of a
+listener thread, as get_logger(..., queued=True) does.
+
+Each sink is measured writing to the page cache and with an fsync after every record, which
+stands in for a slow or contended disk. The queue only pays off once writes are slow enough to
+outweigh the queue overhead; with a single CPU core the listener competes with the caller for it.
+
+Usage:
+    python -m benchmarks.bench_logging
+"""
+
+import logging
+import os
+import queue
+import tempfile
+import time
+from logging.handlers import QueueListener
+
+from jsonpycraft.manager.handlers import BoundedQueueHandler
+
+RECORDS = 5_000
+FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class SyncedFileHandler(logging.FileHandler):
+    """A FileHandler forcing every record to disk."""
+
+    def flush(self):
+        super().flush()
+        if self.stream is not None:
+            os.fsync(self.stream.fileno())
+
+
+def make_logger(name, handler):
+    logger = logging.getLogger(name)
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    return logger
+
+
+def bench(label, logger):
+    latencies = []
+    for index in range(RECORDS):
+        start = time.perf_counter()
+        logger.info("record %d of the benchmark", index)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    mean = sum(latencies) / RECORDS
+    p99 = latencies[int(RECORDS * 0.99)]
+    print(
+        f"{label:>28} {mean * 1e6:>10.2f} us mean {p99 * 1e6:>10.2f} us p99"
+        f" {latencies[-1] * 1e3:>8.2f} ms max"
+    )
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    for sink, handler_type in (
+        ("page cache", logging.FileHandler),
+        ("fsync", SyncedFileHandler),
+    ):
+        file_handler = handler_type(os.path.join(directory, f"sync-{sink}.log"))
+        file_handler.setFormatter(logging.Formatter(FORMAT))
+        bench(f"FileHandler ({sink})", make_logger(f"sync.{sink}", file_handler))
+        file_handler.close()
+
+        file_handler = handler_type(os.path.join(directory, f"queued-{sink}.log"))
+        file_handler.setFormatter(logging.Formatter(FORMAT))
+        record_queue = queue.Queue(maxsize=RECORDS)
+        listener = QueueListener(record_queue, file_handler)
+        listener.start()
+        logger = make_logger(f"queued.{sink}", BoundedQueueHandler(record_queue))
+        bench(f"queued ({sink})", logger)
+        start = time.perf_counter()
+        listener.stop()
+        flushed = (time.perf_counter() - start) * 1e3
+        print(f"{'flush on shutdown':>28} {flushed:>10.2f} ms")
+        file_handler.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+benchmarks/bench_parallel.py
+
+Compare serial and process-pool map, filter and reduce over JSONListTemplate records to
+find the list size where the parallel helpers start to pay off.
+
+Usage:
+    python -m benchmarks.bench_parallel
+"""
+
+import math
+import time
+from operator import add
+
+from jsonpycraft.json.list import JSONListTemplate
+
+SIZES = (1_000, 10_000, 50_000, 200_000, 1_000_000)
+
+
+def transform(record):
+    # A CPU-heavy per-record transform
+    value = record["value"]
+    return sum(math.sqrt(value + i) for i in range(50))
+
+
+def predicate(record):
+    return transform(record) > 500
+
+
+def accumulate(total, record):
+    return total + transform(record)
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    print(
+        f"{'records':>10} {'op':>8} {'serial (s)':>12} {'parallel (s)':>14} {'speedup':>8}"
+    )
+    for size in SIZES:
+        records = JSONListTemplate(
+            "bench.json", initial_data=[{"value": i} for i in range(size)]
+        )
+        cases = {
+            "map": lambda threshold: records.parallel_map(
+                transform, serial_threshold=threshold
+            ),
+            "filter": lambda threshold: records.parallel_filter(
+                predicate, serial_threshold=threshold
+            ),
+            "reduce": lambda threshold: records.parallel_reduce(
+                accumulate, 0.0, combine=add, serial_threshold=threshold
+            ),
+        }
+        for name, case in cases.items():
+            serial = timed(lambda: case(size + 1))
+            parallel = timed(lambda: case(0))
+            print(
+                f"{size:>10} {name:>8} {serial:>12.3f} {parallel:>14.3f} {serial / parallel:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+benchmarks/bench_patch.py
+
+Compare structural diffing of a large map with a handful of changes against detecting
+changes by dumping and comparing both maps, and time applying the resulting patch.
+
+Usage:
+    python -m benchmarks.bench_patch
+"""
+
+import json
+import time
+
+from jsonpycraft.json.map import JSONMapTemplate
+from jsonpycraft.json.merge import copy_tree
+
+SIZES = (1_000, 10_000, 100_000)
+CHANGES = 10
+REPEAT = 5
+
+
+def build(size):
+    return {
+        f"service{i}": {"host": f"host{i}", "port": 8000 + i, "tags": ["a", "b"]}
+        for i in range(size)
+    }
+
+
+def timed(func):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        func()
+    return (time.perf_counter() - start) / REPEAT
+
+
+def main():
+    print(
+        f"{'entries':>10} {'dump+compare (ms)':>18} {'diff (ms)':>10} {'apply (ms)':>11} {'ops':>5}"
+    )
+    for size in SIZES:
+        template = JSONMapTemplate("bench.json", initial_data=build(size))
+        # A copy sharing unchanged subtrees, as produced by copy-on-write updates
+        target = dict(template.data)
+        for i in range(0, size, size // CHANGES):
+            target[f"service{i}"] = copy_tree(target[f"service{i}"])
+            target[f"service{i}"]["port"] += 1
+
+        dumped = timed(
+            lambda: json.dumps(template.data, sort_keys=True)
+            == json.dumps(target, sort_keys=True)
+        )
+        diffed = timed(lambda: template.diff(target))
+        patch = template.diff(target)
+
+        # Patch fresh copies so every run applies the same changes
+        copies = iter(
+            [
+                JSONMapTemplate("bench.json", initial_data=copy_tree(template.data))
+                for _ in range(REPEAT)
+            ]
+        )
+        applied = timed(lambda: next(copies).apply_patch(patch))
+        print(
+            f"{size:>10} {dumped * 1e3:>18.2f} {diffed * 1e3:>10.2f} {applied * 1e3:>11.2f} {len(patch):>5}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+benchmarks/bench_persistent.py
+
+Compare snapshotting a large map by deep copying a JSONMapTemplate against the O(1) snapshot
+of a PersistentMapTemplate, and the cost of update_nested on each backend.
+
+Usage:
+    python -m benchmarks.bench_persistent
+"""
+
+import copy
+import time
+
+from jsonpycraft.json.map import JSONMapTemplate
+from jsonpycraft.json.persistent import PersistentMapTemplate
+
+SIZES = (1_000, 10_000, 100_000)
+UPDATES = 10_000
+
+
+def build(size):
+    return {
+        f"service{i}": {"host": f"host{i}", "port": 8000 + i, "tags": ["a", "b"]}
+        for i in range(size)
+    }
+
+
+def timed(func, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    print(
+        f"{'entries':>10} {'deepcopy (ms)':>14} {'snapshot (us)':>14} {'dict update (us)':>17} {'persistent update (us)':>23}"
+    )
+    for size in SIZES:
+        data = build(size)
+        plain = JSONMapTemplate("bench.json", initial_data=data)
+        persistent = PersistentMapTemplate("bench.json", initial_data=data)
+
+        deep = timed(lambda: copy.deepcopy(plain.data))
+        snap = timed(persistent.snapshot, repeat=UPDATES)
+        keys = [f"service{i % size}" for i in range(UPDATES)]
+        plain_update = timed(
+            lambda: [plain.update_nested(1, key, "port") for key in keys]
+        )
+        persistent_update = timed(
+            lambda: [persistent.update_nested(1, key, "port") for key in keys]
+        )
+        print(
+            f"{size:>10} {deep * 1e3:>14.2f} {snap * 1e6:>14.3f} "
+            f"{plain_update / UPDATES * 1e6:>17.2f} {persistent_update / UPDATES * 1e6:>23.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+benchmarks/bench_read_path.py
+
+Compare reading a single value from a large JSON file with read_json, which parses the whole
+document, against read_path, which skips everything before the target without decoding it.
+The target is placed after every record, the worst case for read_path.
+
+Usage:
+    python -m benchmarks.bench_read_path
+"""
+
+import json
+import os
+import tempfile
+import time
+
+from jsonpycraft.json.io import read_json, read_path
+
+SIZES = (10_000, 100_000, 1_000_000)
+REPEAT = 3
+
+
+def build(size):
+    return {
+        "records": [
+            {
+                "id": i,
+                "name": f"user{i}",
+                "tags": ["a", "b"],
+                "profile": {"active": True, "score": i * 0.5},
+            }
+            for i in range(size)
+        ],
+        "build": {"version": "1.2.3"},
+    }
+
+
+def timed(func):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        func()
+    return (time.perf_counter() - start) / REPEAT
+
+
+def main():
+    print(
+        f"{'records':>10} {'size (MB)':>10} {'read_json (ms)':>15} {'read_path (ms)':>15} {'speedup':>8}"
+    )
+    descriptor, path = tempfile.mkstemp(suffix=".json")
+    os.close(descriptor)
+    try:
+        for size in SIZES:
+            with open(path, "w") as file:
+                json.dump(build(size), file, indent=2)
+
+            assert read_path(path, "build.version") == "1.2.3"
+            full = timed(lambda: read_json(path)["build"]["version"])
+            scanned = timed(lambda: read_path(path, "build.version"))
+            print(
+                f"{size:>10} {os.path.getsize(path) / 2**20:>10.1f} {full * 1e3:>15.2f} "
+                f"{scanned * 1e3:>15.2f} {full / scanned:>7.1f}x"
+            )
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
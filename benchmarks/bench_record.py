@@ -0,0 +1,65 @@
+"""
+benchmarks/bench_record.py
+
+Compare fixed-shape records held as dictionaries against generated slotted records: memory
+footprint, field reads, and the cost of converting on load and save.
+
+Usage:
+    python -m benchmarks.bench_record
+"""
+
+import time
+
+from jsonpycraft.json.compact import footprint
+from jsonpycraft.json.record import record_type_from_sample
+
+SIZES = (10_000, 100_000, 1_000_000)
+
+
+def build(size):
+    return [
+        {"id": i, "user": "alice", "score": i * 0.5, "active": True, "level": 3}
+        for i in range(size)
+    ]
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    print(
+        f"{'records':>10} {'dict (MB)':>10} {'slots (MB)':>11} "
+        f"{'dict read (ms)':>15} {'attr read (ms)':>15} {'load (ms)':>10} {'save (ms)':>10}"
+    )
+    for size in SIZES:
+        records = build(size)
+        Entry = record_type_from_sample(records[:100], name="Entry")
+
+        typed = []
+        load = timed(
+            lambda: typed.extend(Entry.from_dict(record) for record in records)
+        )
+        save = timed(lambda: [record.to_dict() for record in typed])
+
+        def read_dicts():
+            total = 0.0
+            for record in records:
+                total += record["score"]
+
+        def read_records():
+            total = 0.0
+            for record in typed:
+                total += record.score
+
+        print(
+            f"{size:>10} {footprint(records) / 2**20:>10.1f} {footprint(typed) / 2**20:>11.1f} "
+            f"{timed(read_dicts) * 1e3:>15.2f} {timed(read_records) * 1e3:>15.2f} "
+            f"{load * 1e3:>10.2f} {save * 1e3:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
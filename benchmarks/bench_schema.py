@@ -0,0 +1,77 @@
+"""
+benchmarks/bench_schema.py
+
+Compare validating a list of records with a compiled Schema against parsing the same list
+with json.loads, and against the jsonschema package when it is installed.
+
+Usage:
+    python -m benchmarks.bench_schema
+"""
+
+import json
+import time
+
+from jsonpycraft.json.schema import Schema
+
+SIZES = (1_000, 10_000, 100_000)
+
+RECORDS = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer", "minimum": 0},
+            "name": {"type": "string", "minLength": 1},
+            "email": {"type": "string", "pattern": "@"},
+            "active": {"type": "boolean"},
+            "tags": {"type": "array", "items": {"type": "string"}},
+        },
+        "required": ["id", "name", "email"],
+    },
+}
+
+
+def build(size):
+    return [
+        {
+            "id": i,
+            "name": f"user{i}",
+            "email": f"user{i}@example.com",
+            "active": i % 2 == 0,
+            "tags": ["a", "b"],
+        }
+        for i in range(size)
+    ]
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    try:
+        import jsonschema
+    except ImportError:
+        jsonschema = None
+
+    schema = Schema(RECORDS)
+    print(
+        f"{'records':>10} {'json.loads (ms)':>16} {'compiled (ms)':>14} {'jsonschema (ms)':>16}"
+    )
+    for size in SIZES:
+        records = build(size)
+        text = json.dumps(records)
+        parse = timed(lambda: json.loads(text))
+        compiled = timed(lambda: schema.validate(records))
+        if jsonschema is not None:
+            validator = jsonschema.Draft7Validator(RECORDS)
+            interpreted = f"{timed(lambda: validator.validate(records)) * 1e3:>16.2f}"
+        else:
+            interpreted = f"{'not installed':>16}"
+        print(f"{size:>10} {parse * 1e3:>16.2f} {compiled * 1e3:>14.2f} {interpreted}")
+
+
+if __name__ == "__main__":
+    main()
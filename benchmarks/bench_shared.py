@@ -0,0 +1,109 @@
+"""
+benchmarks/bench_shared.py
+
+Microbenchmarks for worker processes reading a large configuration by each loading the JSON
+file with ConfigurationManager versus attaching to a version published with
+ConfigurationManager.publish_shared. Each worker reads one value and reports the time it took
+and the memory its copy of the configuration holds. A second table compares repeated reads,
+where the shared reader checks for a new version on every call.
+
+Usage:
+    python -m benchmarks.bench_shared
+"""
+
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+import timeit
+import tracemalloc
+
+from jsonpycraft.manager.configuration import ConfigurationManager
+from jsonpycraft.manager.shared import SharedConfiguration
+
+SERVICES = 20_000
+WORKERS = 8
+NUMBER = 100_000
+
+
+def make_config(count):
+    return {
+        "database": {"host": "db.internal", "port": 5432},
+        "services": {
+            f"service-{i}": {
+                "host": f"10.0.{i // 256 % 256}.{i % 256}",
+                "port": 8000 + i % 1000,
+                "tags": ["internal", f"zone-{i % 4}"],
+            }
+            for i in range(count)
+        },
+    }
+
+
+def load_file(file_path, results):
+    tracemalloc.start()
+    start = time.perf_counter()
+    ConfigurationManager._instances = {}
+    config = ConfigurationManager(file_path)
+    config.load()
+    config.get_value("database.port")
+    results.put((time.perf_counter() - start, tracemalloc.get_traced_memory()[0]))
+
+
+def attach(name, results):
+    tracemalloc.start()
+    start = time.perf_counter()
+    shared = SharedConfiguration(name)
+    shared.get_value("database.port")
+    results.put((time.perf_counter() - start, tracemalloc.get_traced_memory()[0]))
+    shared.close()
+
+
+def run_workers(label, target, argument):
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    workers = [
+        context.Process(target=target, args=(argument, results)) for _ in range(WORKERS)
+    ]
+    for worker in workers:
+        worker.start()
+    samples = [results.get() for _ in workers]
+    for worker in workers:
+        worker.join()
+    seconds = sum(sample[0] for sample in samples) / WORKERS
+    memory = sum(sample[1] for sample in samples) / WORKERS
+    print(f"{label:>28} {seconds * 1e3:>10.2f} ms {memory / 1e6:>10.2f} MB")
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    file_path = os.path.join(directory, "config.json")
+    with open(file_path, "w") as file:
+        json.dump(make_config(SERVICES), file, indent=2)
+
+    config = ConfigurationManager(file_path)
+    config.load()
+    name = config.publish_shared()
+    try:
+        size = os.path.getsize(file_path) / 1e6
+        print(f"{WORKERS} workers, {SERVICES} services ({size:.1f} MB JSON)")
+        print(f"{'':>28} {'first read':>13} {'held':>13}")
+        run_workers("load file", load_file, file_path)
+        run_workers("attach shared", attach, name)
+
+        shared = SharedConfiguration(name)
+        print("repeated reads of one key")
+        for label, statement in (
+            ("ConfigurationManager", lambda: config.get_value("database.port")),
+            ("SharedConfiguration", lambda: shared.get_value("database.port")),
+        ):
+            seconds = min(timeit.repeat(statement, number=NUMBER, repeat=3))
+            print(f"{label:>28} {seconds / NUMBER * 1e9:>10.1f} ns")
+        shared.close()
+    finally:
+        config.close_shared()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+benchmarks/bench_snapshot.py
+
+Multi-threaded read throughput of ConfigurationManager under concurrent writes, with every
+access guarded by one lock versus lock-free reads of published snapshots (`snapshot_reads`).
+
+A writer thread updates a pair of values in a transaction and saves the file at a fixed
+interval while reader threads read them. With one lock, readers wait for every write to finish,
+file I/O included; with snapshots, they keep reading the previous version. Each reader checks
+that both values of the pair match, so a torn read of a half-applied write would be counted.
+
+Usage:
+    python -m benchmarks.bench_snapshot
+"""
+
+import os
+import tempfile
+import threading
+import time
+from contextlib import nullcontext
+
+from jsonpycraft.manager.configuration import ConfigurationManager
+
+READERS = (1, 4, 8)
+DURATION = 1.0
+WRITE_INTERVAL = 0.001
+KEYS = ("db.host", "db.port", "cache.ttl", "pair.first")
+# Reads between checks of the pair, whose snapshot values are slower to read than dictionaries
+CHECK_EVERY = 100
+
+
+def run(snapshot_reads, readers, file_path):
+    ConfigurationManager._instances = {}
+    config = ConfigurationManager(
+        file_path,
+        initial_data={
+            "db": {"host": "localhost", "port": 5432},
+            "cache": {"ttl": 60},
+            "pair": {"first": 0, "second": 0},
+        },
+        snapshot_reads=snapshot_reads,
+    )
+    # Without snapshots, readers and the writer share one lock to stay consistent
+    guard = nullcontext() if snapshot_reads else threading.RLock()
+    stop = threading.Event()
+    reads = [0] * readers
+    torn = [0] * readers
+    writes = 0
+
+    def read(index):
+        count = mismatched = 0
+        while not stop.is_set():
+            for _ in range(CHECK_EVERY):
+                for key in KEYS:
+                    with guard:
+                        config.get_value(key)
+            with guard:
+                pair = config.get_value("pair")
+                mismatched += pair["first"] != pair["second"]
+            count += CHECK_EVERY * len(KEYS) + 1
+        reads[index] = count
+        torn[index] = mismatched
+
+    def write():
+        nonlocal writes
+        while not stop.is_set():
+            with guard, config.transaction():
+                writes += 1
+                config.set_value("pair.first", writes)
+                config.set_value("pair.second", writes)
+                config.save()
+            time.sleep(WRITE_INTERVAL)
+
+    threads = [threading.Thread(target=read, args=(i,)) for i in range(readers)]
+    threads.append(threading.Thread(target=write))
+    for thread in threads:
+        thread.start()
+    time.sleep(DURATION)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(reads) / DURATION, writes / DURATION, sum(torn)
+
+
+def main():
+    file_path = os.path.join(tempfile.mkdtemp(), "bench.json")
+    print(f"{'mode':>10} {'readers':>8} {'reads/s':>12} {'writes/s':>10} {'torn':>6}")
+    for readers in READERS:
+        for label, snapshot_reads in (("locked", False), ("snapshot", True)):
+            reads, writes, torn = run(snapshot_reads, readers, file_path)
+            print(
+                f"{label:>10} {readers:>8} {reads:>12,.0f} {writes:>10,.0f} {torn:>6}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+benchmarks/bench_startup.py
+
+Microbenchmarks for loading a large configuration file at process startup by parsing the JSON,
+as ConfigurationManager.load does by default, versus loading its binary cache file, as it does
+with binary_cache=True. The in-process rows time the load alone; the process rows time starting
+a fresh interpreter that imports jsonpycraft and loads the configuration.
+
+Usage:
+    python -m benchmarks.bench_startup
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+
+from jsonpycraft.json.cache import cache_path, read_cached_json, write_json_cache
+from jsonpycraft.json.io import read_json
+
+SERVICES = (1_000, 10_000, 50_000)
+NUMBER = 5
+PROCESSES = 5
+
+STARTUP = """
+import sys
+from jsonpycraft.manager.configuration import ConfigurationManager
+config = ConfigurationManager(sys.argv[1], binary_cache=sys.argv[2] == "cache")
+config.load()
+"""
+
+
+def make_config(count):
+    return {
+        "services": {
+            f"service-{i}": {
+                "host": f"10.0.{i // 256 % 256}.{i % 256}",
+                "port": 8000 + i % 1000,
+                "enabled": i % 3 != 0,
+                "weight": i / 7,
+                "tags": ["internal", f"zone-{i % 4}"],
+                "limits": {"connections": 100, "timeout": 2.5},
+            }
+            for i in range(count)
+        }
+    }
+
+
+def bench(label, statement):
+    seconds = min(timeit.repeat(statement, number=NUMBER, repeat=3)) / NUMBER
+    print(f"{label:>28} {seconds * 1e3:>10.2f} ms")
+
+
+def bench_process(label, file_path, mode):
+    env = dict(os.environ, PYTHONPATH=os.getcwd())
+    command = [sys.executable, "-c", STARTUP, file_path, mode]
+    best = float("inf")
+    for _ in range(PROCESSES):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, env=env)
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:>28} {best * 1e3:>10.2f} ms")
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    for count in SERVICES:
+        file_path = os.path.join(directory, f"{count}.json")
+        with open(file_path, "w") as file:
+            json.dump(make_config(count), file, indent=2)
+        write_json_cache(file_path)
+        size = os.path.getsize(file_path) / 1e6
+        cached = os.path.getsize(cache_path(file_path)) / 1e6
+
+        print(f"{count} services ({size:.1f} MB JSON, {cached:.1f} MB cache)")
+        bench("read_json", lambda: read_json(file_path))
+        bench("read_cached_json", lambda: read_cached_json(file_path))
+        bench_process("process, JSON", file_path, "json")
+        bench_process("process, binary cache", file_path, "cache")
+
+
+if __name__ == "__main__":
+    main()
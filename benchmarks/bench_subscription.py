@@ -0,0 +1,70 @@
+"""
+benchmarks/bench_subscription.py
+
+Compare reacting to changes under a subtree with trie-dispatched subscriptions against
+diffing a copy of the whole map after each write, across map sizes and subscription counts.
+
+Usage:
+    python -m benchmarks.bench_subscription
+"""
+
+import time
+
+from jsonpycraft.json.map import JSONMapTemplate
+from jsonpycraft.json.merge import copy_tree
+
+SIZES = (1_000, 10_000, 100_000)
+SUBSCRIBERS = (1, 100, 1_000)
+WRITES = 1_000
+
+
+def build(size):
+    return {f"service{i}": {"host": f"host{i}", "port": 8000 + i} for i in range(size)}
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    print(
+        f"{'entries':>10} {'subscribers':>12} {'plain (us)':>11} {'subscribed (us)':>16} {'diff (us)':>10}"
+    )
+    for size in SIZES:
+        # Diffing needs a copy of the previous version after every write
+        template = JSONMapTemplate("bench.json", initial_data=build(size))
+        writes = max(1, WRITES // 100)
+
+        def write_and_diff():
+            previous = copy_tree(template.data)
+            for i in range(writes):
+                template.update_nested(i, f"service{i % size}", "port")
+                template.diff(previous)
+                previous = copy_tree(template.data)
+
+        diffed = timed(write_and_diff) / writes
+
+        for count in SUBSCRIBERS:
+            template = JSONMapTemplate("bench.json", initial_data=build(size))
+
+            def write():
+                for i in range(WRITES):
+                    template.update_nested(i, f"service{i % size}", "port")
+
+            plain = timed(write)
+
+            hits = []
+            for i in range(count):
+                template.subscribe(f"service{i}.port", hits.append)
+            subscribed = timed(write)
+
+            print(
+                f"{size:>10} {count:>12} {plain / WRITES * 1e6:>11.2f} "
+                f"{subscribed / WRITES * 1e6:>16.2f} {diffed * 1e6:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
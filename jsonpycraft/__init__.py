@@ -21,6 +21,8 @@ from jsonpycraft.core.errors import (
     JSONDecodeErrorHandler,
     JSONEncodeErrorHandler,
     JSONFileErrorHandler,
+    JSONPatchErrorHandler,
+    JSONSchemaErrorHandler,
 )
 from jsonpycraft.core.singleton import Singleton
 from jsonpycraft.core.types import (  # JSONError == EncodeError + DecodeError
@@ -33,9 +35,31 @@ from jsonpycraft.core.types import (  # JSONError == EncodeError + DecodeError
     JSONMap,
 )
 from jsonpycraft.json.base import JSONBaseTemplate
-from jsonpycraft.json.io import dump_json, force_read_json, read_json, write_json
+from jsonpycraft.json.cache import read_cached_json, write_json_cache
+from jsonpycraft.json.compact import StringInterner, footprint
+from jsonpycraft.json.io import (
+    dump_json,
+    force_read_json,
+    read_json,
+    read_path,
+    write_json,
+)
+from jsonpycraft.json.layered import LayeredMap, environment_layer
 from jsonpycraft.json.list import JSONListTemplate
 from jsonpycraft.json.map import JSONMapTemplate
+from jsonpycraft.json.merge import deep_merge
+from jsonpycraft.json.patch import apply_patch, diff
+from jsonpycraft.json.path import KeyPath
+from jsonpycraft.json.persistent import PersistentMap, PersistentMapTemplate
+from jsonpycraft.json.query import PathPattern, query
+from jsonpycraft.json.record import (
+    Record,
+    record_type,
+    record_type_from_sample,
+    record_type_from_schema,
+)
+from jsonpycraft.json.schema import Schema
+from jsonpycraft.json.subscription import Subscriptions
 from jsonpycraft.manager.configuration import ConfigurationManager
 
 # Additional project details extracted from pyproject.toml
@@ -5,6 +5,8 @@ from jsonpycraft.core.errors import (
     JSONDecodeErrorHandler,
     JSONEncodeErrorHandler,
     JSONFileErrorHandler,
+    JSONPatchErrorHandler,
+    JSONSchemaErrorHandler,
 )
 from jsonpycraft.core.singleton import Singleton
 from jsonpycraft.core.types import (
@@ -16,3 +18,4 @@ from jsonpycraft.core.types import (
     JSONList,
     JSONMap,
 )
+from jsonpycraft.core.undo import UndoLog
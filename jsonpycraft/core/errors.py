@@ -9,6 +9,8 @@ Exception Classes:
 - JSONFileErrorHandler: Exception raised for file-related errors in JSON operations.
 - JSONEncodeErrorHandler: Exception raised for errors during JSON encoding.
 - JSONDecodeErrorHandler: Exception raised for errors during JSON decoding.
+- JSONPatchErrorHandler: Exception raised when a JSON Patch cannot be applied.
+- JSONSchemaErrorHandler: Exception raised when JSON data does not match its schema.
 
 Usage:
 You can use these custom exceptions in your jsonpycraft-based applications to provide more detailed error messages or to handle specific error conditions gracefully. When a relevant error occurs, you can raise one of these exceptions, and in your code, you can catch and handle them as needed.
@@ -33,4 +35,16 @@ class JSONDecodeErrorHandler(Exception):
     pass
 
 
+class JSONPatchErrorHandler(Exception):
+    """Exception raised when a JSON Patch (RFC 6902) operation cannot be applied."""
+
+    pass
+
+
+class JSONSchemaErrorHandler(Exception):
+    """Exception raised when JSON data does not match its schema."""
+
+    pass
+
+
 # Additional custom exceptions can be added here as needed.
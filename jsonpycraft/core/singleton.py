@@ -20,34 +20,94 @@ Example Usage:
     print(instance1 is instance2)  # Output: True
     print(instance1.data)  # Output: "Instance 2"
 
+Instances can also be keyed by constructor arguments, such as one instance per file, by
+overriding the `_instance_key` class method:
+
+    class PerFile(Singleton):
+        @classmethod
+        def _instance_key(cls, path, *args, **kwargs):
+            return os.path.abspath(path)
+
+        def __init__(self, path):
+            self.path = path
+
+    PerFile("a.json") is PerFile("a.json")  # True
+    PerFile("a.json") is PerFile("b.json")  # False
+
+Creating an instance is thread-safe: concurrent first calls with the same key build a single
+instance, while calls for an existing instance never take a lock.
+
 Note:
 - Subclasses should not override the `__new__` method.
 """
 
+import threading
+from typing import Any, Dict, Hashable, List
+
 
 class MetaSingleton(type):
     """
     Metaclass for implementing the Singleton pattern.
 
     Attributes:
-        _instances (dict): A dictionary storing the singleton instances of classes.
+        _instances (dict): A dictionary storing the singleton instances of classes, keyed by the
+            class, or by (class, key) for classes keyed by constructor arguments.
+        _lock (threading.Lock): Guards `_creation_locks`.
+        _creation_locks (dict): The lock of each instance being created and the number of
+            threads using it, keyed as `_instances`.
     """
 
     _instances = {}
+    _lock = threading.Lock()
+    _creation_locks: Dict[Hashable, List] = {}
 
     def __call__(cls, *args, **kwargs):
         """
         Call method invoked when a singleton class is instantiated.
 
+        Existing instances are returned without locking. The first call for a key creates the
+        instance under a lock of its own, so concurrent first calls build it once and the
+        creation of other instances is not blocked.
+
         Args:
             cls (type): The class object.
 
         Returns:
             object: The singleton instance of the class.
         """
-        if cls not in cls._instances:
-            cls._instances[cls] = super(MetaSingleton, cls).__call__(*args, **kwargs)
-        return cls._instances[cls]
+        instance_key = getattr(cls, "_instance_key", None)
+        key: Any = cls
+        if instance_key is not None:
+            argument_key = instance_key(*args, **kwargs)
+            if argument_key is not None:
+                key = (cls, argument_key)
+
+        instance = cls._instances.get(key)
+        if instance is not None:
+            return instance
+
+        # The lock stays registered while any thread uses it, so a thread arriving after a
+        # failed construction waits on the same lock as the threads retrying it
+        with MetaSingleton._lock:
+            entry = MetaSingleton._creation_locks.get(key)
+            if entry is None:
+                entry = MetaSingleton._creation_locks[key] = [threading.Lock(), 0]
+            entry[1] += 1
+            lock = entry[0]
+        try:
+            with lock:
+                # Another thread may have created the instance while this one waited
+                instances = cls._instances
+                instance = instances.get(key)
+                if instance is None:
+                    instance = super(MetaSingleton, cls).__call__(*args, **kwargs)
+                    instances[key] = instance
+        finally:
+            with MetaSingleton._lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del MetaSingleton._creation_locks[key]
+        return instance
 
 
 class Singleton(object, metaclass=MetaSingleton):
@@ -63,6 +123,19 @@ class Singleton(object, metaclass=MetaSingleton):
         None
     """
 
+    @classmethod
+    def _instance_key(cls, *args, **kwargs) -> Hashable:
+        """
+        Return the key of the instance for the given constructor arguments.
+
+        Override to keep one instance per key, such as per file path. The arguments are those
+        passed to the constructor and must be accepted as such.
+
+        Returns:
+            Hashable: The instance key, or None for a single instance of the class.
+        """
+        return None
+
     def __init__(self):
         """
         Initializes a new instance of the Singleton class.
@@ -0,0 +1,146 @@
+"""
+jsonpycraft/core/undo.py
+
+This module provides an undo log for reverting in-place mutations of JSON structures.
+
+Before an entry of a dictionary or list is assigned, inserted or deleted, its previous state
+is recorded. Rolling back replays the recorded states in reverse order, so the cost of a
+rollback is proportional to the number of mutations rather than to the size of the structure.
+
+Example Usage:
+    from jsonpycraft.core.undo import UndoLog
+
+    data = {"a": 1}
+    log = UndoLog()
+
+    log.record(data, "a")
+    data["a"] = 2
+    log.record(data, "b")
+    data["b"] = 3
+
+    log.rollback()
+    print(data)  # Output: {"a": 1}
+"""
+
+from typing import Any, List, Tuple, Union
+
+# Sentinel for an entry which did not exist before it was mutated
+ABSENT = object()
+
+# Actions recorded for list items which were inserted or removed, and dictionary keys deleted
+_INSERT = "insert"
+_REMOVE = "remove"
+_DELETE = "delete"
+
+
+class UndoLog:
+    """
+    A log of previous dictionary entry and list item states.
+
+    Attributes:
+        _entries (List[Tuple[Union[dict, list], Any, Any, Any]]): The recorded (container, key, previous value, action) entries.
+    """
+
+    def __init__(self):
+        """Initialize an empty UndoLog instance."""
+        self._entries: List[Tuple[Union[dict, list], Any, Any, Any]] = []
+
+    def __len__(self) -> int:
+        """Return the number of recorded entries."""
+        return len(self._entries)
+
+    def record(self, container: Union[dict, list], key: Any) -> None:
+        """
+        Record the current state of an entry before it is assigned, or deleted from a dictionary.
+
+        A deleted dictionary entry is restored at the end of the dictionary; use record_delete
+        to keep the key order.
+
+        Args:
+            container (Union[dict, list]): The dictionary or list about to be mutated.
+            key (Any): The key or index about to be assigned or deleted.
+        """
+        if isinstance(container, dict):
+            previous = container.get(key, ABSENT)
+        else:
+            previous = container[key]
+        self._entries.append((container, key, previous, None))
+
+    def record_delete(self, container: dict, key: Any) -> None:
+        """
+        Record a dictionary entry and its position before it is deleted.
+
+        Rolling back restores the entry at its position, so the key order, and the order of the
+        saved file, are unchanged.
+
+        Args:
+            container (dict): The dictionary about to be mutated.
+            key (Any): The key about to be deleted.
+        """
+        for position, existing in enumerate(container):
+            if existing == key:
+                break
+        else:
+            raise KeyError(key)
+        self._entries.append((container, key, (container[key], position), _DELETE))
+
+    def record_insert(self, container: list, index: int) -> None:
+        """
+        Record that an item is about to be inserted into a list.
+
+        Args:
+            container (list): The list about to be mutated.
+            index (int): The index the item will be inserted at.
+        """
+        self._entries.append((container, index, None, _INSERT))
+
+    def record_remove(self, container: list, index: int) -> None:
+        """
+        Record an item before it is removed from a list.
+
+        Args:
+            container (list): The list about to be mutated.
+            index (int): The index of the item about to be removed.
+        """
+        self._entries.append((container, index, container[index], _REMOVE))
+
+    def mark(self) -> int:
+        """
+        Return a savepoint which can be passed to rollback.
+
+        Returns:
+            int: The current length of the log.
+        """
+        return len(self._entries)
+
+    def rollback(self, mark: int = 0) -> None:
+        """
+        Revert all mutations recorded after a savepoint, most recent first.
+
+        Args:
+            mark (int): The savepoint returned by mark. Defaults to 0, reverting everything.
+        """
+        entries = self._entries
+        while len(entries) > mark:
+            container, key, previous, action = entries.pop()
+            if action == _REMOVE:
+                container.insert(key, previous)
+            elif action == _INSERT:
+                del container[key]
+            elif action == _DELETE:
+                value, position = previous
+                if position >= len(container):
+                    container[key] = value
+                else:
+                    items = list(container.items())
+                    items.insert(position, (key, value))
+                    container.clear()
+                    container.update(items)
+            elif previous is ABSENT:
+                container.pop(key, None)
+            else:
+                container[key] = previous
+
+    def clear(self) -> None:
+        """Forget all recorded entries, making the mutations permanent."""
+        self._entries.clear()
@@ -2,6 +2,28 @@
 jsonpycraft/json/__init__.py
 """
 from jsonpycraft.json.base import JSONBaseTemplate
-from jsonpycraft.json.io import dump_json, force_read_json, read_json, write_json
+from jsonpycraft.json.cache import read_cached_json, write_json_cache
+from jsonpycraft.json.compact import StringInterner, footprint
+from jsonpycraft.json.io import (
+    dump_json,
+    force_read_json,
+    read_json,
+    read_path,
+    write_json,
+)
+from jsonpycraft.json.layered import LayeredMap, environment_layer
 from jsonpycraft.json.list import JSONListTemplate
 from jsonpycraft.json.map import JSONMapTemplate
+from jsonpycraft.json.merge import deep_merge
+from jsonpycraft.json.patch import apply_patch, diff
+from jsonpycraft.json.path import KeyPath
+from jsonpycraft.json.persistent import PersistentMap, PersistentMapTemplate
+from jsonpycraft.json.query import PathPattern, query
+from jsonpycraft.json.record import (
+    Record,
+    record_type,
+    record_type_from_sample,
+    record_type_from_schema,
+)
+from jsonpycraft.json.schema import Schema
+from jsonpycraft.json.subscription import Subscriptions
@@ -11,14 +11,23 @@ REFERENCE:
 
 import json
 from pathlib import Path
-from typing import Optional, Protocol
+from typing import Any, Optional, Protocol, Union
 
 from jsonpycraft.core.errors import (
     JSONDecodeErrorHandler,
     JSONEncodeErrorHandler,
     JSONFileErrorHandler,
 )
-from jsonpycraft.core.types import DecodeError, EncodeError, FileError, JSONData
+from jsonpycraft.core.types import (
+    DecodeError,
+    EncodeError,
+    FileError,
+    JSONData,
+    JSONMap,
+)
+from jsonpycraft.json.cache import read_cached_json
+from jsonpycraft.json.compact import StringInterner
+from jsonpycraft.json.schema import Schema
 
 
 class JSONBaseTemplate(Protocol):
@@ -28,12 +37,14 @@ class JSONBaseTemplate(Protocol):
     Properties:
         _file_path (Path): A path-like object pointing to the JSON source file.
         _data (Optional[JSONData]): The internal JSON data structure. May be None if not loaded.
+        _schema (Optional[Schema]): The compiled schema validated on load and save, if any.
     """
 
     def __init__(
         self,
         file_path: str,
         initial_data: Optional[JSONData] = None,
+        schema: Optional[Union[Schema, JSONMap]] = None,
     ):
         """
         Initialize a JSONBaseTemplate instance.
@@ -41,9 +52,16 @@ class JSONBaseTemplate(Protocol):
         Parameters:
             file_path (str): The path to the JSON file.
             initial_data (Optional[JSONData]): The initial data. Defaults to None.
+            schema (Optional[Union[Schema, JSONMap]]): A schema, or a compiled Schema, validated on load and save. Defaults to None.
+
+        Raises:
+            ValueError: If the schema is invalid or uses an unsupported keyword.
         """
         self._file_path = Path(file_path)
         self._data: Optional[JSONData] = initial_data
+        if schema is not None and not isinstance(schema, Schema):
+            schema = Schema(schema)
+        self._schema: Optional[Schema] = schema
 
     @property
     def file_path(self) -> Path:
@@ -55,6 +73,16 @@ class JSONBaseTemplate(Protocol):
         """
         return self._file_path
 
+    @property
+    def schema(self) -> Optional[Schema]:
+        """
+        Get the compiled schema validated on load and save.
+
+        Returns:
+            Optional[Schema]: The schema, or None if validation is disabled.
+        """
+        return self._schema
+
     @property
     def data(self) -> Optional[JSONData]:
         """
@@ -65,17 +93,35 @@ class JSONBaseTemplate(Protocol):
         """
         return self._data
 
-    def load_json(self) -> None:
+    def load_json(self, compact: bool = False, cache: bool = False) -> None:
         """
         Load JSON data from the file into the _data attribute.
 
+        Parameters:
+            compact (bool): Intern keys and share repeated short strings while decoding. Defaults to False.
+            cache (bool): Load from the binary cache file of the file, rebuilding it if stale. Defaults to False.
+
         Raises:
             JSONFileErrorHandler: If there is a file-related error accessing the JSON file.
             JSONDecodeErrorHandler: If there is an error loading JSON data from the file.
+            JSONSchemaErrorHandler: If the loaded data does not match the schema. The current data is kept.
         """
+        if cache:
+            data = read_cached_json(self._file_path, compact=compact)
+            if self._schema is not None:
+                self._schema.validate(data)
+            self._data = self._from_json(data)
+            return
+
         try:
             with self._file_path.open("r") as file:
-                self._data = json.load(file)
+                if compact:
+                    data = json.load(file, object_pairs_hook=StringInterner())
+                else:
+                    data = json.load(file)
+            if self._schema is not None:
+                self._schema.validate(data)
+            self._data = self._from_json(data)
         except FileError as e:
             raise JSONFileErrorHandler(f"File error accessing {self._file_path}: {e}")
         except DecodeError as e:
@@ -96,19 +142,49 @@ class JSONBaseTemplate(Protocol):
         Raises:
             JSONFileErrorHandler: If there is a file-related error accessing the JSON file.
             JSONEncodeErrorHandler: If there is an error saving JSON data to the file.
+            JSONSchemaErrorHandler: If the data does not match the schema. The file is left untouched.
         """
+        if data is not None:
+            data = self._from_json(data)
+        payload = self._to_json(self._data if data is None else data)
+        # Validate before opening the file, which truncates it
+        if self._schema is not None:
+            self._schema.validate(payload)
+
         try:
             with self._file_path.open("w") as file:
+                json.dump(payload, file, indent=indent)
                 if data is not None:
-                    json.dump(data, file, indent=indent)
                     self._data = data  # Update the _data attribute if data is provided
-                else:
-                    json.dump(self._data, file, indent=indent)
         except FileError as e:
             raise JSONFileErrorHandler(f"File error accessing {self._file_path}: {e}")
         except EncodeError as e:
             raise JSONEncodeErrorHandler(f"Error saving JSON to {self._file_path}: {e}")
 
+    def _from_json(self, data: JSONData) -> Any:
+        """
+        Convert decoded JSON data into the internal representation held by _data.
+
+        Parameters:
+            data (JSONData): The decoded JSON data.
+
+        Returns:
+            Any: The internal representation. The base template keeps the data as is.
+        """
+        return data
+
+    def _to_json(self, data: Any) -> JSONData:
+        """
+        Convert the internal representation back into JSON serializable data.
+
+        Parameters:
+            data (Any): The internal representation held by _data.
+
+        Returns:
+            JSONData: The data to be encoded. The base template returns the data as is.
+        """
+        return data
+
     def backup_json(self, indent: int = 2) -> None:
         """
         Create a backup of the JSON file.
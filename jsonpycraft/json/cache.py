@@ -0,0 +1,185 @@
+"""
+jsonpycraft/json/cache.py
+
+Binary cache files for fast reloading of large JSON files.
+
+Decoding JSON is dominated by tokenizing text. A cache file stores the decoded data in `marshal`
+format next to the JSON file, which rebuilds the same objects about twice as fast, so processes
+reading the same large file on every start only pay for parsing it once.
+
+A cache file records the size, modification time and SHA-256 hash of the JSON file it was built
+from. It is used only while all three match the JSON file and it was written by the same Python
+version, and is rebuilt from the JSON file otherwise. Failing to write a cache file, such as in
+a read-only directory, is not an error: the data is simply parsed again on the next read.
+
+WARNING:
+    marshal is not secure against maliciously constructed data. Cache files must live where only
+    the owners of the JSON file can write.
+
+Example Usage:
+    from jsonpycraft.json.cache import read_cached_json
+
+    data = read_cached_json("config.json")  # Parses config.json and writes config.json.cache
+    data = read_cached_json("config.json")  # Loads config.json.cache
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import struct
+import sys
+import tempfile
+from pathlib import Path
+from typing import Tuple, Union
+
+from jsonpycraft.core.errors import JSONDecodeErrorHandler, JSONFileErrorHandler
+from jsonpycraft.core.types import DecodeError, FileError, JSONData
+from jsonpycraft.json.compact import StringInterner
+
+# The suffix appended to the JSON file name to name its cache file
+CACHE_SUFFIX = ".cache"
+
+_MAGIC = b"JPCC"
+# The magic number, then the length of the marshalled header following it
+_PREFIX = struct.Struct("<4sI")
+
+
+def cache_path(filepath: Union[str, Path]) -> Path:
+    """
+    Get the path of the cache file of a JSON file.
+
+    Args:
+        filepath (Union[str, Path]): The path to the JSON file.
+
+    Returns:
+        Path: The JSON file path with CACHE_SUFFIX appended.
+    """
+    filepath = Path(filepath)
+    return filepath.with_name(filepath.name + CACHE_SUFFIX)
+
+
+def _stamp(stat: os.stat_result, compact: bool) -> Tuple:
+    """Return the header fields checked before hashing the source."""
+    return (sys.implementation.cache_tag, stat.st_size, stat.st_mtime_ns, compact)
+
+
+def _decode(filepath: Union[str, Path], source: bytes, compact: bool) -> JSONData:
+    try:
+        if compact:
+            return json.loads(source, object_pairs_hook=StringInterner())
+        return json.loads(source)
+    except DecodeError as e:
+        raise JSONDecodeErrorHandler(f"Error decoding JSON data at {filepath}: {e}")
+
+
+def _load_cache(path: Path, stat: os.stat_result, source: bytes, compact: bool):
+    """Return the cached data if the cache file matches the source, else None."""
+    try:
+        with path.open("rb") as file:
+            magic, length = _PREFIX.unpack(file.read(_PREFIX.size))
+            if magic != _MAGIC:
+                return None
+            stamp, digest = marshal.loads(file.read(length))
+            # Compare the cheap fields before hashing the source
+            if stamp != _stamp(stat, compact):
+                return None
+            if digest != hashlib.sha256(source).digest():
+                return None
+            # marshal.load reads a file object in small pieces, which is several times slower
+            return (marshal.loads(file.read()),)
+    except (OSError, ValueError, EOFError, TypeError, IndexError, struct.error):
+        return None  # Missing, truncated or foreign cache files are rebuilt
+
+
+def _write_cache(
+    path: Path, stat: os.stat_result, source: bytes, data: JSONData, compact: bool
+) -> bool:
+    """Atomically write a cache file, returning False if it could not be written."""
+    try:
+        payload = marshal.dumps(data)
+        header = marshal.dumps((_stamp(stat, compact), hashlib.sha256(source).digest()))
+    except ValueError:
+        return False  # Nesting too deep for marshal
+
+    try:
+        descriptor, temporary = tempfile.mkstemp(
+            prefix=path.name + ".", dir=path.parent
+        )
+    except OSError:
+        return False
+    try:
+        # Readable by the same users as the JSON file
+        os.fchmod(descriptor, stat.st_mode & 0o666)
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(_PREFIX.pack(_MAGIC, len(header)))
+            file.write(header)
+            file.write(payload)
+        os.replace(temporary, path)
+        return True
+    except OSError:
+        try:
+            os.unlink(temporary)
+        except OSError:
+            pass
+        return False
+
+
+def _read_source(filepath: Union[str, Path]) -> Tuple[os.stat_result, bytes]:
+    with open(filepath, "rb") as file:
+        stat = os.fstat(file.fileno())
+        return stat, file.read()
+
+
+def read_cached_json(filepath: Union[str, Path], compact: bool = False) -> JSONData:
+    """
+    Reads JSON data from a file through its cache file, rebuilding the cache file if it is stale.
+
+    Args:
+        filepath (Union[str, Path]): The path to the JSON file to read.
+        compact (bool): Intern keys and share repeated short strings while decoding (default is False). Cache files record the flag, and one built with another value is rebuilt.
+
+    Returns:
+        JSONData: The JSON data read from the file.
+
+    Raises:
+        JSONFileErrorHandler: If a file-related error occurs reading the JSON file.
+        JSONDecodeErrorHandler: If a JSON decoding error occurs.
+    """
+    try:
+        stat, source = _read_source(filepath)
+    except FileError as e:
+        raise JSONFileErrorHandler(f"File error accessing {filepath}: {e}")
+
+    path = cache_path(filepath)
+    cached = _load_cache(path, stat, source, compact)
+    if cached is not None:
+        return cached[0]
+
+    data = _decode(filepath, source, compact)
+    _write_cache(path, stat, source, data, compact)
+    return data
+
+
+def write_json_cache(filepath: Union[str, Path], compact: bool = False) -> bool:
+    """
+    Build the cache file of a JSON file ahead of its first read, such as after deploying it.
+
+    Args:
+        filepath (Union[str, Path]): The path to the JSON file.
+        compact (bool): Build the cache file for compact reads (default is False).
+
+    Returns:
+        bool: True if the cache file was written, False if it could not be.
+
+    Raises:
+        JSONFileErrorHandler: If a file-related error occurs reading the JSON file.
+        JSONDecodeErrorHandler: If a JSON decoding error occurs.
+    """
+    try:
+        stat, source = _read_source(filepath)
+    except FileError as e:
+        raise JSONFileErrorHandler(f"File error accessing {filepath}: {e}")
+
+    data = _decode(filepath, source, compact)
+    return _write_cache(cache_path(filepath), stat, source, data, compact)
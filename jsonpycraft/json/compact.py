@@ -0,0 +1,122 @@
+"""
+jsonpycraft/json/compact.py
+
+Compact decoding for record-heavy JSON documents.
+
+Every decoded object normally carries its own copies of repeated string values, and
+keys are only shared within a single parse. The `StringInterner` hook passed to the
+decoder interns keys process-wide and shares repeated short strings, both object values
+and the items of arrays nested in objects, so a list of a million records holds a single
+copy of each repeated key and value.
+
+Example Usage:
+    from jsonpycraft.json.compact import footprint
+    from jsonpycraft.json.io import read_json
+
+    plain = read_json("records.json")
+    compact = read_json("records.json", compact=True)
+    print(footprint(plain) - footprint(compact), "bytes saved")
+"""
+
+import sys
+from collections import deque
+from typing import Any, Dict, List, Tuple
+
+from jsonpycraft.json.record import Record
+
+# Strings longer than this are rarely repeated verbatim and are left as they are.
+MAX_INTERN_LENGTH = 64
+
+
+class StringInterner:
+    """
+    An `object_pairs_hook` for the json decoder which shares repeated strings.
+
+    Attributes:
+        max_length (int): Only string values up to this length are shared.
+        _values (Dict[str, str]): The table of shared string values for this decode.
+    """
+
+    def __init__(self, max_length: int = MAX_INTERN_LENGTH):
+        """
+        Initialize a StringInterner instance.
+
+        Args:
+            max_length (int): The longest string value to share. Defaults to MAX_INTERN_LENGTH.
+        """
+        self.max_length = max_length
+        self._values: Dict[str, str] = {}
+
+    def __call__(self, pairs: List[Tuple[str, Any]]) -> Dict[str, Any]:
+        """
+        Build a dictionary from decoded pairs, interning keys and short string values.
+
+        String items of list values, including lists nested inside them, are shared in place.
+
+        Args:
+            pairs (List[Tuple[str, Any]]): The key-value pairs produced by the decoder.
+
+        Returns:
+            Dict[str, Any]: The decoded object.
+        """
+        intern = sys.intern
+        values = self._values
+        max_length = self.max_length
+        result = {}
+        for key, value in pairs:
+            if value.__class__ is str and len(value) <= max_length:
+                value = values.setdefault(value, value)
+            elif value.__class__ is list:
+                self._share_items(value)
+            result[intern(key)] = value
+        return result
+
+    def _share_items(self, items: List[Any]) -> None:
+        """
+        Replace short string items of a decoded list, and of lists nested in it, with shared copies.
+
+        Args:
+            items (List[Any]): The decoded list to update in place.
+        """
+        values = self._values
+        max_length = self.max_length
+        stack = [items]
+        while stack:
+            current = stack.pop()
+            for index, item in enumerate(current):
+                if item.__class__ is str and len(item) <= max_length:
+                    current[index] = values.setdefault(item, item)
+                elif item.__class__ is list:
+                    stack.append(item)
+
+
+def footprint(data: Any) -> int:
+    """
+    Measure the memory held by a decoded JSON structure, including records and ring buffers.
+
+    Objects referenced more than once (such as shared keys and values) are only counted once,
+    so comparing the footprint of a plain and a compact load reports the memory saved.
+
+    Args:
+        data (Any): The JSON structure to measure.
+
+    Returns:
+        int: The total size in bytes of all distinct objects in the structure.
+    """
+    seen = set()
+    total = 0
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, deque)):
+            stack.extend(obj)
+        elif isinstance(obj, Record):
+            stack.extend(obj.to_dict().values())
+    return total
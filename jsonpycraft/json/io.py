@@ -3,8 +3,10 @@ jsonpycraft/json/io.py
 """
 
 import json
+import mmap
+import re
 from pathlib import Path
-from typing import Union
+from typing import Any, Sequence, Union
 
 from jsonpycraft.core.errors import (
     JSONDecodeErrorHandler,
@@ -12,14 +14,29 @@ from jsonpycraft.core.errors import (
     JSONFileErrorHandler,
 )
 from jsonpycraft.core.types import DecodeError, EncodeError, FileError, JSONData
+from jsonpycraft.json.compact import StringInterner
+from jsonpycraft.json.path import KeyPath
 
+# Bytes scanned by the first step of a container skip; each later step doubles, up to the maximum
+SKIP_CHUNK_SIZE = 256
+MAX_SKIP_CHUNK_SIZE = 1 << 20
 
-def read_json(filepath: Union[str, Path]) -> JSONData:
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+_STRING_TOKEN = re.compile(rb'"[^"\\]*+(?:\\.[^"\\]*+)*+"')
+_SCALAR_TOKEN = re.compile(rb'[^ \t\n\r,:\[\]{}"]++')
+_BRACKET = re.compile(rb"[\[\]{}]")
+# Keep only quotes and brackets, with braces folded into square brackets
+_FOLD_BRACES = bytes.maketrans(b"{}", b"[]")
+_NOT_STRUCTURE = bytes(byte for byte in range(256) if byte not in b'"[]{}')
+
+
+def read_json(filepath: Union[str, Path], compact: bool = False) -> JSONData:
     """
     Reads JSON data from a file.
 
     Args:
         filepath (Union[str, Path]): The path to the JSON file to read.
+        compact (bool): Intern keys and share repeated short strings while decoding (default is False).
 
     Returns:
         JSONData: The JSON data read from the file.
@@ -30,6 +47,8 @@ def read_json(filepath: Union[str, Path]) -> JSONData:
     """
     try:
         with open(filepath, "r") as file:
+            if compact:
+                return json.load(file, object_pairs_hook=StringInterner())
             return json.load(file)
     except FileError as e:
         raise JSONFileErrorHandler(f"File error accessing {filepath}: {e}")
@@ -110,3 +129,202 @@ def force_read_json(
         # write the default content and return it.
         write_json(filepath, content, indent=indent)
         return content
+
+
+class _PathNotFound(Exception):
+    """Raised internally when a key path is missing from the document."""
+
+
+def _skip_whitespace(data: Any, pos: int) -> int:
+    return _WHITESPACE.match(data, pos).end()
+
+
+def _skip_value(data: Any, pos: int) -> int:
+    """
+    Return the offset just past the value starting at pos, without decoding it.
+
+    Raises:
+        ValueError: If no value starts at pos.
+    """
+    byte = data[pos : pos + 1]
+    if byte in (b"{", b"["):
+        return _skip_container(data, pos)
+    match = (_STRING_TOKEN if byte == b'"' else _SCALAR_TOKEN).match(data, pos)
+    if match is None:
+        raise ValueError(f"Expected a value at offset {pos}")
+    return match.end()
+
+
+def _skip_container(data: Any, pos: int) -> int:
+    """
+    Return the offset just past the container starting at pos.
+
+    The container is scanned in growing chunks using only bulk bytes operations: everything
+    but quotes and brackets is dropped, brackets inside strings are split out on the quotes,
+    and matched pairs are removed until only the unmatched closing and opening brackets are
+    left. A chunk is walked bracket
+    by bracket only when it holds the closing bracket, so large subtrees are skipped without
+    a Python-level loop over their tokens. The chunk holding the closing bracket is halved
+    until it is small before it is walked.
+
+    Raises:
+        ValueError: If the container is not terminated.
+    """
+    depth = 1
+    in_string = False
+    start = pos + 1
+    size = SKIP_CHUNK_SIZE
+    length = len(data)
+    while start < length:
+        end = min(start + size, length)
+        while end < length and data[end - 1 : end] == b"\\":
+            end += 1  # Never split an escape sequence
+        chunk = data[start:end]
+        if b"\\" in chunk:
+            # Hide escaped quotes, keeping offsets intact
+            chunk = chunk.replace(b"\\\\", b"__").replace(b'\\"', b"__")
+        # Dropping adjacent quotes keeps every bracket on the same side of a string boundary
+        structure = chunk.translate(_FOLD_BRACES, _NOT_STRUCTURE).replace(b'""', b"")
+        parts = structure.split(b'"')
+        brackets = b"".join(parts[1::2] if in_string else parts[0::2])
+
+        unmatched = brackets
+        while True:
+            reduced = unmatched.replace(b"[]", b"")
+            if len(reduced) == len(unmatched):
+                break
+            unmatched = reduced
+        closing = len(unmatched) - len(unmatched.lstrip(b"]"))
+
+        if closing >= depth:
+            if size > SKIP_CHUNK_SIZE:
+                # Narrow down to a small chunk before walking it
+                size = max(size // 2, SKIP_CHUNK_SIZE)
+                continue
+            offset = start
+            for index, part in enumerate(chunk.split(b'"')):
+                if (index % 2 == 1) == in_string:
+                    for match in _BRACKET.finditer(part):
+                        if match.group() in (b"[", b"{"):
+                            depth += 1
+                        else:
+                            depth -= 1
+                            if not depth:
+                                return offset + match.end()
+                offset += len(part) + 1
+
+        opening = brackets.count(b"[")
+        depth += 2 * opening - len(brackets)
+        in_string ^= (len(parts) - 1) % 2 == 1
+        start = end
+        size = min(size * 2, MAX_SKIP_CHUNK_SIZE)
+    raise ValueError(f"Unterminated container at offset {pos}")
+
+
+def _find_member(data: Any, pos: int, key: Union[str, int]) -> int:
+    """Return the offset of the value of key in the object starting at pos."""
+    key = str(key)
+    pos = _skip_whitespace(data, pos + 1)
+    if data[pos : pos + 1] == b"}":
+        raise _PathNotFound
+    while True:
+        match = _STRING_TOKEN.match(data, pos)
+        if match is None:
+            raise ValueError(f"Expected an object key at offset {pos}")
+        raw = match.group()
+        name = json.loads(raw) if b"\\" in raw else raw[1:-1].decode("utf-8")
+        pos = _skip_whitespace(data, match.end())
+        if data[pos : pos + 1] != b":":
+            raise ValueError(f"Expected ':' at offset {pos}")
+        pos = _skip_whitespace(data, pos + 1)
+        if name == key:
+            return pos
+        pos = _skip_whitespace(data, _skip_value(data, pos))
+        separator = data[pos : pos + 1]
+        if separator == b"}":
+            raise _PathNotFound
+        if separator != b",":
+            raise ValueError(f"Expected ',' or '}}' at offset {pos}")
+        pos = _skip_whitespace(data, pos + 1)
+
+
+def _find_item(data: Any, pos: int, key: Union[str, int]) -> int:
+    """Return the offset of the item at index key in the array starting at pos."""
+    if isinstance(key, str):
+        if not key.isdigit():
+            raise _PathNotFound
+        key = int(key)
+    if key < 0:
+        raise _PathNotFound
+    pos = _skip_whitespace(data, pos + 1)
+    if data[pos : pos + 1] == b"]":
+        raise _PathNotFound
+    for _ in range(key):
+        pos = _skip_whitespace(data, _skip_value(data, pos))
+        separator = data[pos : pos + 1]
+        if separator == b"]":
+            raise _PathNotFound
+        if separator != b",":
+            raise ValueError(f"Expected ',' or ']' at offset {pos}")
+        pos = _skip_whitespace(data, pos + 1)
+    return pos
+
+
+def read_path(
+    filepath: Union[str, Path],
+    path: Union[str, Sequence[Union[str, int]], KeyPath],
+    default: Any = None,
+) -> Any:
+    """
+    Reads a single value from a JSON file without parsing the whole document.
+
+    The file is memory-mapped and scanned as raw bytes. Members and items before the target
+    are skipped at the token level without building objects, and only the target value is
+    decoded, so reading one value from a large file costs a fraction of a full load. Skipped
+    subtrees are only checked for terminated strings and balanced brackets. If an object has
+    duplicate keys, the first one is used.
+
+    Args:
+        filepath (Union[str, Path]): The path to the JSON file to read.
+        path (Union[str, Sequence[Union[str, int]], KeyPath]): A dotted key path, JSON Pointer, sequence of keys or KeyPath. Non-negative integer keys index arrays.
+        default (Any): The value returned if the path is missing (default is None).
+
+    Returns:
+        Any: The decoded value at the path, or default.
+
+    Raises:
+        JSONFileErrorHandler: If a file-related error occurs.
+        JSONDecodeErrorHandler: If the document is malformed along the path.
+
+    Example Usage:
+        version = read_path("package.json", "build.version")
+    """
+    keys = KeyPath.coerce(path).keys
+    try:
+        with open(filepath, "rb") as file:
+            try:
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # Empty files cannot be mapped
+                data = file.read()
+            try:
+                pos = _skip_whitespace(data, 0)
+                for key in keys:
+                    byte = data[pos : pos + 1]
+                    if byte == b"{":
+                        pos = _find_member(data, pos, key)
+                    elif byte == b"[":
+                        pos = _find_item(data, pos, key)
+                    elif byte:
+                        raise _PathNotFound
+                    else:
+                        raise ValueError(f"Expected a value at offset {pos}")
+                return json.loads(data[pos : _skip_value(data, pos)])
+            finally:
+                if isinstance(data, mmap.mmap):
+                    data.close()
+    except _PathNotFound:
+        return default
+    except FileError as e:
+        raise JSONFileErrorHandler(f"File error accessing {filepath}: {e}")
+    except (ValueError, UnicodeDecodeError) as e:
+        raise JSONDecodeErrorHandler(f"Error decoding JSON data at {filepath}: {e}")
@@ -0,0 +1,275 @@
+"""
+jsonpycraft/json/layered.py
+
+Layered JSON maps with an incrementally maintained merged view.
+
+Layers are ordered from lowest to highest precedence, such as packaged defaults, a site file, a
+per-host file and environment overrides. The merged view is the deep merge of every layer in
+order: dictionaries merge key by key, and any other value, lists included, is taken from the
+highest layer holding it. A higher layer holding a value which is not a dictionary hides the
+dictionaries of the lower layers at that path.
+
+The merged view is built once and kept up to date. After a layer changes at a path, `refresh`
+walks down the layers along the path and recomputes only the merged value at that path, so the
+cost of a change depends on the size of the changed subtree rather than on the whole tree, and
+reads from the merged view are plain dictionary lookups.
+
+Example Usage:
+    from jsonpycraft.json.layered import LayeredMap
+
+    defaults = {"db": {"host": "localhost", "port": 5432}}
+    site = {"db": {"host": "db.internal"}}
+    layers = LayeredMap([("defaults", defaults), ("site", site)])
+    layers.merged  # {"db": {"host": "db.internal", "port": 5432}}
+
+    site["db"]["port"] = 5433
+    layers.refresh(("db", "port"))
+    layers.merged  # {"db": {"host": "db.internal", "port": 5433}}
+"""
+
+import json
+import os
+from typing import Any, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from jsonpycraft.core.types import JSONMap
+from jsonpycraft.json.merge import copy_tree, deep_merge
+
+
+def _contributors(values: List[Any]) -> List[JSONMap]:
+    """Return the dictionaries above the highest value which is not a dictionary."""
+    start = len(values)
+    while start and isinstance(values[start - 1], dict):
+        start -= 1
+    return values[start:]
+
+
+def _merge(values: List[Any]) -> Any:
+    """Merge the values of the layers at one path, from lowest to highest precedence."""
+    top = values[-1]
+    if not isinstance(top, dict):
+        return copy_tree(top)
+    merged: JSONMap = {}
+    for value in _contributors(values):
+        deep_merge(merged, value)
+    return merged
+
+
+class LayeredMap:
+    """
+    An ordered stack of JSON maps and their merged view.
+
+    The merged view never shares dictionaries or lists with the layers. Changes made to a
+    layer are only reflected after calling `refresh` with the changed path.
+    """
+
+    __slots__ = ("_names", "_layers", "_merged")
+
+    def __init__(self, layers: Iterable[Tuple[str, JSONMap]] = ()):
+        """
+        Initialize the layers and build the merged view.
+
+        Args:
+            layers (Iterable[Tuple[str, JSONMap]]): The (name, data) pairs, from lowest to highest precedence.
+
+        Raises:
+            ValueError: If a name is repeated.
+            TypeError: If the data of a layer is not a dictionary.
+        """
+        self._names: List[str] = []
+        self._layers: List[JSONMap] = []
+        for name, data in layers:
+            self._check(name, data)
+            self._names.append(name)
+            self._layers.append(data)
+        self._merged: JSONMap = {}
+        self.refresh()
+
+    def _check(self, name: str, data: JSONMap) -> None:
+        if name in self._names:
+            raise ValueError(f"Layer {name!r} already exists")
+        if not isinstance(data, dict):
+            raise TypeError(f"Layer {name!r} is not a dictionary")
+
+    def _position(self, name: str) -> int:
+        try:
+            return self._names.index(name)
+        except ValueError:
+            raise KeyError(f"Layer {name!r} does not exist")
+
+    @property
+    def names(self) -> List[str]:
+        """
+        Get the layer names, from lowest to highest precedence.
+
+        Returns:
+            List[str]: A copy of the names.
+        """
+        return list(self._names)
+
+    @property
+    def merged(self) -> JSONMap:
+        """
+        Get the merged view of every layer.
+
+        Returns:
+            JSONMap: The merged view. It must not be modified.
+        """
+        return self._merged
+
+    def layer(self, name: str) -> JSONMap:
+        """
+        Get the data of a layer.
+
+        Args:
+            name (str): The layer name.
+
+        Returns:
+            JSONMap: The layer data.
+
+        Raises:
+            KeyError: If there is no layer with the name.
+        """
+        return self._layers[self._position(name)]
+
+    def insert(self, name: str, data: JSONMap, index: Optional[int] = None) -> None:
+        """
+        Add a layer and merge its keys into the view.
+
+        Args:
+            name (str): The layer name.
+            data (JSONMap): The layer data.
+            index (Optional[int]): The position in precedence order, as with `list.insert`. Defaults to the top.
+
+        Raises:
+            ValueError: If a layer with the name already exists.
+            TypeError: If data is not a dictionary.
+        """
+        self._check(name, data)
+        if index is None:
+            index = len(self._layers)
+        self._names.insert(index, name)
+        self._layers.insert(index, data)
+        for key in data:
+            self.refresh((key,))
+
+    def remove(self, name: str) -> JSONMap:
+        """
+        Remove a layer and recompute the keys it held.
+
+        Args:
+            name (str): The layer name.
+
+        Returns:
+            JSONMap: The data of the removed layer.
+
+        Raises:
+            KeyError: If there is no layer with the name.
+        """
+        position = self._position(name)
+        del self._names[position]
+        data = self._layers.pop(position)
+        for key in data:
+            self.refresh((key,))
+        return data
+
+    def replace(self, name: str, data: JSONMap) -> None:
+        """
+        Replace the data of a layer and recompute the keys of the old and new data.
+
+        Passing the current data of the layer rebuilds the whole view, since the keys it held
+        before being modified are unknown.
+
+        Args:
+            name (str): The layer name.
+            data (JSONMap): The new layer data.
+
+        Raises:
+            KeyError: If there is no layer with the name.
+            TypeError: If data is not a dictionary.
+        """
+        position = self._position(name)
+        if not isinstance(data, dict):
+            raise TypeError(f"Layer {name!r} is not a dictionary")
+        previous = self._layers[position]
+        self._layers[position] = data
+        if previous is data:
+            self.refresh()
+            return
+        for key in dict.fromkeys([*previous, *data]):
+            self.refresh((key,))
+
+    def refresh(self, keys: Sequence[Union[str, int]] = ()) -> None:
+        """
+        Recompute the merged value at a path after a layer changed at or below it.
+
+        When a change replaced a value above the changed path, such as an intermediate value
+        replaced by a dictionary, pass the path of the replaced value.
+
+        Args:
+            keys (Sequence[Union[str, int]]): The keys of the changed path. The empty path rebuilds the whole view.
+        """
+        if not keys:
+            self._merged = _merge([{}, *self._layers])
+            return
+
+        node = self._merged
+        values = self._layers
+        last = len(keys) - 1
+        for depth, key in enumerate(keys):
+            children = [value[key] for value in values if key in value]
+            if not children:
+                node.pop(key, None)
+                return
+            if (
+                depth == last
+                or not isinstance(children[-1], dict)
+                or not isinstance(node.get(key), dict)
+            ):
+                node[key] = _merge(children)
+                return
+            node = node[key]
+            values = _contributors(children)
+
+
+def environment_layer(
+    prefix: str,
+    separator: str = "__",
+    environ: Optional[Mapping[str, str]] = None,
+) -> JSONMap:
+    """
+    Build a layer from the environment variables starting with a prefix.
+
+    The rest of each name is lowercased and split on the separator into a key path, so with the
+    prefix "APP_", `APP_DB__PORT=5433` becomes {"db": {"port": 5433}}. Values are decoded as
+    JSON when possible and kept as strings otherwise.
+
+    Args:
+        prefix (str): The prefix of the variable names.
+        separator (str): The separator of nested keys. Defaults to "__".
+        environ (Optional[Mapping[str, str]]): The variables. Defaults to os.environ.
+
+    Returns:
+        JSONMap: The nested overrides.
+    """
+    if environ is None:
+        environ = os.environ
+
+    layer: JSONMap = {}
+    for name in sorted(environ):
+        if not name.startswith(prefix) or len(name) == len(prefix):
+            continue
+        raw = environ[name]
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            value = raw
+
+        keys = name[len(prefix) :].lower().split(separator)
+        node = layer
+        for key in keys[:-1]:
+            child = node.get(key)
+            if not isinstance(child, dict):
+                child = node[key] = {}
+            node = child
+        node[keys[-1]] = value
+    return layer
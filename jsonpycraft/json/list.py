@@ -1,26 +1,55 @@
 """
 jsonpycraft/json/list.py
 """
+
+import heapq
+from collections import deque
 from copy import deepcopy
-from typing import Optional
+from operator import itemgetter
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Type, Union
 
 from jsonpycraft.core.types import JSONList, JSONMap
 from jsonpycraft.json.base import JSONBaseTemplate
+from jsonpycraft.json.parallel import (
+    SERIAL_THRESHOLD,
+    parallel_filter,
+    parallel_map,
+    parallel_reduce,
+)
+from jsonpycraft.json.path import KeyPath
+from jsonpycraft.json.record import Record
+from jsonpycraft.json.schema import Schema
+
+# Sentinel for a key path missing from a record
+_MISSING = object()
 
 
 class JSONListTemplate(JSONBaseTemplate):
     """
     A template class for managing a list of dictionaries in JSON files.
 
+    When `max_length` is given, the template acts as a capped collection backed by a ring
+    buffer: pushing and popping at either end is O(1), and once the buffer is full the
+    oldest entries are evicted automatically. Only the live window is persisted.
+
+    When `record_type` is given, dictionaries are converted into slotted records on load and
+    back into dictionaries on save, so fixed-shape records take less memory and fields are
+    read as attributes.
+
     Attributes:
         _file_path (Path): A path-like object pointing to the JSON source file.
         _data (Optional[JSONData]): The internal JSON data structure. May be None if not loaded.
+        _max_length (Optional[int]): The capacity of the ring buffer, or None if uncapped.
+        _record_type (Optional[Type[Record]]): The record class of the entries, or None for dictionaries.
     """
 
     def __init__(
         self,
         file_path: str,
         initial_data: Optional[JSONList] = None,
+        max_length: Optional[int] = None,
+        schema: Optional[Union[Schema, JSONMap]] = None,
+        record_type: Optional[Type[Record]] = None,
     ):
         """
         Initializes the JSONListTemplate.
@@ -28,12 +57,70 @@ class JSONListTemplate(JSONBaseTemplate):
         Args:
             file_path (str): The path to the JSON file that stores the list.
             initial_data (Optional[JSONList]): Optional initial data to populate the list.
+            max_length (Optional[int]): Cap the list at this many entries, evicting the oldest. Defaults to None.
+            schema (Optional[Union[Schema, JSONMap]]): A schema for the whole list, validated on load and save. Its `items` schema is validated on append, appendleft, insert and update. Defaults to None.
+            record_type (Optional[Type[Record]]): Hold the entries as records of this class instead of dictionaries. Defaults to None.
+
+        Raises:
+            ValueError: If max_length is not a positive integer, the schema is invalid, or an entry does not fit the record type.
         """
-        super(JSONListTemplate, self).__init__(file_path, deepcopy(initial_data))
+        if max_length is not None and max_length < 1:
+            raise ValueError("max_length must be a positive integer")
+
+        self._max_length = max_length
+        self._record_type = record_type
+
+        super(JSONListTemplate, self).__init__(
+            file_path, deepcopy(initial_data), schema
+        )
 
         if initial_data is None:
             self._data = []
 
+        self._data = self._from_json(self._data)
+
+    def _from_json(self, data: JSONList) -> Any:
+        """Convert the loaded dictionaries into records, in a ring buffer when the template is capped."""
+        if self._record_type is not None:
+            from_dict = self._record_type.from_dict
+            data = [from_dict(item) for item in data]
+        if self._max_length is None:
+            return data
+        return deque(data, maxlen=self._max_length)
+
+    def _to_json(self, data: Any) -> JSONList:
+        """Return the live window as a plain list of dictionaries."""
+        if self._record_type is not None:
+            return [item.to_dict() for item in data]
+        if self._max_length is None:
+            return data
+        return list(data)
+
+    def _validate_item(self, item: Union[JSONMap, Record]) -> Any:
+        """
+        Validate an item against the items schema, stopping at the first error.
+
+        Returns:
+            Any: The item to store, converted into a record when the template holds records.
+        """
+        if self._schema is not None and self._schema.items is not None:
+            self._schema.items.validate(
+                item.to_dict() if isinstance(item, Record) else item
+            )
+        if self._record_type is not None and not isinstance(item, self._record_type):
+            return self._record_type.from_dict(item)
+        return item
+
+    @property
+    def record_type(self) -> Optional[Type[Record]]:
+        """Return the record class of the entries, or None if they are dictionaries."""
+        return self._record_type
+
+    @property
+    def max_length(self) -> Optional[int]:
+        """Return the capacity of the capped list, or None if it is uncapped."""
+        return self._max_length
+
     @property
     def length(self) -> int:
         """Return the length of the internal data list."""
@@ -42,33 +129,70 @@ class JSONListTemplate(JSONBaseTemplate):
     @property
     def data(self) -> Optional[JSONList]:
         """Return a copy of the internal data list or None if empty."""
-        return deepcopy(self._data) if self._data else None
+        return deepcopy(self._to_json(self._data)) if self._data else None
 
     def append(self, item: JSONMap) -> None:
         """
         Append a dictionary to the internal data list.
 
+        If the list is capped and full, the oldest dictionary is evicted.
+
         Parameters:
             item (JSONMap): The dictionary to append to the internal list.
 
         Returns:
             None
+
+        Raises:
+            JSONSchemaErrorHandler: If the item does not match the items schema.
         """
+        item = self._validate_item(item)
         self._data.append(item)
 
+    def appendleft(self, item: JSONMap) -> None:
+        """
+        Prepend a dictionary to the internal data list.
+
+        This is O(1) for a capped list. If the capped list is full, the dictionary at the
+        opposite (newest) end is evicted.
+
+        Parameters:
+            item (JSONMap): The dictionary to prepend to the internal list.
+
+        Returns:
+            None
+
+        Raises:
+            JSONSchemaErrorHandler: If the item does not match the items schema.
+        """
+        item = self._validate_item(item)
+        if self._max_length is None:
+            self._data.insert(0, item)
+        else:
+            self._data.appendleft(item)
+
     def insert(self, index: int, item: JSONMap) -> bool:
         """
         Insert a dictionary at a specific index.
 
+        If the list is capped and full, the oldest dictionary is evicted to make room.
+
         Parameters:
             index (int): The index at which to insert the dictionary.
             item (JSONMap): The dictionary to insert.
 
         Returns:
             bool: True if successful, False otherwise.
+
+        Raises:
+            JSONSchemaErrorHandler: If the item does not match the items schema.
         """
         if index < 0 or index > len(self._data):
             return False
+        item = self._validate_item(item)
+        if self._max_length is not None and len(self._data) == self._max_length:
+            self._data.popleft()
+            index = max(index - 1, 0)
         self._data.insert(index, item)
         return True
 
@@ -94,9 +218,13 @@ class JSONListTemplate(JSONBaseTemplate):
 
         Returns:
             bool: True if successful, False otherwise.
+
+        Raises:
+            JSONSchemaErrorHandler: If the item does not match the items schema.
         """
         if index < 0 or index >= len(self._data):
             return False
+        item = self._validate_item(item)
         self._data[index] = item
         return True
 
@@ -127,8 +255,187 @@ class JSONListTemplate(JSONBaseTemplate):
         """
         if index < 0 or index >= len(self._data):
             return None
-        return self._data.pop(index)
+        if index == len(self._data) - 1:
+            return self._data.pop()
+        if index == 0:
+            return self.popleft()
+        item = self._data[index]
+        del self._data[index]
+        return item
+
+    def popleft(self) -> Optional[JSONMap]:
+        """
+        Remove and return the first dictionary in the list.
+
+        This is O(1) for a capped list.
+
+        Returns:
+            JSONMap: A dictionary if successful, None if the list is empty.
+        """
+        if not self._data:
+            return None
+        if self._max_length is None:
+            return self._data.pop(0)
+        return self._data.popleft()
 
     def clear(self) -> None:
         """Clear the internal data list."""
         self._data.clear()
+
+    def parallel_map(
+        self,
+        func: Callable[[JSONMap], Any],
+        chunk_size: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        serial_threshold: int = SERIAL_THRESHOLD,
+    ) -> List[Any]:
+        """
+        Apply a function to every dictionary across a process pool.
+
+        Parameters:
+            func (Callable[[JSONMap], Any]): A module-level function applied to each dictionary.
+            chunk_size (Optional[int]): The number of dictionaries sent to a worker at once.
+            max_workers (Optional[int]): The number of worker processes. Defaults to the CPU count.
+            serial_threshold (int): Run serially when the list is shorter than this.
+
+        Returns:
+            List[Any]: The results in the same order as the list.
+        """
+        return parallel_map(
+            func,
+            self._to_json(self._data),
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            serial_threshold=serial_threshold,
+        )
+
+    def parallel_filter(
+        self,
+        predicate: Callable[[JSONMap], bool],
+        chunk_size: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        serial_threshold: int = SERIAL_THRESHOLD,
+    ) -> JSONList:
+        """
+        Select the dictionaries matching a predicate across a process pool.
+
+        Parameters:
+            predicate (Callable[[JSONMap], bool]): A module-level function deciding whether to keep a dictionary.
+            chunk_size (Optional[int]): The number of dictionaries sent to a worker at once.
+            max_workers (Optional[int]): The number of worker processes. Defaults to the CPU count.
+            serial_threshold (int): Run serially when the list is shorter than this.
+
+        Returns:
+            JSONList: The matching dictionaries, or records with a record type, in their original order. They are the stored entries, not copies.
+        """
+        entries = self._to_json(self._data)
+        matches = parallel_filter(
+            predicate,
+            entries,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            serial_threshold=serial_threshold,
+        )
+        if self._record_type is None:
+            return matches
+        # The predicate ran on converted dictionaries, so map the matches back to the records
+        positions = {id(entry): index for index, entry in enumerate(entries)}
+        return [self._data[positions[id(entry)]] for entry in matches]
+
+    def parallel_reduce(
+        self,
+        func: Callable[[Any, JSONMap], Any],
+        initial: Any,
+        combine: Optional[Callable[[Any, Any], Any]] = None,
+        chunk_size: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        serial_threshold: int = SERIAL_THRESHOLD,
+    ) -> Any:
+        """
+        Fold the dictionaries into a single result across a process pool.
+
+        Parameters:
+            func (Callable[[Any, JSONMap], Any]): A module-level function folding a dictionary into an accumulator.
+            initial (Any): The starting accumulator, which must be an identity for combine.
+            combine (Optional[Callable[[Any, Any], Any]]): A module-level function merging two partial results. Required unless the list is shorter than serial_threshold.
+            chunk_size (Optional[int]): The number of dictionaries sent to a worker at once.
+            max_workers (Optional[int]): The number of worker processes. Defaults to the CPU count.
+            serial_threshold (int): Run serially when the list is shorter than this.
+
+        Returns:
+            Any: The folded result.
+
+        Raises:
+            ValueError: If combine is missing and the list is not shorter than serial_threshold.
+        """
+        return parallel_reduce(
+            func,
+            self._to_json(self._data),
+            initial,
+            combine=combine,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            serial_threshold=serial_threshold,
+        )
+
+    def top_k(
+        self, path: Union[str, Sequence[str], KeyPath], k: int, largest: bool = True
+    ) -> JSONList:
+        """
+        Return the k dictionaries with the largest (or smallest) value at a key path.
+
+        A bounded heap of size k is used, so this runs in O(n log k) without sorting or
+        copying the list. Dictionaries missing the path are skipped.
+
+        Parameters:
+            path (Union[str, Sequence[str], KeyPath]): A dotted key path, JSON Pointer, sequence of keys or KeyPath.
+            k (int): The number of dictionaries to return.
+            largest (bool): Return the largest values if True, the smallest otherwise. Defaults to True.
+
+        Returns:
+            JSONList: Up to k dictionaries, or records with a record type, ordered from best to worst. They are the stored entries, not copies.
+        """
+        get = KeyPath.coerce(path).get
+        decorated = (
+            (value, record)
+            for record in self._data
+            if (value := get(record, _MISSING)) is not _MISSING
+        )
+        select = heapq.nlargest if largest else heapq.nsmallest
+        return [record for _, record in select(k, decorated, key=itemgetter(0))]
+
+    def sort_by(
+        self, *paths: Union[str, Sequence[str], KeyPath], reverse: bool = False
+    ) -> None:
+        """
+        Sort the dictionaries in place by the values at one or more key paths.
+
+        The sort is stable and the key tuple of each dictionary is computed once. Dictionaries
+        missing a path sort before those that have it (after, when reverse is True).
+
+        Parameters:
+            paths (Union[str, Sequence[str], KeyPath]): Key paths, most significant first.
+            reverse (bool): Sort in descending order. Defaults to False.
+
+        Raises:
+            ValueError: If no key path is given.
+            TypeError: If the values at a path cannot be compared with each other.
+        """
+        if not paths:
+            raise ValueError("At least one key path is required")
+
+        getters = [KeyPath.coerce(path).get for path in paths]
+
+        def key(record: JSONMap) -> Tuple[Tuple[bool, Any], ...]:
+            values = []
+            for get in getters:
+                value = get(record, _MISSING)
+                values.append((False, None) if value is _MISSING else (True, value))
+            return tuple(values)
+
+        if self._max_length is None:
+            self._data.sort(key=key, reverse=reverse)
+        else:
+            ordered = sorted(self._data, key=key, reverse=reverse)
+            self._data.clear()
+            self._data.extend(ordered)
@@ -2,26 +2,154 @@
 jsonpycraft/json/map.py
 """
 
+from contextlib import contextmanager
 from logging import Logger
-from typing import Any, Optional
-
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from jsonpycraft.core.errors import JSONPatchErrorHandler
 from jsonpycraft.core.types import JSONMap
+from jsonpycraft.core.undo import UndoLog
 from jsonpycraft.json.base import JSONBaseTemplate
+from jsonpycraft.json.merge import deep_merge
+from jsonpycraft.json.patch import apply_patch, diff
+from jsonpycraft.json.path import KeyPath
+from jsonpycraft.json.query import PathPattern
+from jsonpycraft.json.schema import Schema
+from jsonpycraft.json.subscription import Callback, Subscriptions
+
+# Sentinel for a path missing from the index
+_MISSING = object()
+
+
+def _path_keys(keys: Tuple[Union[str, KeyPath], ...]) -> Tuple[Union[str, int], ...]:
+    """
+    Return the keys hierarchy passed to a nested method as a tuple.
+
+    Args:
+        keys (Tuple[Union[str, KeyPath], ...]): Either the keys hierarchy or a single KeyPath.
+
+    Returns:
+        Tuple[Union[str, int], ...]: The keys hierarchy.
+
+    Raises:
+        ValueError: If no keys are given.
+    """
+    if len(keys) == 1 and isinstance(keys[0], KeyPath):
+        keys = keys[0].keys
+    if not keys:
+        raise ValueError("At least one key is required")
+    return keys
+
+
+def _split_keys(
+    keys: Tuple[Union[str, KeyPath], ...],
+) -> Tuple[Tuple[Union[str, int], ...], Union[str, int]]:
+    """
+    Split the keys hierarchy passed to a nested method into its parent keys and last key.
+
+    A KeyPath is validated and split once when it is compiled, so only raw keys are checked here.
+
+    Args:
+        keys (Tuple[Union[str, KeyPath], ...]): Either the keys hierarchy or a single KeyPath.
+
+    Returns:
+        Tuple[Tuple[Union[str, int], ...], Union[str, int]]: The parent keys and the last key.
+
+    Raises:
+        ValueError: If no keys are given.
+        TypeError: If a key is not a valid type.
+    """
+    if len(keys) == 1 and isinstance(keys[0], KeyPath):
+        path = keys[0]
+        if not path.keys:
+            raise ValueError("At least one key is required")
+        return path.parent, path.last
+
+    if not keys:
+        raise ValueError("At least one key is required")
+    for key in keys:
+        if not isinstance(key, (str, int)):
+            raise TypeError(f"Key {key} is not a valid type")
+    return keys[:-1], keys[-1]
+
+
+def _prefix_trie(
+    items: Iterable[Tuple[Union[str, Sequence[Union[str, int]], KeyPath], Any]],
+) -> Dict[Any, List]:
+    """
+    Group key paths into a prefix trie so shared prefixes are visited once.
+
+    Each trie node is a [value, children] pair, where value is _MISSING for nodes which are
+    only intermediate keys of longer paths.
+
+    Args:
+        items (Iterable[Tuple[Union[str, Sequence, KeyPath], Any]]): The (path, value) pairs.
+
+    Returns:
+        Dict[Any, List]: The children of the trie root.
+
+    Raises:
+        ValueError: If a path has no keys.
+        TypeError: If a key is not a valid type.
+    """
+    root: Dict[Any, List] = {}
+    for path, value in items:
+        keys = KeyPath.coerce(path).keys
+        if not keys:
+            raise ValueError("At least one key is required")
+        children = root
+        for key in keys[:-1]:
+            node = children.get(key)
+            if node is None:
+                node = children[key] = [_MISSING, {}]
+            children = node[1]
+        node = children.get(keys[-1])
+        if node is None:
+            children[keys[-1]] = [value, {}]
+        else:
+            node[0] = value
+    return root
 
 
 class JSONMapTemplate(JSONBaseTemplate):
     """
     A template class for creating and managing a mapping of key-value pairs.
 
+    When `indexed` is enabled, `read_nested` results are kept in a flattened index from the
+    full key path to the value, built lazily as paths are read. Every mutation through the
+    template invalidates the touched subtree and its ancestors, so repeated deep reads cost a
+    single dictionary lookup and never return stale values.
+
     Attributes:
         _file_path (Path): A path-like object pointing to the JSON source file.
         _data (Optional[JSONData]): The internal JSON data structure. May be None if not loaded.
+        _index (Optional[Dict[Tuple, Any]]): The flattened path index, or None if disabled.
+        _index_children (Dict[Tuple, Set[Tuple]]): The indexed paths registered under each prefix.
+        _undo (Optional[UndoLog]): The undo log of the active transaction, or None outside transactions.
+        _subscriptions (Subscriptions): The callbacks notified as changes are made.
+        _save_subscriptions (Subscriptions): The callbacks notified of the unsaved changes on save.
+        _pending (Optional[List[Tuple]]): The changed paths of the active batch, or None outside batches.
+        _unsaved (Dict[Tuple, None]): The changed paths not yet delivered to save subscribers.
     """
 
     def __init__(
         self,
         file_path: str,
         initial_data: Optional[JSONMap] = None,
+        indexed: bool = False,
+        schema: Optional[Union[Schema, JSONMap]] = None,
     ):
         """
         Initializes the JSONMapTemplate.
@@ -29,12 +157,22 @@ class JSONMapTemplate(JSONBaseTemplate):
         Args:
             file_path (str): The path to the JSON file.
             initial_data (Optional[JSONMap]): Optional initial data to populate the mapping.
+            indexed (bool): Keep a flattened index of nested reads. Defaults to False.
+            schema (Optional[Union[Schema, JSONMap]]): A schema validated on load and save. Defaults to None.
         """
-        super(JSONMapTemplate, self).__init__(file_path, initial_data)
+        super(JSONMapTemplate, self).__init__(file_path, initial_data, schema)
 
         if initial_data is None:
             self._data = {}
 
+        self._index: Optional[Dict[Tuple, Any]] = {} if indexed else None
+        self._index_children: Dict[Tuple, Set[Tuple]] = {}
+        self._undo: Optional[UndoLog] = None
+        self._subscriptions = Subscriptions()
+        self._save_subscriptions = Subscriptions()
+        self._pending: Optional[List[Tuple]] = None
+        self._unsaved: Dict[Tuple, None] = {}
+
     @property
     def keys(self) -> list[str]:
         """
@@ -55,6 +193,241 @@ class JSONMapTemplate(JSONBaseTemplate):
         """
         return self._data
 
+    @property
+    def indexed(self) -> bool:
+        """
+        Check whether nested reads are served from the flattened path index.
+
+        Returns:
+            bool: True if the index is enabled.
+        """
+        return self._index is not None
+
+    def invalidate_index(self, *keys: Union[str, KeyPath]) -> None:
+        """
+        Drop indexed values for a subtree, or the whole index if no keys are given.
+
+        Mutations made through the template invalidate the index automatically. Call this after
+        mutating the structure returned by `data` directly.
+
+        Args:
+            keys (Union[str, KeyPath]): The keys hierarchy of the subtree, or a single KeyPath.
+        """
+        if self._index is None:
+            return
+        if keys:
+            self._invalidate(_path_keys(keys))
+        else:
+            self._index.clear()
+            self._index_children.clear()
+
+    def _invalidate(self, keys: Tuple) -> None:
+        """Drop indexed values for the subtree at keys and for all of its ancestors."""
+        index = self._index
+        index.pop(keys, None)
+        for path in self._index_children.pop(keys, ()):
+            index.pop(path, None)
+        for depth in range(1, len(keys)):
+            index.pop(keys[:depth], None)
+
+    def _touch(self, parent: Tuple, last_key: Any, depth: Optional[int] = None) -> None:
+        """
+        Invalidate the index and notify subscribers after a mutation.
+
+        Args:
+            parent (Tuple): The parent keys of the mutated path.
+            last_key (Any): The last key of the mutated path.
+            depth (Optional[int]): The depth of the topmost node that was replaced, if above the full path.
+        """
+        subscribed = self._subscriptions or self._save_subscriptions
+        if self._index is None and not subscribed:
+            return
+        keys = parent + (last_key,)
+        if depth is not None:
+            keys = keys[: depth + 1]
+        if self._index is not None:
+            self._invalidate(keys)
+        if subscribed:
+            self._notify(keys)
+
+    def _notify(self, keys: Tuple) -> None:
+        """Queue a changed path in the active batch, or publish it right away."""
+        if self._pending is not None:
+            self._pending.append(keys)
+        else:
+            self._publish((keys,))
+
+    def _publish(self, changes: Iterable[Tuple]) -> None:
+        """Deliver changed paths to the subscribers, and keep them for the save subscribers."""
+        changes = dict.fromkeys(changes)
+        if self._save_subscriptions:
+            self._unsaved.update(changes)
+        self._subscriptions.dispatch(changes)
+
+    def _replaced(self) -> None:
+        """Reset the index and notify every subscriber after the whole mapping was replaced."""
+        self.invalidate_index()
+        if self._subscriptions or self._save_subscriptions:
+            self._notify(())
+
+    @contextmanager
+    def _batch(self) -> Iterator[None]:
+        """
+        Publish the changes made within the block once, when the outermost batch completes.
+
+        Changes made within a block which raises were rolled back, so they are discarded.
+        """
+        outermost = self._pending is None
+        if outermost:
+            self._pending = []
+        start = len(self._pending)
+        try:
+            yield
+        except BaseException:
+            del self._pending[start:]
+            raise
+        finally:
+            if outermost:
+                pending, self._pending = self._pending, None
+        if outermost and pending:
+            self._publish(pending)
+
+    def subscribe(
+        self,
+        path_prefix: Union[str, Sequence[Union[str, int]], KeyPath],
+        callback: Callback,
+        on_save: bool = False,
+    ) -> None:
+        """
+        Call a callback when values at, above or below a path change.
+
+        The callback receives the list of changed paths as KeyPaths. Changes made within a
+        transaction, or by a single batch operation such as `update_many` or `merge`, are
+        delivered in one call once it completes, and changes which are rolled back are never
+        delivered. With `on_save`, the changes are instead accumulated and delivered when the
+        mapping is saved. Replacing the whole mapping, such as on load, is reported as the root
+        path. Changes made directly to the structure returned by `data` are not observed.
+
+        Args:
+            path_prefix (Union[str, Sequence[Union[str, int]], KeyPath]): A dotted key path, JSON Pointer, sequence of keys or KeyPath. `*` segments match any key, as in "services.*.port", and the empty string matches every change.
+            callback (Callback): Called with the list of changed paths.
+            on_save (bool): Deliver the changes when the mapping is saved. Defaults to False.
+
+        Example Usage:
+            template.subscribe("db", lambda paths: rebuild_pool(template.read("db")))
+        """
+        if on_save:
+            self._save_subscriptions.add(path_prefix, callback)
+        else:
+            self._subscriptions.add(path_prefix, callback)
+
+    def unsubscribe(
+        self,
+        path_prefix: Union[str, Sequence[Union[str, int]], KeyPath],
+        callback: Callback,
+    ) -> bool:
+        """
+        Stop calling a callback subscribed to a path.
+
+        Args:
+            path_prefix (Union[str, Sequence[Union[str, int]], KeyPath]): The path the callback was subscribed to.
+            callback (Callback): The callback to remove.
+
+        Returns:
+            bool: True if the callback was subscribed to the path, False otherwise.
+        """
+        removed = self._subscriptions.remove(path_prefix, callback)
+        removed = self._save_subscriptions.remove(path_prefix, callback) or removed
+        if not self._save_subscriptions:
+            self._unsaved.clear()
+        return removed
+
+    def _record(self, data: dict, key: Any) -> None:
+        """Record the previous state of an entry in the active transaction, if any."""
+        if self._undo is not None:
+            self._undo.record(data, key)
+
+    def _record_delete(self, data: dict, key: Any) -> None:
+        """Record an entry about to be deleted in the active transaction, if any."""
+        if self._undo is not None:
+            self._undo.record_delete(data, key)
+
+    @contextmanager
+    def transaction(self) -> Iterator["JSONMapTemplate"]:
+        """
+        Make every mutation within the block all-or-nothing.
+
+        Only the previous state of each touched entry is recorded, so the cost scales with the
+        number of changes rather than the size of the mapping. If the block raises, its changes
+        are rolled back and the exception is re-raised. Transactions nest as savepoints: a
+        failing inner block rolls back only its own changes. Subscribers are notified once,
+        when the outermost transaction commits.
+
+        Yields:
+            JSONMapTemplate: The template itself.
+
+        Example Usage:
+            with template.transaction():
+                template.update_nested("db.internal", "db", "host")
+                template.update_nested(5433, "db", "port")
+        """
+        outermost = self._undo is None
+        if outermost:
+            self._undo = UndoLog()
+        log = self._undo
+        mark = log.mark()
+        root = self._data  # Restored if the data is replaced within the block
+        with self._batch():
+            try:
+                yield self
+            except BaseException:
+                log.rollback(mark)
+                self._data = root
+                self.invalidate_index()
+                raise
+            finally:
+                if outermost:
+                    self._undo = None
+
+    def load_json(self, compact: bool = False, cache: bool = False) -> None:
+        """
+        Load JSON data from the file, reset the path index and notify subscribers.
+
+        Unsaved changes are discarded, so they are never delivered to save subscribers.
+
+        Args:
+            compact (bool): Intern keys and share repeated short strings while decoding. Defaults to False.
+            cache (bool): Load from the binary cache file of the file, rebuilding it if stale. Defaults to False.
+
+        Raises:
+            JSONFileErrorHandler: If there is a file-related error accessing the JSON file.
+            JSONDecodeErrorHandler: If there is an error loading JSON data from the file.
+        """
+        super(JSONMapTemplate, self).load_json(compact=compact, cache=cache)
+        self._replaced()
+        self._unsaved.clear()
+
+    def save_json(self, data: Optional[JSONMap] = None, indent: int = 2) -> None:
+        """
+        Save JSON data to the file, resetting the path index if the data is replaced.
+
+        Save subscribers are notified of the changes made since the previous save.
+
+        Args:
+            data (Optional[JSONMap]): The data to be saved. Defaults to None.
+            indent (int): The indentation level for the JSON output. Defaults to 2.
+
+        Raises:
+            JSONFileErrorHandler: If there is a file-related error accessing the JSON file.
+            JSONEncodeErrorHandler: If there is an error saving JSON data to the file.
+        """
+        super(JSONMapTemplate, self).save_json(data, indent=indent)
+        if data is not None:
+            self._replaced()
+        if self._unsaved:
+            unsaved, self._unsaved = self._unsaved, {}
+            self._save_subscriptions.dispatch(unsaved)
+
     def create(self, key: str, value: Any) -> bool:
         """
         Create a new key-value pair in the mapping.
@@ -67,39 +440,46 @@ class JSONMapTemplate(JSONBaseTemplate):
             bool: True if the key-value pair was created successfully, False if the key already exists.
         """
         if key not in self._data:
+            self._record(self._data, key)
             self._data[key] = value
+            self._touch((), key)
             return True
 
         return False
 
-    def create_nested(self, value: Any, *keys: str) -> bool:
+    def create_nested(self, value: Any, *keys: Union[str, KeyPath]) -> bool:
         """
-        Create a nested key-value pair in the mapping.
+        Create a nested key-value pair in the mapping, creating missing intermediate dictionaries.
 
         Args:
             value (Any): The value of the pair.
-            keys (str): The keys hierarchy for the nested pair.
+            keys (Union[str, KeyPath]): The keys hierarchy for the nested pair, or a single KeyPath.
 
         Returns:
-            bool: True if the nested key-value pair was created successfully, False if any key in the hierarchy is missing or if the final key already exists.
+            bool: True if the nested key-value pair was created successfully, False if a key in the hierarchy holds a value which is not a dictionary or if the final key already exists.
         """
-        if not keys:
-            raise ValueError("At least one key is required")
+        parent, last_key = _split_keys(keys)
 
         data = self._data
-        last_key = keys[-1]
-        keys = keys[:-1]
-
-        for key in keys:
-            if isinstance(data, dict):
-                data = data.setdefault(key, {})
-            else:
-                return False
-
-        if last_key not in data:
-            data[last_key] = value
-            return True
-
+        created = None
+        for depth, key in enumerate(parent):
+            if not isinstance(data, dict):
+                break
+            if key not in data:
+                self._record(data, key)
+                data[key] = {}
+                if created is None:
+                    created = depth
+            data = data[key]
+        else:
+            if isinstance(data, dict) and last_key not in data:
+                self._record(data, last_key)
+                data[last_key] = value
+                self._touch(parent, last_key, created)
+                return True
+
+        if created is not None:
+            self._touch(parent, last_key, created)
         return False
 
     def read(self, key: str) -> Any:
@@ -114,27 +494,60 @@ class JSONMapTemplate(JSONBaseTemplate):
         """
         return self._data.get(key, None)
 
-    def read_nested(self, *keys: str) -> Any:
+    def read_nested(self, *keys: Union[str, KeyPath]) -> Any:
         """
         Read the value associated with a nested key hierarchy in the mapping.
 
         Args:
-            keys (str): The keys hierarchy for the nested value.
+            keys (Union[str, KeyPath]): The keys hierarchy for the nested value, or a single KeyPath.
 
         Returns:
             Any: The value associated with the nested keys hierarchy, or None if any key in the hierarchy is missing.
         """
-        if not keys:
-            raise ValueError("At least one key is required")
+        keys = _path_keys(keys)
+        index = self._index
+        if index is not None:
+            value = index.get(keys, _MISSING)
+            if value is not _MISSING:
+                return value
 
         data = self._data
         for key in keys:
-            if isinstance(data, dict) and key in data:
-                data = data.get(key, None)
+            # Only step into dictionaries, so keys never index into lists or strings
+            if isinstance(data, (dict, Mapping)) and key in data:
+                data = data[key]
             else:
-                return None
+                data = None
+                break
+
+        if index is not None:
+            index[keys] = data
+            children = self._index_children
+            for depth in range(1, len(keys)):
+                children.setdefault(keys[:depth], set()).add(keys)
         return data
 
+    def query(self, pattern: Union[str, PathPattern]) -> Iterator[Tuple[KeyPath, Any]]:
+        """
+        Lazily yield every nested value matching a wildcard path pattern.
+
+        Patterns are dotted paths where `*` matches one level, `**` matches zero or more levels,
+        and `[i]`, `[a:b]` and `[*]` select list items, as in "services.*.port" or "**.timeout".
+        Compiled patterns are cached, and subtrees which cannot match are never visited.
+
+        Args:
+            pattern (Union[str, PathPattern]): The pattern, or a compiled PathPattern.
+
+        Yields:
+            Tuple[KeyPath, Any]: The path and value of each match.
+
+        Raises:
+            ValueError: If the pattern is empty or a segment is invalid.
+        """
+        if not isinstance(pattern, PathPattern):
+            pattern = PathPattern.compile(pattern)
+        return pattern.match(self._data)
+
     def update(self, key: str, value: Any) -> bool:
         """
         Update the value associated with a key in the mapping.
@@ -149,12 +562,16 @@ class JSONMapTemplate(JSONBaseTemplate):
             bool: True if the value was updated, False if a new key-value pair was created.
         """
         if key in self._data:
+            self._record(self._data, key)
             self._data[key] = value
+            self._touch((), key)
             return True
         else:
             return self.create(key, value)
 
-    def update_nested(self, value: Any, *keys: str, overwrite: bool = False) -> bool:
+    def update_nested(
+        self, value: Any, *keys: Union[str, KeyPath], overwrite: bool = False
+    ) -> bool:
         """
         Update the value associated with a nested key hierarchy in the mapping.
 
@@ -162,37 +579,36 @@ class JSONMapTemplate(JSONBaseTemplate):
 
         Args:
             value (Any): The value to associate with the nested keys hierarchy.
-            keys (str): The keys hierarchy for the nested value.
+            keys (Union[str, KeyPath]): The keys hierarchy for the nested value, or a single KeyPath.
             overwrite (bool): Overwrite exiting non-empty dictionaries. Default is False.
 
         Returns:
             bool: True if the value was updated, False if a new nested key-value pair was created.
+
+        Raises:
+            ValueError: If no keys are given.
+            TypeError: If a key is not a valid type or the mapping is not a dictionary.
         """
-        if not keys:
-            raise ValueError("At least one key is required")
+        parent, last_key = _split_keys(keys)
 
         data = self._data
-        last_key = keys[-1]
-        keys = keys[:-1]
-
-        for key in keys:
-            if not isinstance(key, (str, int)):
-                raise TypeError(f"Key {key} is not a valid type")
-
-            if not isinstance(data, dict):
-                raise TypeError(
-                    f"Intermediate key '{key}' does not lead to a dictionary"
-                )
-
-            if key not in data or not isinstance(data[key], dict) or overwrite:
-                data[key] = {}
-
-            data = data[key]
-
-        if not isinstance(last_key, (str, int)):
-            raise TypeError(f"Last key {last_key} is not a valid type")
-
+        if not isinstance(data, dict):
+            key = parent[0] if parent else last_key
+            raise TypeError(f"Intermediate key '{key}' does not lead to a dictionary")
+
+        replaced = None
+        for depth, key in enumerate(parent):
+            child = data.get(key)
+            if overwrite or not isinstance(child, dict):
+                self._record(data, key)
+                child = data[key] = {}
+                if replaced is None:
+                    replaced = depth
+            data = child
+
+        self._record(data, last_key)
         data[last_key] = value
+        self._touch(parent, last_key, replaced)
         return True
 
     def delete(self, key: str) -> bool:
@@ -206,36 +622,242 @@ class JSONMapTemplate(JSONBaseTemplate):
             bool: True if the key-value pair was deleted successfully, False if the key is not present in the mapping.
         """
         if key in self._data:
+            self._record_delete(self._data, key)
             del self._data[key]
+            self._touch((), key)
             return True
 
         return False
 
-    def delete_nested(self, *keys: str) -> bool:
+    def delete_nested(self, *keys: Union[str, KeyPath]) -> bool:
         """
         Delete a nested key-value pair from the mapping.
 
         Args:
-            keys (str): The keys hierarchy for the nested value.
+            keys (Union[str, KeyPath]): The keys hierarchy for the nested value, or a single KeyPath.
 
         Returns:
             bool: True if the nested key-value pair was deleted successfully, False if any key in the hierarchy is missing.
         """
-        if not keys:
-            raise ValueError("At least one key is required")
+        parent, last_key = _split_keys(keys)
 
         data = self._data
-        last_key = keys[-1]
-        keys = keys[:-1]
-
-        for key in keys:
+        for key in parent:
             if isinstance(data, dict) and key in data:
                 data = data[key]
             else:
                 return False
 
         if isinstance(data, dict) and last_key in data:
+            self._record_delete(data, last_key)
             del data[last_key]
+            self._touch(parent, last_key)
             return True
 
         return False
+
+    def update_many(
+        self, updates: Mapping[Union[str, Sequence[str], KeyPath], Any]
+    ) -> int:
+        """
+        Update many nested values in one pass.
+
+        The paths are grouped into a prefix trie, so each intermediate dictionary is visited
+        once no matter how many paths share it. Missing or non-dictionary intermediates are
+        replaced with dictionaries, as with `update_nested`. When a path and a longer path
+        under it are both given, the shorter one is applied first. The batch is atomic: if it
+        fails, every change already made is rolled back before the error is raised.
+
+        Args:
+            updates (Mapping[Union[str, Sequence[str], KeyPath], Any]): The values keyed by dotted key path, JSON Pointer, sequence of keys or KeyPath.
+
+        Returns:
+            int: The number of values written.
+
+        Raises:
+            ValueError: If a path has no keys.
+            TypeError: If a key is not a valid type or the mapping is not a dictionary.
+        """
+        trie = _prefix_trie(updates.items())
+        if not isinstance(self._data, dict):
+            raise TypeError("The mapping does not lead to a dictionary")
+
+        log = self._undo if self._undo is not None else UndoLog()
+        mark = log.mark()
+        count = 0
+        stack = [(self._data, trie, ())]
+        try:
+            with self._batch():
+                while stack:
+                    data, children, parent = stack.pop()
+                    for key, (value, subtrie) in children.items():
+                        if value is not _MISSING:
+                            log.record(data, key)
+                            data[key] = value
+                            self._touch(parent, key)
+                            count += 1
+                        if subtrie:
+                            child = data.get(key)
+                            if not isinstance(child, dict):
+                                log.record(data, key)
+                                child = data[key] = {}
+                                self._touch(parent, key)
+                            stack.append((child, subtrie, parent + (key,)))
+        except Exception:
+            log.rollback(mark)
+            raise
+        return count
+
+    def delete_many(self, paths: Iterable[Union[str, Sequence[str], KeyPath]]) -> int:
+        """
+        Delete many nested key-value pairs in one pass.
+
+        The paths are grouped into a prefix trie, so each intermediate dictionary is visited
+        once. Missing paths are skipped. Deeper paths are deleted before their ancestors, so
+        the result does not depend on the order of the paths. The batch is atomic: if it fails,
+        every deletion already made is rolled back before the error is raised.
+
+        Args:
+            paths (Iterable[Union[str, Sequence[str], KeyPath]]): Dotted key paths, JSON Pointers, sequences of keys or KeyPaths.
+
+        Returns:
+            int: The number of key-value pairs deleted.
+
+        Raises:
+            ValueError: If a path has no keys.
+            TypeError: If a key is not a valid type.
+        """
+        trie = _prefix_trie((path, True) for path in paths)
+        if not isinstance(self._data, dict):
+            return 0
+
+        deletions = []
+        stack = [(self._data, trie, ())]
+        while stack:
+            data, children, parent = stack.pop()
+            for key, (flag, subtrie) in children.items():
+                if key not in data:
+                    continue
+                if flag is not _MISSING:
+                    deletions.append((data, parent, key))
+                child = data[key]
+                if subtrie and isinstance(child, dict):
+                    stack.append((child, subtrie, parent + (key,)))
+
+        log = self._undo if self._undo is not None else UndoLog()
+        mark = log.mark()
+        try:
+            with self._batch():
+                # Descendants were queued after their ancestors, so delete in reverse
+                for data, parent, key in reversed(deletions):
+                    log.record_delete(data, key)
+                    del data[key]
+                    self._touch(parent, key)
+        except Exception:
+            log.rollback(mark)
+            raise
+        return len(deletions)
+
+    def merge(
+        self,
+        other: Union[JSONMap, "JSONMapTemplate"],
+        strategy: str = "overwrite",
+        list_strategy: Optional[str] = None,
+        overrides: Optional[Mapping[Union[str, Sequence[str], KeyPath], str]] = None,
+    ) -> int:
+        """
+        Deep merge another mapping into this one.
+
+        The merge is iterative, so deep trees never hit the recursion limit, and subtrees which
+        are the same object on both sides are skipped. Merged values are copies, so the mapping
+        never shares containers with other. The merge is atomic: if it fails, every change
+        already made is rolled back before the error is raised.
+
+        Args:
+            other (Union[JSONMap, JSONMapTemplate]): The mapping to merge from.
+            strategy (str): "overwrite" to take values from other, or "keep" to keep existing values. Defaults to "overwrite".
+            list_strategy (Optional[str]): "replace", "append" or "union" for lists present on both sides. Defaults to keeping existing lists under the "keep" strategy, and to "replace" otherwise.
+            overrides (Optional[Mapping[Union[str, Sequence[str], KeyPath], str]]): Strategy names for specific key paths and their subtrees.
+
+        Returns:
+            int: The number of entries written.
+
+        Raises:
+            ValueError: If a strategy name is invalid.
+            TypeError: If either mapping is not a dictionary.
+        """
+        source = other._data if isinstance(other, JSONMapTemplate) else other
+        log = self._undo if self._undo is not None else UndoLog()
+        mark = log.mark()
+
+        def before_write(data: dict, parent: Tuple, key: Any) -> None:
+            log.record(data, key)
+            self._touch(parent, key)
+
+        try:
+            with self._batch():
+                return deep_merge(
+                    self._data,
+                    source,
+                    strategy=strategy,
+                    list_strategy=list_strategy,
+                    overrides=overrides,
+                    before_write=before_write,
+                )
+        except Exception:
+            log.rollback(mark)
+            raise
+
+    def diff(self, other: Union[JSONMap, "JSONMapTemplate"]) -> List[JSONMap]:
+        """
+        Compute the JSON Patch operations turning this mapping into another.
+
+        Subtrees which are the same object are skipped, so diffing against an updated copy
+        which shares its unchanged subtrees only visits the changed paths.
+
+        Args:
+            other (Union[JSONMap, JSONMapTemplate]): The target mapping.
+
+        Returns:
+            List[JSONMap]: The "add", "remove" and "replace" operations.
+        """
+        target = other._data if isinstance(other, JSONMapTemplate) else other
+        return diff(self._data, target)
+
+    def apply_patch(self, patch: List[JSONMap]) -> None:
+        """
+        Apply JSON Patch (RFC 6902) operations to the mapping.
+
+        The patch is atomic: if any operation fails, every operation already applied is rolled
+        back before the error is raised.
+
+        Args:
+            patch (List[JSONMap]): The operations to apply.
+
+        Raises:
+            JSONPatchErrorHandler: If an operation is invalid or cannot be applied.
+        """
+
+        def on_change(keys: Tuple) -> None:
+            if self._index is not None:
+                self._invalidate(keys)
+            if self._subscriptions or self._save_subscriptions:
+                self._notify(keys)
+
+        for operation in patch:
+            # Check root replacements up front so a failure never leaves a partial patch
+            if isinstance(operation, dict) and operation.get("path") == "":
+                op = operation.get("op")
+                if op in ("move", "copy") or (
+                    op in ("add", "replace")
+                    and not isinstance(operation.get("value"), dict)
+                ):
+                    raise JSONPatchErrorHandler(
+                        "The root of a mapping must be an object"
+                    )
+
+        with self._batch():
+            data = apply_patch(self._data, patch, on_change=on_change, log=self._undo)
+            if data is not self._data:
+                self._data = data
+                self._replaced()
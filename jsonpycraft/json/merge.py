@@ -0,0 +1,204 @@
+"""
+jsonpycraft/json/merge.py
+
+Iterative deep merging of JSON maps with pluggable strategies.
+
+The merge walks both structures with an explicit stack, so arbitrarily deep trees never hit
+the interpreter's recursion limit, and subtrees which are the same object in both structures
+are skipped without being visited.
+
+Strategies:
+- Map strategies decide what happens when both sides hold a value which is not a pair of
+  dictionaries or lists: "overwrite" takes the source value, "keep" keeps the existing value.
+- List strategies decide what happens when both sides hold a list: "replace" takes the source
+  list, "append" concatenates the lists, and "union" appends only the source items which are
+  not already present. Items are compared by type as well as value, so `1`, `1.0` and `true`
+  are distinct. Without a list strategy, lists follow the map strategy: they are replaced
+  under "overwrite" and kept under "keep".
+- Overrides map a key path to any strategy name, changing the map or list strategy for that
+  path and everything below it.
+
+Example Usage:
+    from jsonpycraft.json.merge import deep_merge
+
+    defaults = {"db": {"host": "localhost", "port": 5432}, "plugins": ["auth"]}
+    site = {"db": {"host": "db.internal"}, "plugins": ["metrics"]}
+    deep_merge(defaults, site, list_strategy="union")
+    # {"db": {"host": "db.internal", "port": 5432}, "plugins": ["auth", "metrics"]}
+"""
+
+import json
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple, Union
+
+from jsonpycraft.core.types import JSONMap
+from jsonpycraft.json.path import KeyPath
+
+MAP_STRATEGIES = ("overwrite", "keep")
+LIST_STRATEGIES = ("replace", "append", "union")
+
+# Called with (container, parent keys, key) before an entry of the target is written
+WriteHook = Callable[[dict, Tuple, Any], None]
+
+# Sentinel for a key missing from the target
+_MISSING = object()
+
+
+def copy_tree(value: Any) -> Any:
+    """
+    Copy the dictionaries and lists of a JSON structure without recursion.
+
+    Args:
+        value (Any): The structure to copy.
+
+    Returns:
+        Any: A copy sharing only immutable leaves with the original.
+    """
+    if isinstance(value, dict):
+        root = {}
+    elif isinstance(value, list):
+        root = []
+    else:
+        return value
+
+    stack = [(value, root)]
+    while stack:
+        source, target = stack.pop()
+        items = source.items() if isinstance(source, dict) else enumerate(source)
+        for key, item in items:
+            if isinstance(item, dict):
+                copied = {}
+                stack.append((item, copied))
+            elif isinstance(item, list):
+                copied = []
+                stack.append((item, copied))
+            else:
+                copied = item
+            if isinstance(target, dict):
+                target[key] = copied
+            else:
+                target.append(copied)
+    return root
+
+
+def _identity(item: Any) -> Any:
+    """Return a hashable key telling items apart by type as well as value."""
+    if isinstance(item, (dict, list)):
+        # JSON text distinguishes 1, 1.0 and true at any depth, and sorting keys ignores order
+        return (list, json.dumps(item, sort_keys=True))
+    hash(item)
+    return (type(item), item)
+
+
+def _union(existing: list, incoming: list) -> list:
+    """Return existing followed by the incoming items which are not already present."""
+    merged = list(existing)
+    seen = set()
+    for item in existing:
+        try:
+            seen.add(_identity(item))
+        except (TypeError, ValueError):
+            pass
+    for item in incoming:
+        try:
+            identity = _identity(item)
+        except (TypeError, ValueError):
+            # Not JSON, so fall back to comparing by type and equality
+            if any(type(other) is type(item) and other == item for other in merged):
+                continue
+        else:
+            if identity in seen:
+                continue
+            seen.add(identity)
+        merged.append(copy_tree(item))
+    return merged
+
+
+def _validate(name: str, allowed: Sequence[str]) -> str:
+    if name not in allowed:
+        raise ValueError(f"Invalid merge strategy: {name}")
+    return name
+
+
+def deep_merge(
+    target: JSONMap,
+    source: JSONMap,
+    strategy: str = "overwrite",
+    list_strategy: Optional[str] = None,
+    overrides: Optional[Mapping[Union[str, Sequence[str], KeyPath], str]] = None,
+    before_write: Optional[WriteHook] = None,
+) -> int:
+    """
+    Merge source into target in place.
+
+    Values taken from source are copied, so the merged target never shares containers with it.
+
+    Args:
+        target (JSONMap): The map to merge into.
+        source (JSONMap): The map to merge from.
+        strategy (str): The map strategy, "overwrite" or "keep". Defaults to "overwrite".
+        list_strategy (Optional[str]): The list strategy, "replace", "append" or "union". Defaults to "keep" under the "keep" strategy, and to "replace" otherwise.
+        overrides (Optional[Mapping[Union[str, Sequence[str], KeyPath], str]]): Strategies for specific key paths and their subtrees.
+        before_write (Optional[WriteHook]): Called with (container, parent keys, key) before each write to target.
+
+    Returns:
+        int: The number of entries written to target.
+
+    Raises:
+        ValueError: If a strategy name is invalid.
+        TypeError: If target or source is not a dictionary.
+    """
+    if not isinstance(target, dict) or not isinstance(source, dict):
+        raise TypeError("Only dictionaries can be merged")
+
+    _validate(strategy, MAP_STRATEGIES)
+    if list_strategy is not None:
+        _validate(list_strategy, LIST_STRATEGIES)
+    path_strategies: Dict[Tuple, str] = {}
+    for path, name in (overrides or {}).items():
+        path_strategies[KeyPath.coerce(path).keys] = _validate(
+            name, MAP_STRATEGIES + LIST_STRATEGIES
+        )
+
+    count = 0
+    stack = [(target, source, (), strategy, list_strategy)]
+    while stack:
+        existing, incoming, parent, map_mode, list_mode = stack.pop()
+        for key, value in incoming.items():
+            current = existing.get(key, _MISSING)
+            if current is value:
+                continue  # Identical subtree, nothing to merge
+
+            child_map_mode, child_list_mode = map_mode, list_mode
+            if path_strategies:
+                override = path_strategies.get(parent + (key,))
+                if override in MAP_STRATEGIES:
+                    child_map_mode = override
+                elif override is not None:
+                    child_list_mode = override
+
+            if current is _MISSING:
+                merged = copy_tree(value)
+            elif isinstance(current, dict) and isinstance(value, dict):
+                stack.append(
+                    (current, value, parent + (key,), child_map_mode, child_list_mode)
+                )
+                continue
+            elif isinstance(current, list) and isinstance(value, list):
+                if child_list_mode == "append":
+                    merged = current + copy_tree(value)
+                elif child_list_mode == "union":
+                    merged = _union(current, value)
+                elif child_list_mode is None and child_map_mode == "keep":
+                    continue
+                else:
+                    merged = copy_tree(value)
+            elif child_map_mode == "keep":
+                continue
+            else:
+                merged = copy_tree(value)
+
+            if before_write is not None:
+                before_write(existing, parent, key)
+            existing[key] = merged
+            count += 1
+    return count
@@ -0,0 +1,192 @@
+"""
+jsonpycraft/json/parallel.py
+
+Chunked map, filter and reduce over lists of records using a process pool.
+
+Records are split into contiguous chunks which are processed by worker processes, and the
+results are reassembled in the original order. Inputs smaller than `serial_threshold` are
+processed in the calling process, since spawning workers and pickling records costs more
+than it saves for small lists.
+
+NOTE:
+    Functions passed to the parallel helpers are pickled and sent to the workers, so they
+    must be defined at module level. Lambdas and closures only work on the serial path.
+
+Example Usage:
+    from jsonpycraft.json.parallel import parallel_map
+
+    def score(record):
+        return record["hits"] / record["total"]
+
+    if __name__ == "__main__":
+        scores = parallel_map(score, records, chunk_size=10_000)
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial, reduce
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+from jsonpycraft.core.types import JSONList, JSONMap
+
+# Below this many records the work is done serially in the calling process.
+SERIAL_THRESHOLD = 20_000
+
+
+def _chunk_size(length: int, chunk_size: Optional[int], max_workers: int) -> int:
+    """Return the chunk size to use, giving each worker about four chunks by default."""
+    if chunk_size is not None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        return chunk_size
+    return max(1, -(-length // (max_workers * 4)))
+
+
+def _chunks(records: Sequence[JSONMap], size: int) -> Iterator[Tuple[int, JSONList]]:
+    """Yield (offset, chunk) pairs covering the records in order."""
+    for offset in range(0, len(records), size):
+        yield offset, records[offset : offset + size]
+
+
+def _map_chunk(func: Callable[[JSONMap], Any], job: Tuple[int, JSONList]) -> List[Any]:
+    """Apply func to every record in a chunk."""
+    return [func(record) for record in job[1]]
+
+
+def _filter_chunk(
+    predicate: Callable[[JSONMap], bool], job: Tuple[int, JSONList]
+) -> List[int]:
+    """Return the absolute indices of the records in a chunk matching predicate."""
+    offset, chunk = job
+    return [offset + i for i, record in enumerate(chunk) if predicate(record)]
+
+
+def _reduce_chunk(
+    func: Callable[[Any, JSONMap], Any], initial: Any, job: Tuple[int, JSONList]
+) -> Any:
+    """Fold a chunk of records into a partial result."""
+    return reduce(func, job[1], initial)
+
+
+def _run(
+    worker: Callable[[Tuple[int, JSONList]], Any],
+    records: Sequence[JSONMap],
+    chunk_size: Optional[int],
+    max_workers: Optional[int],
+) -> List[Any]:
+    """Run worker over the chunks of records in a process pool, preserving chunk order."""
+    max_workers = max_workers or os.cpu_count() or 1
+    size = _chunk_size(len(records), chunk_size, max_workers)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(worker, _chunks(records, size)))
+
+
+def parallel_map(
+    func: Callable[[JSONMap], Any],
+    records: Sequence[JSONMap],
+    chunk_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    serial_threshold: int = SERIAL_THRESHOLD,
+) -> List[Any]:
+    """
+    Apply a function to every record using a process pool.
+
+    Args:
+        func (Callable[[JSONMap], Any]): A module-level function applied to each record.
+        records (Sequence[JSONMap]): The records to transform.
+        chunk_size (Optional[int]): The number of records sent to a worker at once. Defaults to an even split.
+        max_workers (Optional[int]): The number of worker processes. Defaults to the CPU count.
+        serial_threshold (int): Run serially when there are fewer records than this. Defaults to SERIAL_THRESHOLD.
+
+    Returns:
+        List[Any]: The results in the same order as the records.
+
+    Raises:
+        ValueError: If chunk_size is not a positive integer.
+    """
+    if len(records) < serial_threshold:
+        return [func(record) for record in records]
+
+    results = []
+    for chunk in _run(partial(_map_chunk, func), records, chunk_size, max_workers):
+        results.extend(chunk)
+    return results
+
+
+def parallel_filter(
+    predicate: Callable[[JSONMap], bool],
+    records: Sequence[JSONMap],
+    chunk_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    serial_threshold: int = SERIAL_THRESHOLD,
+) -> JSONList:
+    """
+    Select the records matching a predicate using a process pool.
+
+    Workers only return the indices of matching records, so the returned list holds the
+    original record objects rather than copies.
+
+    Args:
+        predicate (Callable[[JSONMap], bool]): A module-level function deciding whether to keep a record.
+        records (Sequence[JSONMap]): The records to filter.
+        chunk_size (Optional[int]): The number of records sent to a worker at once. Defaults to an even split.
+        max_workers (Optional[int]): The number of worker processes. Defaults to the CPU count.
+        serial_threshold (int): Run serially when there are fewer records than this. Defaults to SERIAL_THRESHOLD.
+
+    Returns:
+        JSONList: The matching records in their original order.
+
+    Raises:
+        ValueError: If chunk_size is not a positive integer.
+    """
+    if len(records) < serial_threshold:
+        return [record for record in records if predicate(record)]
+
+    worker = partial(_filter_chunk, predicate)
+    return [
+        records[index]
+        for chunk in _run(worker, records, chunk_size, max_workers)
+        for index in chunk
+    ]
+
+
+def parallel_reduce(
+    func: Callable[[Any, JSONMap], Any],
+    records: Sequence[JSONMap],
+    initial: Any,
+    combine: Optional[Callable[[Any, Any], Any]] = None,
+    chunk_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    serial_threshold: int = SERIAL_THRESHOLD,
+) -> Any:
+    """
+    Fold the records into a single result using a process pool.
+
+    Each chunk is folded with func starting from initial, and the partial results are then
+    folded together in order with combine. For the result to match a serial fold, initial
+    must be an identity for combine and combine must be associative. Only a serial fold can do
+    without combine, since func folds records rather than partial results.
+
+    Args:
+        func (Callable[[Any, JSONMap], Any]): A module-level function folding a record into an accumulator.
+        records (Sequence[JSONMap]): The records to fold.
+        initial (Any): The starting accumulator for every chunk.
+        combine (Optional[Callable[[Any, Any], Any]]): A module-level function merging two partial results. Required unless the fold runs serially.
+        chunk_size (Optional[int]): The number of records sent to a worker at once. Defaults to an even split.
+        max_workers (Optional[int]): The number of worker processes. Defaults to the CPU count.
+        serial_threshold (int): Run serially when there are fewer records than this. Defaults to SERIAL_THRESHOLD.
+
+    Returns:
+        Any: The folded result.
+
+    Raises:
+        ValueError: If combine is missing for a parallel fold, or chunk_size is not a positive integer.
+    """
+    if len(records) < serial_threshold:
+        return reduce(func, records, initial)
+    if combine is None:
+        raise ValueError("combine is required to fold records in parallel")
+
+    worker = partial(_reduce_chunk, func, initial)
+    partials = _run(worker, records, chunk_size, max_workers)
+    return reduce(combine, partials, initial)
@@ -0,0 +1,294 @@
+"""
+jsonpycraft/json/patch.py
+
+Structural diffs and JSON Patch (RFC 6902) application.
+
+`diff` compares two JSON structures and emits the patch operations turning the old one into
+the new one. Subtrees which are the same object are skipped without being walked, so diffing a
+map against an updated copy which shares its unchanged subtrees only visits the changed paths.
+`apply_patch` applies such a patch atomically: if any operation fails, the document is restored.
+
+NOTE:
+    Values are compared by type as well as by value, so changing `1` to `1.0` or `true` is a
+    change, as it is in JSON.
+
+Example Usage:
+    from jsonpycraft.json.patch import apply_patch, diff
+
+    old = {"db": {"host": "localhost", "port": 5432}}
+    new = {"db": {"host": "db.internal", "port": 5432}}
+
+    patch = diff(old, new)
+    # [{"op": "replace", "path": "/db/host", "value": "db.internal"}]
+    apply_patch(old, patch)
+"""
+
+from typing import Any, Callable, List, Optional, Tuple
+
+from jsonpycraft.core.errors import JSONPatchErrorHandler
+from jsonpycraft.core.types import JSONMap
+from jsonpycraft.core.undo import UndoLog
+from jsonpycraft.json.merge import copy_tree
+from jsonpycraft.json.path import KeyPath
+
+# Called with the keys of the changed node after each operation
+ChangeHook = Callable[[Tuple], None]
+
+
+def _escape(key: str) -> str:
+    """Escape a key for use as a JSON Pointer reference token."""
+    if "~" in key or "/" in key:
+        return key.replace("~", "~0").replace("/", "~1")
+    return key
+
+
+def diff(old: Any, new: Any) -> List[JSONMap]:
+    """
+    Compute the JSON Patch operations turning old into new.
+
+    Args:
+        old (Any): The original JSON structure.
+        new (Any): The updated JSON structure.
+
+    Returns:
+        List[JSONMap]: The "add", "remove" and "replace" operations, in an order which can be applied sequentially.
+    """
+    patch = []
+    stack = [(old, new, "")]
+    while stack:
+        before, after, pointer = stack.pop()
+        if before is after:
+            continue
+
+        if isinstance(before, dict) and isinstance(after, dict):
+            for key, value in before.items():
+                path = f"{pointer}/{_escape(key)}"
+                if key in after:
+                    stack.append((value, after[key], path))
+                else:
+                    patch.append({"op": "remove", "path": path})
+            for key, value in after.items():
+                if key not in before:
+                    path = f"{pointer}/{_escape(key)}"
+                    patch.append({"op": "add", "path": path, "value": copy_tree(value)})
+
+        elif isinstance(before, list) and isinstance(after, list):
+            common = min(len(before), len(after))
+            for index in range(common):
+                stack.append((before[index], after[index], f"{pointer}/{index}"))
+            # Remove from the end so the remaining indices stay valid
+            for index in range(len(before) - 1, common - 1, -1):
+                patch.append({"op": "remove", "path": f"{pointer}/{index}"})
+            for index in range(common, len(after)):
+                patch.append(
+                    {
+                        "op": "add",
+                        "path": f"{pointer}/{index}",
+                        "value": copy_tree(after[index]),
+                    }
+                )
+
+        elif type(before) is not type(after) or before != after:
+            patch.append({"op": "replace", "path": pointer, "value": copy_tree(after)})
+    return patch
+
+
+def _tokens(operation: JSONMap, member: str) -> Tuple:
+    """Parse the JSON Pointer held by a member of an operation."""
+    try:
+        return KeyPath.from_pointer(operation[member]).keys
+    except KeyError:
+        raise JSONPatchErrorHandler(f"Operation is missing '{member}': {operation}")
+    except (ValueError, AttributeError) as e:
+        raise JSONPatchErrorHandler(f"Invalid pointer in {operation}: {e}")
+
+
+def _index(container: list, token: str, insert: bool = False) -> int:
+    """Convert a reference token into a list index, allowing the end for inserts."""
+    if insert and token == "-":
+        return len(container)
+    if not token.isdigit() or (token != "0" and token.startswith("0")):
+        raise JSONPatchErrorHandler(f"Invalid array index: {token}")
+    index = int(token)
+    if index > len(container) or (index == len(container) and not insert):
+        raise JSONPatchErrorHandler(f"Array index out of range: {token}")
+    return index
+
+
+def _walk(document: Any, tokens: Tuple) -> Tuple[Any, Tuple]:
+    """Return the value addressed by the reference tokens and its keys, with list indices as integers."""
+    value = document
+    keys = []
+    for token in tokens:
+        if isinstance(value, dict):
+            if token not in value:
+                raise JSONPatchErrorHandler(
+                    f"Path not found: {KeyPath(tokens).to_pointer()}"
+                )
+            value = value[token]
+            keys.append(token)
+        elif isinstance(value, list):
+            index = _index(value, token)
+            value = value[index]
+            keys.append(index)
+        else:
+            raise JSONPatchErrorHandler(
+                f"Path not found: {KeyPath(tokens).to_pointer()}"
+            )
+    return value, tuple(keys)
+
+
+def _resolve(document: Any, tokens: Tuple) -> Any:
+    """Return the value addressed by the reference tokens."""
+    return _walk(document, tokens)[0]
+
+
+def _add(
+    document: Any,
+    tokens: Tuple,
+    value: Any,
+    log: UndoLog,
+    on_change: Optional[ChangeHook],
+) -> Any:
+    """Add a value at the reference tokens, returning the possibly replaced document."""
+    if not tokens:
+        return value
+    container, parent = _walk(document, tokens[:-1])
+    key = tokens[-1]
+    if isinstance(container, dict):
+        log.record(container, key)
+        container[key] = value
+        changed = parent + (key,)
+    elif isinstance(container, list):
+        index = _index(container, key, insert=True)
+        log.record_insert(container, index)
+        container.insert(index, value)
+        changed = parent  # Later indices shift, so the whole list changed
+    else:
+        raise JSONPatchErrorHandler(f"Path not found: {KeyPath(tokens).to_pointer()}")
+    if on_change is not None:
+        on_change(changed)
+    return document
+
+
+def _remove(
+    document: Any, tokens: Tuple, log: UndoLog, on_change: Optional[ChangeHook]
+) -> Any:
+    """Remove and return the value at the reference tokens."""
+    if not tokens:
+        raise JSONPatchErrorHandler("Cannot remove the document root")
+    container, parent = _walk(document, tokens[:-1])
+    key = tokens[-1]
+    if isinstance(container, dict) and key in container:
+        value = container[key]
+        log.record_delete(container, key)
+        del container[key]
+        changed = parent + (key,)
+    elif isinstance(container, list):
+        index = _index(container, key)
+        value = container[index]
+        log.record_remove(container, index)
+        del container[index]
+        changed = parent
+    else:
+        raise JSONPatchErrorHandler(f"Path not found: {KeyPath(tokens).to_pointer()}")
+    if on_change is not None:
+        on_change(changed)
+    return value
+
+
+def _replace(
+    document: Any,
+    tokens: Tuple,
+    value: Any,
+    log: UndoLog,
+    on_change: Optional[ChangeHook],
+) -> Any:
+    """Replace the existing value at the reference tokens, returning the possibly replaced document."""
+    if not tokens:
+        return value
+    container, parent = _walk(document, tokens[:-1])
+    key = tokens[-1]
+    if isinstance(container, dict) and key in container:
+        log.record(container, key)
+    elif isinstance(container, list):
+        key = _index(container, key)
+        log.record(container, key)
+    else:
+        raise JSONPatchErrorHandler(f"Path not found: {KeyPath(tokens).to_pointer()}")
+    container[key] = value
+    if on_change is not None:
+        on_change(parent + (key,))
+    return document
+
+
+def apply_patch(
+    document: Any,
+    patch: List[JSONMap],
+    on_change: Optional[ChangeHook] = None,
+    log: Optional[UndoLog] = None,
+) -> Any:
+    """
+    Apply JSON Patch operations to a document in place.
+
+    The patch is atomic: if any operation fails, every operation already applied is rolled back
+    before the error is raised.
+
+    Args:
+        document (Any): The JSON structure to patch.
+        patch (List[JSONMap]): The operations to apply.
+        on_change (Optional[ChangeHook]): Called with the keys of each changed node, with list indices as integers.
+        log (Optional[UndoLog]): Record the changes into this log, such as the log of an enclosing transaction, so they can be rolled back later.
+
+    Returns:
+        Any: The patched document, which is a new object only if an operation replaced the root.
+
+    Raises:
+        JSONPatchErrorHandler: If an operation is invalid or cannot be applied.
+    """
+    if log is None:
+        log = UndoLog()
+    mark = log.mark()
+    try:
+        for operation in patch:
+            if not isinstance(operation, dict):
+                raise JSONPatchErrorHandler(f"Invalid operation: {operation}")
+            op = operation.get("op")
+            tokens = _tokens(operation, "path")
+            if op in ("add", "replace", "test") and "value" not in operation:
+                raise JSONPatchErrorHandler(
+                    f"Operation is missing 'value': {operation}"
+                )
+
+            if op == "add":
+                value = copy_tree(operation["value"])
+                document = _add(document, tokens, value, log, on_change)
+            elif op == "remove":
+                _remove(document, tokens, log, on_change)
+            elif op == "replace":
+                value = copy_tree(operation["value"])
+                document = _replace(document, tokens, value, log, on_change)
+            elif op == "move":
+                source = _tokens(operation, "from")
+                if tokens == source:
+                    continue
+                if tokens[: len(source)] == source:
+                    raise JSONPatchErrorHandler(
+                        f"Cannot move into a child: {operation}"
+                    )
+                value = _remove(document, source, log, on_change)
+                document = _add(document, tokens, value, log, on_change)
+            elif op == "copy":
+                value = copy_tree(_resolve(document, _tokens(operation, "from")))
+                document = _add(document, tokens, value, log, on_change)
+            elif op == "test":
+                actual = _resolve(document, tokens)
+                expected = operation["value"]
+                if type(actual) is not type(expected) or actual != expected:
+                    raise JSONPatchErrorHandler(f"Test failed: {operation}")
+            else:
+                raise JSONPatchErrorHandler(f"Invalid operation: {operation}")
+    except Exception:
+        log.rollback(mark)
+        raise
+    return document
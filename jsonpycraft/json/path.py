@@ -0,0 +1,192 @@
+"""
+jsonpycraft/json/path.py
+
+Precompiled key paths for nested JSON access.
+
+A `KeyPath` holds a validated tuple of keys together with its parent keys and last key, so
+nested operations can walk a structure without re-splitting strings, re-checking key types
+or slicing tuples on every call. Parsed paths are cached, so repeatedly resolving the same
+dotted key or JSON Pointer (RFC 6901) costs a single cache lookup.
+
+Example Usage:
+    from jsonpycraft.json.path import KeyPath
+
+    path = KeyPath.parse("app.logs.general")
+    assert path == KeyPath.parse("/app/logs/general")
+    level = path.get({"app": {"logs": {"general": "INFO"}}})  # "INFO"
+"""
+
+from functools import lru_cache
+from typing import Any, Mapping, Sequence, Union
+
+from jsonpycraft.json.record import Record
+
+# Number of parsed paths kept by each parser cache
+PATH_CACHE_SIZE = 4096
+
+# The values a path can step into
+_NESTED = (dict, Mapping, Record)
+
+
+class KeyPath:
+    """
+    An immutable, hashable sequence of keys addressing a value in nested dictionaries.
+
+    Attributes:
+        keys (Tuple[Union[str, int], ...]): The keys from the root to the value.
+        parent (Tuple[Union[str, int], ...]): All keys but the last.
+        last (Optional[Union[str, int]]): The last key, or None for the root path.
+    """
+
+    __slots__ = ("keys", "parent", "last", "_hash")
+
+    def __init__(self, keys: Sequence[Union[str, int]]):
+        """
+        Initialize a KeyPath instance.
+
+        Args:
+            keys (Sequence[Union[str, int]]): The keys from the root to the value.
+
+        Raises:
+            TypeError: If a key is not a string or an integer.
+        """
+        keys = tuple(keys)
+        for key in keys:
+            if not isinstance(key, (str, int)):
+                raise TypeError(f"Key {key} is not a valid type")
+        self.keys = keys
+        self.parent = keys[:-1]
+        self.last = keys[-1] if keys else None
+        self._hash = hash(keys)
+
+    @classmethod
+    def from_dotted(cls, path: str) -> "KeyPath":
+        """
+        Parse a dot-separated key path such as "app.logs.general".
+
+        Args:
+            path (str): The dotted key path.
+
+        Returns:
+            KeyPath: The cached compiled path.
+        """
+        return _parse_dotted(path)
+
+    @classmethod
+    def from_pointer(cls, pointer: str) -> "KeyPath":
+        """
+        Parse a JSON Pointer (RFC 6901) such as "/app/logs/general".
+
+        Args:
+            pointer (str): The JSON Pointer. The empty string addresses the root.
+
+        Returns:
+            KeyPath: The cached compiled path.
+
+        Raises:
+            ValueError: If the pointer is not empty and does not start with "/".
+        """
+        return _parse_pointer(pointer)
+
+    @classmethod
+    def parse(cls, path: str) -> "KeyPath":
+        """
+        Parse a JSON Pointer if the path starts with "/", or a dotted key path otherwise.
+
+        Args:
+            path (str): The key path.
+
+        Returns:
+            KeyPath: The cached compiled path.
+        """
+        if path.startswith("/"):
+            return _parse_pointer(path)
+        return _parse_dotted(path)
+
+    @classmethod
+    def coerce(
+        cls, path: Union["KeyPath", str, Sequence[Union[str, int]]]
+    ) -> "KeyPath":
+        """
+        Convert a KeyPath, a path string or a sequence of keys into a KeyPath.
+
+        Args:
+            path (Union[KeyPath, str, Sequence[Union[str, int]]]): The path to convert.
+
+        Returns:
+            KeyPath: The compiled path.
+        """
+        if isinstance(path, KeyPath):
+            return path
+        if isinstance(path, str):
+            return cls.parse(path)
+        return cls(path)
+
+    def get(self, data: Any, default: Any = None) -> Any:
+        """
+        Resolve the path within nested dictionaries.
+
+        Every step must be a mapping or a record, so keys never index into lists or strings.
+
+        Args:
+            data (Any): The structure to walk.
+            default (Any): The value returned if any key in the path is missing or a step is not a mapping. Defaults to None.
+
+        Returns:
+            Any: The value at the path, or default.
+        """
+        for key in self.keys:
+            if not isinstance(data, _NESTED):
+                return default
+            try:
+                data = data[key]
+            except KeyError:
+                return default
+        return data
+
+    def to_pointer(self) -> str:
+        """
+        Format the path as a JSON Pointer (RFC 6901).
+
+        Returns:
+            str: The escaped JSON Pointer.
+        """
+        return "".join(
+            "/" + str(key).replace("~", "~0").replace("/", "~1") for key in self.keys
+        )
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __iter__(self):
+        return iter(self.keys)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, KeyPath):
+            return self.keys == other.keys
+        return NotImplemented
+
+    def __str__(self) -> str:
+        return ".".join(str(key) for key in self.keys)
+
+    def __repr__(self) -> str:
+        return f"KeyPath({self.keys!r})"
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def _parse_dotted(path: str) -> KeyPath:
+    return KeyPath(path.split("."))
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def _parse_pointer(pointer: str) -> KeyPath:
+    if not pointer:
+        return KeyPath(())
+    if not pointer.startswith("/"):
+        raise ValueError(f"Invalid JSON Pointer: {pointer!r}")
+    return KeyPath(
+        token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")
+    )
@@ -0,0 +1,724 @@
+"""
+jsonpycraft/json/persistent.py
+
+An immutable, structurally shared map for cheap point-in-time snapshots.
+
+`PersistentMap` is a hash array mapped trie (HAMT): keys are placed by successive 5-bit slices
+of their hash in nodes of up to 32 entries, located through a bitmap. Setting or deleting a key
+copies only the nodes on the path to it, O(log n), and returns a new map sharing every other node
+with the original, which is left unchanged.
+
+Each leaf also holds the sequence number of its insertion, and iteration sorts by it, so keys
+keep insertion order as in a dictionary. Updating a key keeps its position.
+
+`PersistentMapTemplate` keeps its data as nested persistent maps behind the `JSONMapTemplate`
+API. Every mutation produces a new version by path copying, so `snapshot()` is O(1) and a
+snapshot never observes later writes.
+
+NOTE:
+    Nested dictionaries are stored as PersistentMap instances and lists as tuples, so reads return
+    immutable values. Both are converted back to dictionaries and lists when saving, in the
+    same key order.
+
+Example Usage:
+    from jsonpycraft.json.persistent import PersistentMapTemplate
+
+    settings = PersistentMapTemplate("settings.json", initial_data={"db": {"port": 5432}})
+    before = settings.snapshot()
+    settings.update_nested(5433, "db", "port")
+
+    before["db"]["port"]  # 5432
+    settings.read_nested("db", "port")  # 5433
+"""
+
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from jsonpycraft.core.types import JSONMap
+from jsonpycraft.json.map import (
+    _MISSING,
+    JSONMapTemplate,
+    _prefix_trie,
+    _split_keys,
+)
+from jsonpycraft.json.patch import diff
+from jsonpycraft.json.path import KeyPath
+from jsonpycraft.json.schema import Schema
+
+_BITS = 5
+_MASK = (1 << _BITS) - 1
+# Hashes are treated as unsigned 64-bit integers
+_HASH_MASK = (1 << 64) - 1
+
+
+class _BitmapNode:
+    """A trie node holding (hash, key, value, sequence) leaves and child nodes in bitmap order."""
+
+    __slots__ = ("bitmap", "entries")
+
+    def __init__(self, bitmap: int, entries: tuple):
+        self.bitmap = bitmap
+        self.entries = entries
+
+
+class _CollisionNode:
+    """A trie node holding the (key, value, sequence) entries of distinct keys sharing a full hash."""
+
+    __slots__ = ("hash", "entries")
+
+    def __init__(self, hash_: int, entries: tuple):
+        self.hash = hash_
+        self.entries = entries
+
+
+_EMPTY_NODE = _BitmapNode(0, ())
+
+
+def _hash(key: Any) -> int:
+    return hash(key) & _HASH_MASK
+
+
+def _replace(entries: tuple, index: int, entry: Any) -> tuple:
+    return entries[:index] + (entry,) + entries[index + 1 :]
+
+
+def _merge_leaves(shift: int, first: tuple, second: tuple) -> _BitmapNode:
+    """Build the smallest subtree holding two leaves with different hashes."""
+    first_bit = 1 << ((first[0] >> shift) & _MASK)
+    second_bit = 1 << ((second[0] >> shift) & _MASK)
+    if first_bit == second_bit:
+        return _BitmapNode(first_bit, (_merge_leaves(shift + _BITS, first, second),))
+    if first_bit < second_bit:
+        return _BitmapNode(first_bit | second_bit, (first, second))
+    return _BitmapNode(first_bit | second_bit, (second, first))
+
+
+def _assoc(
+    node: Any, shift: int, hash_: int, key: Any, value: Any, sequence: int
+) -> Tuple[Any, bool]:
+    """Return the node with key set to value, and whether the key was added at sequence."""
+    if isinstance(node, _CollisionNode):
+        if hash_ != node.hash:
+            # Push the collision node one level down, next to the new leaf
+            bit = 1 << ((node.hash >> shift) & _MASK)
+            return _assoc(_BitmapNode(bit, (node,)), shift, hash_, key, value, sequence)
+        for index, (existing, current, position) in enumerate(node.entries):
+            if existing == key:
+                if current is value:
+                    return node, False
+                entries = _replace(node.entries, index, (key, value, position))
+                return _CollisionNode(hash_, entries), False
+        return _CollisionNode(hash_, node.entries + ((key, value, sequence),)), True
+
+    bit = 1 << ((hash_ >> shift) & _MASK)
+    index = (node.bitmap & (bit - 1)).bit_count()
+    entries = node.entries
+    if not node.bitmap & bit:
+        entries = entries[:index] + ((hash_, key, value, sequence),) + entries[index:]
+        return _BitmapNode(node.bitmap | bit, entries), True
+
+    entry = entries[index]
+    if isinstance(entry, tuple):
+        if entry[0] == hash_ and entry[1] == key:
+            if entry[2] is value:
+                return node, False
+            leaf = (hash_, key, value, entry[3])  # Updates keep their position
+            return _BitmapNode(node.bitmap, _replace(entries, index, leaf)), False
+        if entry[0] == hash_:
+            child = _CollisionNode(hash_, (entry[1:], (key, value, sequence)))
+        else:
+            child = _merge_leaves(shift + _BITS, entry, (hash_, key, value, sequence))
+        return _BitmapNode(node.bitmap, _replace(entries, index, child)), True
+
+    child, added = _assoc(entry, shift + _BITS, hash_, key, value, sequence)
+    if child is entry:
+        return node, added
+    return _BitmapNode(node.bitmap, _replace(entries, index, child)), added
+
+
+def _dissoc(node: Any, shift: int, hash_: int, key: Any) -> Any:
+    """
+    Return the entry replacing node once key is removed.
+
+    The result is node itself if the key is missing, None if the node became empty, or a single
+    (hash, key, value, sequence) leaf which the parent stores in place of the node.
+    """
+    if isinstance(node, _CollisionNode):
+        if hash_ != node.hash:
+            return node
+        entries = tuple(pair for pair in node.entries if pair[0] != key)
+        if len(entries) == len(node.entries):
+            return node
+        if len(entries) == 1:
+            return (hash_,) + entries[0]
+        return _CollisionNode(hash_, entries)
+
+    bit = 1 << ((hash_ >> shift) & _MASK)
+    if not node.bitmap & bit:
+        return node
+    index = (node.bitmap & (bit - 1)).bit_count()
+    entry = node.entries[index]
+    if isinstance(entry, tuple):
+        if entry[0] != hash_ or entry[1] != key:
+            return node
+        child = None
+    else:
+        child = _dissoc(entry, shift + _BITS, hash_, key)
+        if child is entry:
+            return node
+
+    if child is None:
+        bitmap = node.bitmap & ~bit
+        entries = node.entries[:index] + node.entries[index + 1 :]
+        if not entries:
+            return None
+        if len(entries) == 1 and isinstance(entries[0], tuple) and shift:
+            return entries[0]  # Collapse into the parent
+        return _BitmapNode(bitmap, entries)
+    return _BitmapNode(node.bitmap, _replace(node.entries, index, child))
+
+
+def _build(leaves: List[tuple], shift: int) -> Any:
+    """Build a node for leaves sharing the hash bits below shift, without path copying."""
+    buckets = {}
+    for leaf in leaves:
+        buckets.setdefault((leaf[0] >> shift) & _MASK, []).append(leaf)
+
+    bitmap = 0
+    entries = []
+    for slot in sorted(buckets):
+        bucket = buckets[slot]
+        bitmap |= 1 << slot
+        if len(bucket) == 1:
+            entries.append(bucket[0])
+        elif all(leaf[0] == bucket[0][0] for leaf in bucket):
+            pairs = tuple(leaf[1:] for leaf in bucket)
+            entries.append(_CollisionNode(bucket[0][0], pairs))
+        else:
+            entries.append(_build(bucket, shift + _BITS))
+    return _BitmapNode(bitmap, tuple(entries))
+
+
+class PersistentMap(Mapping):
+    """
+    An immutable hash array mapped trie implementing the Mapping interface.
+
+    `set` and `delete` return new maps sharing all untouched nodes with the original. Keys are
+    iterated in insertion order.
+
+    Attributes:
+        _root (_BitmapNode): The root node of the trie.
+        _size (int): The number of keys in the map.
+        _next (int): The sequence number of the next inserted key.
+    """
+
+    __slots__ = ("_root", "_size", "_next")
+
+    def __init__(
+        self, items: Optional[Union[Mapping, Iterable[Tuple[Any, Any]]]] = None
+    ):
+        """
+        Initialize a PersistentMap instance.
+
+        Args:
+            items (Optional[Union[Mapping, Iterable[Tuple[Any, Any]]]]): The initial keys and values. Values are stored as given.
+        """
+        pairs = dict(items) if items else {}
+        if pairs:
+            leaves = [
+                (_hash(key), key, value, sequence)
+                for sequence, (key, value) in enumerate(pairs.items())
+            ]
+            self._root = _build(leaves, 0)
+        else:
+            self._root = _EMPTY_NODE
+        self._size = len(pairs)
+        self._next = len(pairs)
+
+    @classmethod
+    def _from_root(cls, root: _BitmapNode, size: int, next_: int) -> "PersistentMap":
+        instance = cls.__new__(cls)
+        instance._root = root
+        instance._size = size
+        instance._next = next_
+        return instance
+
+    def set(self, key: Any, value: Any) -> "PersistentMap":
+        """
+        Return a new map with key set to value.
+
+        Args:
+            key (Any): The hashable key.
+            value (Any): The value.
+
+        Returns:
+            PersistentMap: The new version, or this map if the key already holds this exact value.
+        """
+        root, added = _assoc(self._root, 0, _hash(key), key, value, self._next)
+        if root is self._root:
+            return self
+        return self._from_root(root, self._size + added, self._next + added)
+
+    def delete(self, key: Any) -> "PersistentMap":
+        """
+        Return a new map without key.
+
+        Args:
+            key (Any): The key to remove.
+
+        Returns:
+            PersistentMap: The new version.
+
+        Raises:
+            KeyError: If the key is not present.
+        """
+        root = _dissoc(self._root, 0, _hash(key), key)
+        if root is self._root:
+            raise KeyError(key)
+        if root is None:
+            root = _EMPTY_NODE
+        return self._from_root(root, self._size - 1, self._next)
+
+    def __getitem__(self, key: Any) -> Any:
+        hash_ = _hash(key)
+        node = self._root
+        shift = 0
+        while True:
+            if isinstance(node, _CollisionNode):
+                for existing, value, _ in node.entries:
+                    if existing == key:
+                        return value
+                raise KeyError(key)
+            bit = 1 << ((hash_ >> shift) & _MASK)
+            if not node.bitmap & bit:
+                raise KeyError(key)
+            node = node.entries[(node.bitmap & (bit - 1)).bit_count()]
+            if isinstance(node, tuple):
+                if node[0] == hash_ and node[1] == key:
+                    return node[2]
+                raise KeyError(key)
+            shift += _BITS
+
+    def __contains__(self, key: Any) -> bool:
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator:
+        for key, _ in self._pairs():
+            yield key
+
+    def _pairs(self) -> Iterator[Tuple[Any, Any]]:
+        """Yield the (key, value) pairs in insertion order."""
+        leaves = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, _CollisionNode):
+                leaves.extend((entry[2], entry[0], entry[1]) for entry in node.entries)
+                continue
+            for entry in node.entries:
+                if isinstance(entry, tuple):
+                    leaves.append((entry[3], entry[1], entry[2]))
+                else:
+                    stack.append(entry)
+        leaves.sort(key=itemgetter(0))
+        for _, key, value in leaves:
+            yield key, value
+
+    def items(self):
+        return dict(self._pairs()).items()
+
+    def __repr__(self) -> str:
+        return f"PersistentMap({dict(self._pairs())!r})"
+
+
+EMPTY = PersistentMap()
+
+
+def _convert(
+    value: Any,
+    children: Callable[[Any], Optional[Iterable[Tuple[Any, Any]]]],
+    build: Callable[[Any, List[Tuple[Any, Any]]], Any],
+) -> Any:
+    """
+    Rebuild a nested structure bottom-up with an explicit stack, so deep trees never hit the
+    recursion limit.
+
+    Args:
+        value (Any): The structure to convert.
+        children (Callable): Returns the (key, item) pairs of a container, or None for a leaf.
+        build (Callable): Builds the converted container from the original and its converted pairs.
+
+    Returns:
+        Any: The converted structure.
+    """
+    pairs = children(value)
+    if pairs is None:
+        return value
+    # Each frame holds a container, its remaining pairs, its converted pairs and its key
+    stack = [(value, iter(pairs), [], None)]
+    while True:
+        container, remaining, converted, key = stack[-1]
+        for child_key, item in remaining:
+            child_pairs = children(item)
+            if child_pairs is not None:
+                stack.append((item, iter(child_pairs), [], child_key))
+                break
+            converted.append((child_key, item))
+        else:
+            stack.pop()
+            result = build(container, converted)
+            if not stack:
+                return result
+            stack[-1][2].append((key, result))
+
+
+def _frozen_children(value: Any) -> Optional[Iterable[Tuple[Any, Any]]]:
+    if isinstance(value, dict):
+        return value.items()
+    if isinstance(value, (list, tuple)):
+        return enumerate(value)
+    return None
+
+
+def _build_frozen(value: Any, pairs: List[Tuple[Any, Any]]) -> Any:
+    if isinstance(value, dict):
+        return PersistentMap(dict(pairs))
+    return tuple(item for _, item in pairs)
+
+
+def _thawed_children(value: Any) -> Optional[Iterable[Tuple[Any, Any]]]:
+    if isinstance(value, PersistentMap):
+        return value._pairs()
+    if isinstance(value, dict):
+        return value.items()
+    if isinstance(value, (tuple, list)):
+        return enumerate(value)
+    return None
+
+
+def _build_thawed(value: Any, pairs: List[Tuple[Any, Any]]) -> Any:
+    if isinstance(value, (tuple, list)):
+        return [item for _, item in pairs]
+    return dict(pairs)
+
+
+def freeze(value: Any) -> Any:
+    """
+    Convert a JSON structure into nested persistent maps and tuples.
+
+    Args:
+        value (Any): The structure to convert.
+
+    Returns:
+        Any: The immutable equivalent. Persistent maps are returned as they are.
+    """
+    return _convert(value, _frozen_children, _build_frozen)
+
+
+def thaw(value: Any) -> Any:
+    """
+    Convert nested persistent maps and tuples back into dictionaries and lists.
+
+    Args:
+        value (Any): The structure to convert.
+
+    Returns:
+        Any: The mutable JSON equivalent.
+    """
+    return _convert(value, _thawed_children, _build_thawed)
+
+
+class PersistentMapTemplate(JSONMapTemplate):
+    """
+    A JSONMapTemplate whose data is an immutable, structurally shared map.
+
+    Each mutation builds a new version by copying only the nodes on the mutated path, so
+    snapshots are O(1) and remain consistent while the template keeps changing. `merge`,
+    `diff` and `apply_patch` operate on a mutable copy and cost O(n).
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        initial_data: Optional[JSONMap] = None,
+        indexed: bool = False,
+        schema: Optional[Union[Schema, JSONMap]] = None,
+    ):
+        """
+        Initializes the PersistentMapTemplate.
+
+        Args:
+            file_path (str): The path to the JSON file.
+            initial_data (Optional[JSONMap]): Optional initial data to populate the mapping.
+            indexed (bool): Keep a flattened index of nested reads. Defaults to False.
+            schema (Optional[Union[Schema, JSONMap]]): A schema validated on load and save. Defaults to None.
+        """
+        super(PersistentMapTemplate, self).__init__(
+            file_path, initial_data, indexed, schema
+        )
+        self._data = freeze(self._data)
+
+    def _from_json(self, data: JSONMap) -> PersistentMap:
+        return freeze(data)
+
+    def _to_json(self, data: PersistentMap) -> JSONMap:
+        return thaw(data)
+
+    def snapshot(self) -> PersistentMap:
+        """
+        Get the current version of the mapping.
+
+        Returns:
+            PersistentMap: An immutable view which never observes later mutations.
+        """
+        return self._data
+
+    def _rebuild(self, nodes: List[PersistentMap], parent: Tuple, node: Any) -> None:
+        """Copy the path from a rebuilt node back to the root and publish the new version."""
+        for key, ancestor in zip(reversed(parent), reversed(nodes)):
+            node = ancestor.set(key, node)
+        self._data = node
+
+    def create(self, key: str, value: Any) -> bool:
+        """Create a new key-value pair in a new version. See JSONMapTemplate.create."""
+        if key in self._data:
+            return False
+        self._data = self._data.set(key, freeze(value))
+        self._touch((), key)
+        return True
+
+    def create_nested(self, value: Any, *keys: Union[str, KeyPath]) -> bool:
+        """
+        Create a nested key-value pair in a new version, creating missing intermediate maps.
+
+        Args:
+            value (Any): The value of the pair.
+            keys (Union[str, KeyPath]): The keys hierarchy for the nested pair, or a single KeyPath.
+
+        Returns:
+            bool: True if the pair was created, False if a key in the hierarchy holds a value which is not a map or if the final key already exists.
+        """
+        parent, last_key = _split_keys(keys)
+
+        nodes = []
+        node = self._data
+        created = None
+        for depth, key in enumerate(parent):
+            nodes.append(node)
+            child = node.get(key, _MISSING)
+            if child is _MISSING:
+                child = EMPTY
+                if created is None:
+                    created = depth
+            elif not isinstance(child, PersistentMap):
+                return False
+            node = child
+
+        if last_key in node:
+            return False
+        self._rebuild(nodes, parent, node.set(last_key, freeze(value)))
+        self._touch(parent, last_key, created)
+        return True
+
+    def update(self, key: str, value: Any) -> bool:
+        """Update or create a key-value pair in a new version. See JSONMapTemplate.update."""
+        self._data = self._data.set(key, freeze(value))
+        self._touch((), key)
+        return True
+
+    def update_nested(
+        self, value: Any, *keys: Union[str, KeyPath], overwrite: bool = False
+    ) -> bool:
+        """
+        Update a nested value by copying only the dictionaries on its path.
+
+        The previous version, and any snapshot of it, is left unchanged. See JSONMapTemplate.update_nested.
+
+        Args:
+            value (Any): The value to associate with the nested keys hierarchy.
+            keys (Union[str, KeyPath]): The keys hierarchy for the nested value, or a single KeyPath.
+            overwrite (bool): Overwrite exiting non-empty dictionaries. Default is False.
+
+        Returns:
+            bool: Always True.
+
+        Raises:
+            ValueError: If no keys are given.
+            TypeError: If a key is not a valid type.
+        """
+        parent, last_key = _split_keys(keys)
+
+        nodes = []
+        node = self._data
+        replaced = None
+        for depth, key in enumerate(parent):
+            nodes.append(node)
+            child = node.get(key)
+            if overwrite or not isinstance(child, PersistentMap):
+                child = EMPTY
+                if replaced is None:
+                    replaced = depth
+            node = child
+
+        self._rebuild(nodes, parent, node.set(last_key, freeze(value)))
+        self._touch(parent, last_key, replaced)
+        return True
+
+    def delete(self, key: str) -> bool:
+        """Delete a key-value pair in a new version. See JSONMapTemplate.delete."""
+        if key not in self._data:
+            return False
+        self._data = self._data.delete(key)
+        self._touch((), key)
+        return True
+
+    def delete_nested(self, *keys: Union[str, KeyPath]) -> bool:
+        """Delete a nested key-value pair in a new version. See JSONMapTemplate.delete_nested."""
+        parent, last_key = _split_keys(keys)
+
+        nodes = []
+        node = self._data
+        for key in parent:
+            nodes.append(node)
+            node = node.get(key)
+            if not isinstance(node, PersistentMap):
+                return False
+
+        if last_key not in node:
+            return False
+        self._rebuild(nodes, parent, node.delete(last_key))
+        self._touch(parent, last_key)
+        return True
+
+    def update_many(
+        self, updates: Mapping[Union[str, Sequence[str], KeyPath], Any]
+    ) -> int:
+        """Update many nested values in a single new version. See JSONMapTemplate.update_many."""
+        trie = _prefix_trie(updates.items())
+        count = 0
+
+        def apply(node: PersistentMap, children: dict, parent: Tuple) -> PersistentMap:
+            nonlocal count
+            for key, (value, subtrie) in children.items():
+                if value is not _MISSING:
+                    node = node.set(key, freeze(value))
+                    self._touch(parent, key)
+                    count += 1
+                if subtrie:
+                    child = node.get(key)
+                    if not isinstance(child, PersistentMap):
+                        child = EMPTY
+                        self._touch(parent, key)
+                    node = node.set(key, apply(child, subtrie, parent + (key,)))
+            return node
+
+        # The new version is published only once every update succeeded
+        with self._batch():
+            self._data = apply(self._data, trie, ())
+        return count
+
+    def delete_many(self, paths: Iterable[Union[str, Sequence[str], KeyPath]]) -> int:
+        """Delete many nested key-value pairs in a single new version. See JSONMapTemplate.delete_many."""
+        trie = _prefix_trie((path, True) for path in paths)
+        count = 0
+
+        def apply(node: PersistentMap, children: dict, parent: Tuple) -> PersistentMap:
+            nonlocal count
+            for key, (flag, subtrie) in children.items():
+                child = node.get(key, _MISSING)
+                if child is _MISSING:
+                    continue
+                if flag is not _MISSING:
+                    # Deleting the key also deletes every deeper path under it
+                    count += 1 + _count_paths(child, subtrie)
+                    node = node.delete(key)
+                    self._touch(parent, key)
+                elif subtrie and isinstance(child, PersistentMap):
+                    node = node.set(key, apply(child, subtrie, parent + (key,)))
+            return node
+
+        with self._batch():
+            self._data = apply(self._data, trie, ())
+        return count
+
+    def _mutable(self, method, *args, **kwargs) -> Any:
+        """Run a JSONMapTemplate method on a mutable copy, publishing the result as a new version."""
+        original = self._data
+        self._data = thaw(original)
+        try:
+            result = method(*args, **kwargs)
+        except Exception:
+            self._data = original
+            raise
+        self._data = freeze(self._data)
+        return result
+
+    def merge(
+        self,
+        other: Union[JSONMap, JSONMapTemplate],
+        strategy: str = "overwrite",
+        list_strategy: Optional[str] = None,
+        overrides: Optional[Mapping[Union[str, Sequence[str], KeyPath], str]] = None,
+    ) -> int:
+        """Deep merge another mapping into a new version. See JSONMapTemplate.merge."""
+        source = other._data if isinstance(other, JSONMapTemplate) else other
+        return self._mutable(
+            super(PersistentMapTemplate, self).merge,
+            thaw(source),
+            strategy=strategy,
+            list_strategy=list_strategy,
+            overrides=overrides,
+        )
+
+    def diff(self, other: Union[JSONMap, JSONMapTemplate]) -> List[JSONMap]:
+        """Compute the JSON Patch operations turning this mapping into another. See JSONMapTemplate.diff."""
+        target = other._data if isinstance(other, JSONMapTemplate) else other
+        # Reading only, so the current version is left in place
+        return diff(thaw(self._data), thaw(target))
+
+    def apply_patch(self, patch: List[JSONMap]) -> None:
+        """Apply JSON Patch operations to a new version. See JSONMapTemplate.apply_patch."""
+        self._mutable(super(PersistentMapTemplate, self).apply_patch, patch)
+
+
+def _count_paths(node: Any, children: dict) -> int:
+    """Count the requested paths which exist below a node about to be deleted."""
+    count = 0
+    stack = [(node, children)]
+    while stack:
+        node, children = stack.pop()
+        if not isinstance(node, PersistentMap):
+            continue
+        for key, (flag, subtrie) in children.items():
+            child = node.get(key, _MISSING)
+            if child is _MISSING:
+                continue
+            if flag is not _MISSING:
+                count += 1
+            if subtrie:
+                stack.append((child, subtrie))
+    return count
@@ -0,0 +1,229 @@
+"""
+jsonpycraft/json/query.py
+
+Compiled wildcard path patterns for querying nested JSON structures.
+
+A pattern is a dot-separated sequence of segments:
+- `name`: The value of a dictionary key.
+- `*`: Every value one level down, either a dictionary value or a list item.
+- `**`: Zero or more levels down.
+- `name[0]`, `name[-1]`: A list item by index, after the key. Brackets can be chained.
+- `name[1:3]`, `name[::2]`: List items by slice.
+- `name[*]`: Every list item.
+
+Patterns are compiled once and cached. Matching walks the structure with an explicit stack,
+only descends into children the next segment can match, and yields matches lazily.
+
+Example Usage:
+    from jsonpycraft.json.query import query
+
+    config = {"services": {"api": {"port": 80}, "db": {"port": 5432}}}
+    for path, port in query(config, "services.*.port"):
+        print(path, port)  # services.api 80, then services.db 5432
+"""
+
+import re
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, Iterator, Tuple
+
+from jsonpycraft.json.path import PATH_CACHE_SIZE, KeyPath
+
+# Step kinds of a compiled pattern
+_KEY = "key"
+_ANY = "any"
+_DEEP = "deep"
+_INDEX = "index"
+_SLICE = "slice"
+_ITEMS = "items"
+
+_SEGMENT = re.compile(r"^(?P<name>[^\[\]]*)(?P<brackets>(?:\[[^\[\]]*\])*)$")
+_BRACKET = re.compile(r"\[([^\[\]]*)\]")
+
+# Sentinel for a missing dictionary key
+_MISSING = object()
+
+
+def _children(node: Any) -> Any:
+    """Return the (key, child) pairs of a container, or None for a leaf."""
+    if isinstance(node, dict):
+        return node.items()
+    if isinstance(node, (list, tuple)):
+        return enumerate(node)
+    if isinstance(node, Mapping):
+        return node.items()
+    return None
+
+
+def _is_container(node: Any) -> bool:
+    return isinstance(node, (dict, list, tuple, Mapping))
+
+
+class PathPattern:
+    """
+    A compiled wildcard path pattern.
+
+    Attributes:
+        pattern (str): The source pattern.
+        steps (Tuple[Tuple, ...]): The compiled (kind, argument) steps.
+    """
+
+    __slots__ = ("pattern", "steps", "_deep")
+
+    def __init__(self, pattern: str):
+        """
+        Compile a pattern. Prefer PathPattern.compile, which caches compiled patterns.
+
+        Args:
+            pattern (str): The dotted wildcard pattern.
+
+        Raises:
+            ValueError: If the pattern is empty or a segment is invalid.
+        """
+        if not pattern:
+            raise ValueError("Pattern is empty")
+
+        steps = []
+        for segment in pattern.split("."):
+            match = _SEGMENT.match(segment)
+            if match is None:
+                raise ValueError(f"Invalid pattern segment: {segment!r}")
+            name, brackets = match.group("name"), match.group("brackets")
+            if name == "**":
+                if brackets:
+                    raise ValueError(f"Invalid pattern segment: {segment!r}")
+                if not steps or steps[-1] != (_DEEP, None):
+                    steps.append((_DEEP, None))  # Repeated ** match the same paths
+                continue
+            if name == "*":
+                steps.append((_ANY, None))
+            elif name:
+                steps.append((_KEY, name))
+            elif not brackets:
+                raise ValueError(f"Invalid pattern segment: {segment!r}")
+            for selector in _BRACKET.findall(brackets):
+                steps.append(_compile_selector(selector, segment))
+
+        self.pattern = pattern
+        self.steps = tuple(steps)
+        self._deep = sum(1 for kind, _ in steps if kind == _DEEP)
+
+    @classmethod
+    def compile(cls, pattern: str) -> "PathPattern":
+        """
+        Compile a pattern, reusing a cached compilation when available.
+
+        Args:
+            pattern (str): The dotted wildcard pattern.
+
+        Returns:
+            PathPattern: The compiled pattern.
+
+        Raises:
+            ValueError: If the pattern is empty or a segment is invalid.
+        """
+        return _compile(pattern)
+
+    def match(self, data: Any) -> Iterator[Tuple[KeyPath, Any]]:
+        """
+        Lazily yield every path in data matching the pattern, depth first.
+
+        Args:
+            data (Any): The structure to search.
+
+        Yields:
+            Tuple[KeyPath, Any]: The path and value of each match.
+        """
+        steps = self.steps
+        end = len(steps)
+        # With more than one **, a path can be reached in several ways
+        seen = set() if self._deep > 1 else None
+        stack = [(data, 0, ())]
+        while stack:
+            node, position, keys = stack.pop()
+            if position == end:
+                if seen is not None:
+                    if keys in seen:
+                        continue
+                    seen.add(keys)
+                yield KeyPath(keys), node
+                continue
+
+            kind, argument = steps[position]
+            following = position + 1
+            if kind == _KEY:
+                if isinstance(node, (dict, Mapping)):
+                    child = node.get(argument, _MISSING)
+                    if child is not _MISSING:
+                        stack.append((child, following, keys + (argument,)))
+            elif kind == _DEEP:
+                children = _children(node)
+                if children is not None:
+                    # Descend further while still allowed to match here, children first in order
+                    for key, child in reversed(list(children)):
+                        if _is_container(child) or following == end:
+                            stack.append((child, position, keys + (key,)))
+                stack.append((node, following, keys))
+            elif isinstance(node, (list, tuple)):
+                if kind == _INDEX:
+                    index = argument + len(node) if argument < 0 else argument
+                    if 0 <= index < len(node):
+                        stack.append((node[index], following, keys + (index,)))
+                    continue
+                indices = range(len(node))
+                if kind == _SLICE:
+                    indices = indices[argument]
+                for index in reversed(indices):
+                    child = node[index]
+                    if following == end or _is_container(child):
+                        stack.append((child, following, keys + (index,)))
+            elif kind == _ANY:
+                children = _children(node)
+                if children is not None:
+                    for key, child in reversed(list(children)):
+                        if following == end or _is_container(child):
+                            stack.append((child, following, keys + (key,)))
+
+    def __repr__(self) -> str:
+        return f"PathPattern({self.pattern!r})"
+
+
+def _compile_selector(selector: str, segment: str) -> Tuple[str, Any]:
+    """Compile the contents of a bracket into an index, slice or items step."""
+    selector = selector.strip()
+    try:
+        if selector == "*":
+            return (_ITEMS, None)
+        if ":" in selector:
+            parts = selector.split(":")
+            if len(parts) > 3:
+                raise ValueError
+            bounds = [int(part) if part.strip() else None for part in parts]
+            if len(bounds) == 3 and bounds[2] == 0:
+                raise ValueError
+            return (_SLICE, slice(*bounds))
+        return (_INDEX, int(selector))
+    except ValueError:
+        raise ValueError(f"Invalid pattern segment: {segment!r}")
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def _compile(pattern: str) -> PathPattern:
+    return PathPattern(pattern)
+
+
+def query(data: Any, pattern: str) -> Iterator[Tuple[KeyPath, Any]]:
+    """
+    Lazily yield every path in data matching a wildcard pattern.
+
+    Args:
+        data (Any): The structure to search.
+        pattern (str): The dotted wildcard pattern.
+
+    Yields:
+        Tuple[KeyPath, Any]: The path and value of each match.
+
+    Raises:
+        ValueError: If the pattern is empty or a segment is invalid.
+    """
+    return PathPattern.compile(pattern).match(data)
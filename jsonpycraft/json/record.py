@@ -0,0 +1,228 @@
+"""
+jsonpycraft/json/record.py
+
+Slotted record classes generated from a record schema or from sample data.
+
+A record class stores each field of a fixed-shape JSON object in a `__slots__` attribute
+instead of a dictionary entry, so records take a fraction of the memory of the dictionaries
+they replace and fields are read with plain attribute access. `JSONListTemplate` converts
+records on load and back to dictionaries on save when given a `record_type`.
+
+Only the top level of a record is typed: nested objects and arrays stay dictionaries and lists.
+Optional fields missing from a record are left unset, so converting a record back to a
+dictionary reproduces the original keys exactly.
+
+Example Usage:
+    from jsonpycraft.json.record import record_type_from_sample
+
+    User = record_type_from_sample([{"id": 1, "name": "Alice"}], name="User")
+    user = User.from_dict({"id": 2, "name": "Bob"})
+    user.name  # "Bob"
+    user.to_dict()  # {"id": 2, "name": "Bob"}
+"""
+
+import keyword
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple, Type, Union
+
+from jsonpycraft.core.types import JSONMap
+from jsonpycraft.json.schema import Schema
+
+# Sentinel for an optional field left unset
+_UNSET = object()
+
+
+class Record:
+    """
+    The base class of generated record classes.
+
+    Attributes:
+        _fields (Tuple[str, ...]): The field names, in order.
+        _required (frozenset): The names of the fields every record must have.
+        _setters (Dict[str, Callable]): The slot setter of each field, keyed by name.
+    """
+
+    __slots__ = ()
+    __hash__ = None  # Records are mutable, like the dictionaries they replace
+
+    _fields: Tuple[str, ...] = ()
+    _required: frozenset = frozenset()
+    _setters: Dict[str, Callable[[Any, Any], None]] = {}
+
+    @classmethod
+    def from_dict(cls, data: JSONMap) -> "Record":
+        """
+        Convert a dictionary into a record.
+
+        Args:
+            data (JSONMap): The dictionary, keyed by field name.
+
+        Returns:
+            Record: The record holding the dictionary values (not copies).
+
+        Raises:
+            ValueError: If a required field is missing or a key is not a field.
+        """
+        record = cls.__new__(cls)
+        setters = cls._setters
+        try:
+            for key, value in data.items():
+                setters[key](record, value)
+        except KeyError:
+            unexpected = next(key for key in data if key not in setters)
+            raise ValueError(f"Record {cls.__name__} has no field {unexpected!r}")
+        if not cls._required <= data.keys():
+            missing = next(
+                name
+                for name in cls._fields
+                if name in cls._required and name not in data
+            )
+            raise ValueError(f"Record {cls.__name__} is missing field {missing!r}")
+        return record
+
+    def to_dict(self) -> JSONMap:
+        """
+        Convert the record back into a dictionary.
+
+        Returns:
+            JSONMap: The fields which are set, in field order.
+        """
+        return {
+            name: value
+            for name in self._fields
+            if (value := getattr(self, name, _UNSET)) is not _UNSET
+        }
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get a field value by name, as with a dictionary.
+
+        Args:
+            key (str): The field name.
+            default (Any): The value returned if the field is unset or unknown. Defaults to None.
+
+        Returns:
+            Any: The field value, or default.
+        """
+        if key not in self._setters:
+            return default
+        return getattr(self, key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        # Lets key paths, such as those of JSONListTemplate.top_k, read records like dictionaries
+        if key in self._setters:
+            value = getattr(self, key, _UNSET)
+            if value is not _UNSET:
+                return value
+        raise KeyError(key)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            getattr(self, name, _UNSET) == getattr(other, name, _UNSET)
+            for name in self._fields
+        )
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={value!r}" for name, value in self.to_dict().items()
+        )
+        return f"{type(self).__name__}({fields})"
+
+
+def record_type(
+    name: str, fields: Sequence[str], required: Optional[Iterable[str]] = None
+) -> Type[Record]:
+    """
+    Generate a slotted record class.
+
+    Args:
+        name (str): The class name.
+        fields (Sequence[str]): The field names, in order.
+        required (Optional[Iterable[str]]): The fields every record must have. Defaults to all fields.
+
+    Returns:
+        Type[Record]: The generated class.
+
+    Raises:
+        ValueError: If a field name is not a valid identifier, is reserved or is repeated, or a required field is not a field.
+    """
+    fields = tuple(fields)
+    if len(set(fields)) != len(fields):
+        raise ValueError(f"Record {name} has repeated fields")
+    for field in fields:
+        if (
+            not isinstance(field, str)
+            or not field.isidentifier()
+            or keyword.iskeyword(field)
+            or field.startswith("_")
+            or hasattr(Record, field)
+        ):
+            raise ValueError(f"Invalid record field name: {field!r}")
+
+    required = frozenset(fields if required is None else required)
+    if not required <= set(fields):
+        raise ValueError(f"Record {name} requires fields it does not have")
+
+    cls = type(
+        name, (Record,), {"__slots__": fields, "_fields": fields, "_required": required}
+    )
+    # The slot descriptors set each field without going through attribute lookup
+    cls._setters = {field: getattr(cls, field).__set__ for field in fields}
+    return cls
+
+
+def record_type_from_schema(
+    schema: Union[Schema, JSONMap], name: str = "Record"
+) -> Type[Record]:
+    """
+    Generate a slotted record class from the `properties` and `required` keywords of a schema.
+
+    Args:
+        schema (Union[Schema, JSONMap]): An object schema, or an array schema whose `items` is an object schema.
+        name (str): The class name. Defaults to "Record".
+
+    Returns:
+        Type[Record]: The generated class.
+
+    Raises:
+        ValueError: If the schema has no properties, or a property name is not a valid field name.
+    """
+    if isinstance(schema, Schema):
+        schema = schema.schema
+    if "properties" not in schema and isinstance(schema.get("items"), dict):
+        schema = schema["items"]
+    properties = schema.get("properties")
+    if not properties:
+        raise ValueError("The schema has no properties")
+    return record_type(name, list(properties), schema.get("required", ()))
+
+
+def record_type_from_sample(
+    records: Iterable[JSONMap], name: str = "Record"
+) -> Type[Record]:
+    """
+    Generate a slotted record class from sample records.
+
+    Fields are ordered as they first appear. Fields present in every sample are required.
+
+    Args:
+        records (Iterable[JSONMap]): The sample records.
+        name (str): The class name. Defaults to "Record".
+
+    Returns:
+        Type[Record]: The generated class.
+
+    Raises:
+        ValueError: If there are no samples, or a key is not a valid field name.
+    """
+    fields: Dict[str, int] = {}
+    count = 0
+    for record in records:
+        for key in record:
+            fields[key] = fields.get(key, 0) + 1
+        count += 1
+    if not count:
+        raise ValueError("At least one sample record is required")
+    required = [field for field, seen in fields.items() if seen == count]
+    return record_type(name, list(fields), required)
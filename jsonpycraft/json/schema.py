@@ -0,0 +1,555 @@
+"""
+jsonpycraft/json/schema.py
+
+Compiled validation for a subset of JSON Schema.
+
+A `Schema` compiles its schema once into nested closures specialized for the keywords actually
+present, so validating a document runs only the checks it needs, without interpreting the
+schema again. Validation either collects every error or stops at the first one, which is all
+`is_valid` and the template hooks need.
+
+Supported keywords:
+- Any value: `type`, `enum`, `const`, `allOf`, `anyOf`, `oneOf`.
+- Numbers: `minimum`, `maximum`, `exclusiveMinimum`, `exclusiveMaximum`, `multipleOf`.
+- Strings: `minLength`, `maxLength`, `pattern`.
+- Arrays: `items`, `minItems`, `maxItems`, `uniqueItems`.
+- Objects: `properties`, `required`, `additionalProperties`, `minProperties`, `maxProperties`.
+
+Annotations such as `title`, `description` and `default` are ignored. Any other keyword, such as
+`$ref`, raises ValueError when the schema is compiled.
+
+Example Usage:
+    from jsonpycraft.json.schema import Schema
+
+    schema = Schema({
+        "type": "object",
+        "properties": {"port": {"type": "integer", "minimum": 1}},
+        "required": ["port"],
+    })
+    schema.is_valid({"port": 8080})  # True
+    schema.errors({"port": 0})  # ["Value 0 is less than the minimum of 1 at /port"]
+"""
+
+import re
+from typing import Any, Callable, List, Optional
+
+from jsonpycraft.core.errors import JSONSchemaErrorHandler
+from jsonpycraft.core.types import JSONMap
+
+# A compiled check called with (value, path, errors), where path is a linked (parent, key) pair
+Check = Callable[[Any, Any, "_Errors"], None]
+
+_ANNOTATIONS = frozenset(
+    (
+        "$schema",
+        "$id",
+        "$comment",
+        "$defs",
+        "definitions",
+        "title",
+        "description",
+        "default",
+        "examples",
+        "deprecated",
+        "readOnly",
+        "writeOnly",
+    )
+)
+
+
+def _is_integer(value: Any) -> bool:
+    return type(value) is int or (type(value) is float and value.is_integer())
+
+
+def _is_number(value: Any) -> bool:
+    return type(value) in (int, float)
+
+
+_TYPES = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "integer": _is_integer,
+    "number": _is_number,
+    "boolean": lambda value: type(value) is bool,
+    "null": lambda value: value is None,
+}
+
+
+class _Errors(list):
+    """Collected error messages, raising _Stop after the first one in fail-fast mode."""
+
+    __slots__ = ("first",)
+
+    def __init__(self, first: bool):
+        super(_Errors, self).__init__()
+        self.first = first
+
+
+class _Stop(Exception):
+    """Raised to unwind validation at the first error."""
+
+
+def _pointer(path: Any) -> str:
+    keys = []
+    while path is not None:
+        path, key = path
+        keys.append(str(key).replace("~", "~0").replace("/", "~1"))
+    # The root is the empty pointer, as in RFC 6901
+    return "".join("/" + key for key in reversed(keys))
+
+
+def _fail(errors: _Errors, path: Any, message: str) -> None:
+    pointer = _pointer(path)
+    errors.append(f"{message} at {pointer}" if pointer else f'{message} at ""')
+    if errors.first:
+        raise _Stop
+
+
+def _equal(first: Any, second: Any) -> bool:
+    """Compare JSON values, keeping booleans distinct from numbers."""
+    if isinstance(first, bool) or isinstance(second, bool):
+        return type(first) is type(second) and first == second
+    if isinstance(first, list) and isinstance(second, list):
+        return len(first) == len(second) and all(map(_equal, first, second))
+    if isinstance(first, dict) and isinstance(second, dict):
+        return first.keys() == second.keys() and all(
+            _equal(item, second[key]) for key, item in first.items()
+        )
+    return first == second
+
+
+def _accept(value: Any, path: Any, errors: _Errors) -> None:
+    pass
+
+
+def _unique_key(value: Any) -> Any:
+    """Return a hashable key which is equal for values that _equal considers equal."""
+    if isinstance(value, bool):
+        return (bool, value)
+    if isinstance(value, list):
+        return (list, tuple(_unique_key(item) for item in value))
+    if isinstance(value, dict):
+        return (
+            dict,
+            frozenset((key, _unique_key(item)) for key, item in value.items()),
+        )
+    # Numbers compare and hash equal across int and float, so 1 and 1.0 share a key
+    return (object, value)
+
+
+def _passes(check: Check, value: Any, path: Any) -> bool:
+    """Run a check in fail-fast mode without reporting its errors."""
+    try:
+        check(value, path, _Errors(True))
+    except _Stop:
+        return False
+    return True
+
+
+def _sequence(checks: List[Check]) -> Check:
+    if not checks:
+        return _accept
+    if len(checks) == 1:
+        return checks[0]
+
+    def check(value: Any, path: Any, errors: _Errors) -> None:
+        for item in checks:
+            item(value, path, errors)
+
+    return check
+
+
+def _compile_type(names: Any) -> Check:
+    names = [names] if isinstance(names, str) else list(names)
+    for name in names:
+        if name not in _TYPES:
+            raise ValueError(f"Invalid schema type: {name}")
+    expected = " or ".join(f"'{name}'" for name in names)
+
+    if len(names) == 1:
+        test = _TYPES[names[0]]
+    else:
+        tests = [_TYPES[name] for name in names]
+
+        def test(value: Any) -> bool:
+            return any(item(value) for item in tests)
+
+    def check(value: Any, path: Any, errors: _Errors) -> None:
+        if not test(value):
+            _fail(errors, path, f"Expected type {expected}")
+
+    return check
+
+
+def _compile_numbers(schema: JSONMap) -> List[Check]:
+    checks = []
+    bounds = (
+        ("minimum", lambda value, bound: value < bound, "less than the minimum of"),
+        ("maximum", lambda value, bound: value > bound, "greater than the maximum of"),
+        (
+            "exclusiveMinimum",
+            lambda value, bound: value <= bound,
+            "not greater than the exclusive minimum of",
+        ),
+        (
+            "exclusiveMaximum",
+            lambda value, bound: value >= bound,
+            "not less than the exclusive maximum of",
+        ),
+    )
+    for keyword, violates, message in bounds:
+        if keyword in schema:
+            bound = schema[keyword]
+            if not _is_number(bound):
+                raise ValueError(f"Invalid schema value for {keyword}: {bound}")
+
+            def check(
+                value, path, errors, bound=bound, violates=violates, message=message
+            ):
+                if _is_number(value) and violates(value, bound):
+                    _fail(errors, path, f"Value {value} is {message} {bound}")
+
+            checks.append(check)
+
+    if "multipleOf" in schema:
+        divisor = schema["multipleOf"]
+        if not _is_number(divisor) or divisor <= 0:
+            raise ValueError(f"Invalid schema value for multipleOf: {divisor}")
+
+        def check(value: Any, path: Any, errors: _Errors) -> None:
+            if _is_number(value) and not float(value / divisor).is_integer():
+                _fail(errors, path, f"Value {value} is not a multiple of {divisor}")
+
+        checks.append(check)
+    return checks
+
+
+def _compile_strings(schema: JSONMap) -> List[Check]:
+    checks = []
+    minimum = schema.get("minLength")
+    maximum = schema.get("maxLength")
+    if minimum is not None or maximum is not None:
+        low = 0 if minimum is None else minimum
+        high = float("inf") if maximum is None else maximum
+
+        def check(value: Any, path: Any, errors: _Errors) -> None:
+            if isinstance(value, str) and not low <= len(value) <= high:
+                _fail(
+                    errors,
+                    path,
+                    f"String length {len(value)} is outside [{low}, {high}]",
+                )
+
+        checks.append(check)
+
+    if "pattern" in schema:
+        search = re.compile(schema["pattern"]).search
+        pattern = schema["pattern"]
+
+        def check(value: Any, path: Any, errors: _Errors) -> None:
+            if isinstance(value, str) and search(value) is None:
+                _fail(errors, path, f"String does not match pattern '{pattern}'")
+
+        checks.append(check)
+    return checks
+
+
+def _compile_arrays(schema: JSONMap) -> List[Check]:
+    checks = []
+    minimum = schema.get("minItems")
+    maximum = schema.get("maxItems")
+    if minimum is not None or maximum is not None:
+        low = 0 if minimum is None else minimum
+        high = float("inf") if maximum is None else maximum
+
+        def check(value: Any, path: Any, errors: _Errors) -> None:
+            if isinstance(value, list) and not low <= len(value) <= high:
+                _fail(
+                    errors,
+                    path,
+                    f"Array length {len(value)} is outside [{low}, {high}]",
+                )
+
+        checks.append(check)
+
+    if schema.get("uniqueItems"):
+
+        def check(value: Any, path: Any, errors: _Errors) -> None:
+            if isinstance(value, list):
+                seen = set()
+                for item in value:
+                    marker = _unique_key(item)
+                    if marker in seen:
+                        _fail(errors, path, "Array items are not unique")
+                        return
+                    seen.add(marker)
+
+        checks.append(check)
+
+    if "items" in schema:
+        item_check = _compile(schema["items"])
+        if item_check is not _accept:
+
+            def check(value: Any, path: Any, errors: _Errors) -> None:
+                if isinstance(value, list):
+                    for index, item in enumerate(value):
+                        item_check(item, (path, index), errors)
+
+            checks.append(check)
+    return checks
+
+
+def _compile_objects(schema: JSONMap) -> List[Check]:
+    checks = []
+    required = tuple(schema.get("required", ()))
+    if required:
+
+        def check(value: Any, path: Any, errors: _Errors) -> None:
+            if isinstance(value, dict):
+                for key in required:
+                    if key not in value:
+                        _fail(errors, path, f"Missing required property '{key}'")
+
+        checks.append(check)
+
+    minimum = schema.get("minProperties")
+    maximum = schema.get("maxProperties")
+    if minimum is not None or maximum is not None:
+        low = 0 if minimum is None else minimum
+        high = float("inf") if maximum is None else maximum
+
+        def check(value: Any, path: Any, errors: _Errors) -> None:
+            if isinstance(value, dict) and not low <= len(value) <= high:
+                _fail(
+                    errors, path, f"Object size {len(value)} is outside [{low}, {high}]"
+                )
+
+        checks.append(check)
+
+    properties = {
+        key: _compile(subschema)
+        for key, subschema in schema.get("properties", {}).items()
+    }
+    additional = schema.get("additionalProperties", True)
+    if additional is True or additional == {}:
+        # Only the declared properties need visiting
+        declared = tuple(
+            (key, check) for key, check in properties.items() if check is not _accept
+        )
+        if declared:
+
+            def check(value: Any, path: Any, errors: _Errors) -> None:
+                if isinstance(value, dict):
+                    for key, property_check in declared:
+                        if key in value:
+                            property_check(value[key], (path, key), errors)
+
+            checks.append(check)
+    else:
+        additional_check = _compile(additional)
+
+        def check(value: Any, path: Any, errors: _Errors) -> None:
+            if isinstance(value, dict):
+                for key, item in value.items():
+                    property_check = properties.get(key)
+                    if property_check is None:
+                        if additional is False:
+                            _fail(
+                                errors,
+                                (path, key),
+                                "Additional property is not allowed",
+                            )
+                        else:
+                            additional_check(item, (path, key), errors)
+                    else:
+                        property_check(item, (path, key), errors)
+
+        checks.append(check)
+    return checks
+
+
+def _compile_combinators(schema: JSONMap) -> List[Check]:
+    checks = []
+    if "allOf" in schema:
+        checks.append(_sequence([_compile(item) for item in schema["allOf"]]))
+
+    if "anyOf" in schema:
+        options = [_compile(item) for item in schema["anyOf"]]
+
+        def check(value: Any, path: Any, errors: _Errors) -> None:
+            if not any(_passes(option, value, path) for option in options):
+                _fail(errors, path, "Value does not match any schema in anyOf")
+
+        checks.append(check)
+
+    if "oneOf" in schema:
+        choices = [_compile(item) for item in schema["oneOf"]]
+
+        def check(value: Any, path: Any, errors: _Errors) -> None:
+            matched = 0
+            for choice in choices:
+                if _passes(choice, value, path):
+                    matched += 1
+                    if matched > 1:
+                        break
+            if matched != 1:
+                _fail(
+                    errors,
+                    path,
+                    f"Value matches {matched} schemas in oneOf instead of 1",
+                )
+
+        checks.append(check)
+    return checks
+
+
+_KEYWORDS = frozenset(
+    (
+        "type",
+        "enum",
+        "const",
+        "allOf",
+        "anyOf",
+        "oneOf",
+        "minimum",
+        "maximum",
+        "exclusiveMinimum",
+        "exclusiveMaximum",
+        "multipleOf",
+        "minLength",
+        "maxLength",
+        "pattern",
+        "items",
+        "minItems",
+        "maxItems",
+        "uniqueItems",
+        "properties",
+        "required",
+        "additionalProperties",
+        "minProperties",
+        "maxProperties",
+    )
+)
+
+
+def _compile(schema: Any) -> Check:
+    """Compile a schema into a single check specialized for its keywords."""
+    if schema is True:
+        return _accept
+    if schema is False:
+        return lambda value, path, errors: _fail(errors, path, "No value is allowed")
+    if not isinstance(schema, dict):
+        raise ValueError(f"Invalid schema: {schema!r}")
+
+    unsupported = set(schema) - _KEYWORDS - _ANNOTATIONS
+    if unsupported:
+        raise ValueError(
+            f"Unsupported schema keywords: {', '.join(sorted(unsupported))}"
+        )
+
+    checks = []
+    if "type" in schema:
+        checks.append(_compile_type(schema["type"]))
+
+    if "enum" in schema:
+        options = list(schema["enum"])
+
+        def check(value: Any, path: Any, errors: _Errors) -> None:
+            if not any(_equal(value, option) for option in options):
+                _fail(errors, path, f"Value {value!r} is not one of {options!r}")
+
+        checks.append(check)
+
+    if "const" in schema:
+        constant = schema["const"]
+
+        def check(value: Any, path: Any, errors: _Errors) -> None:
+            if not _equal(value, constant):
+                _fail(errors, path, f"Value {value!r} is not {constant!r}")
+
+        checks.append(check)
+
+    checks.extend(_compile_numbers(schema))
+    checks.extend(_compile_strings(schema))
+    checks.extend(_compile_arrays(schema))
+    checks.extend(_compile_objects(schema))
+    checks.extend(_compile_combinators(schema))
+    return _sequence(checks)
+
+
+class Schema:
+    """
+    A JSON Schema compiled once into specialized validation closures.
+
+    Attributes:
+        schema (JSONMap): The source schema.
+        items (Optional[Schema]): The compiled schema of array items, if the schema has `items`.
+    """
+
+    __slots__ = ("schema", "items", "_check")
+
+    def __init__(self, schema: JSONMap):
+        """
+        Compile a schema.
+
+        Args:
+            schema (JSONMap): The JSON Schema, using the supported keywords.
+
+        Raises:
+            ValueError: If the schema is invalid or uses an unsupported keyword.
+        """
+        self.schema = schema
+        self._check = _compile(schema)
+        items = schema.get("items") if isinstance(schema, dict) else None
+        self.items: Optional[Schema] = Schema(items) if items is not None else None
+
+    def _run(self, data: Any, first: bool) -> List[str]:
+        errors = _Errors(first)
+        try:
+            self._check(data, None, errors)
+        except _Stop:
+            pass
+        return list(errors)
+
+    def is_valid(self, data: Any) -> bool:
+        """
+        Check whether data is valid, stopping at the first error.
+
+        Args:
+            data (Any): The JSON data to validate.
+
+        Returns:
+            bool: True if the data is valid.
+        """
+        return _passes(self._check, data, None)
+
+    def errors(self, data: Any) -> List[str]:
+        """
+        Collect every validation error.
+
+        Args:
+            data (Any): The JSON data to validate.
+
+        Returns:
+            List[str]: The error messages, each ending with the JSON Pointer of the invalid value.
+        """
+        return self._run(data, first=False)
+
+    def validate(self, data: Any, all_errors: bool = False) -> None:
+        """
+        Validate data, raising on failure.
+
+        Args:
+            data (Any): The JSON data to validate.
+            all_errors (bool): Report every error instead of stopping at the first one. Defaults to False.
+
+        Raises:
+            JSONSchemaErrorHandler: If the data is invalid.
+        """
+        errors = self._run(data, not all_errors)
+        if errors:
+            raise JSONSchemaErrorHandler("; ".join(errors))
+
+    def __repr__(self) -> str:
+        return f"Schema({self.schema!r})"
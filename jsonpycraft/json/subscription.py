@@ -0,0 +1,175 @@
+"""
+jsonpycraft/json/subscription.py
+
+Path-scoped change subscriptions dispatched through a prefix trie.
+
+Callbacks are registered under a key path prefix, where a `*` segment matches any single key.
+A change at a path notifies the callbacks registered at the path, at any of its ancestors, and
+at any of its descendants, since replacing a subtree changes every value below it. Finding the
+listeners of a change walks the trie along the changed path, so the cost depends on the depth
+of the path rather than on the number of subscriptions.
+
+Example Usage:
+    from jsonpycraft.json.subscription import Subscriptions
+
+    subscriptions = Subscriptions()
+    subscriptions.add("db.*", lambda paths: print("rebuild pool", paths))
+    subscriptions.dispatch([("db", "port")])  # rebuild pool [KeyPath(('db', 'port'))]
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple, Union
+
+from jsonpycraft.json.path import KeyPath
+
+# A prefix segment matching any single key
+WILDCARD = "*"
+
+# A subscriber called with the changed paths
+Callback = Callable[[List[KeyPath]], Any]
+
+
+def _prefix_keys(prefix: Union[str, Sequence[Union[str, int]], KeyPath]) -> Tuple:
+    """Return the keys of a subscription prefix, where the empty string is the root."""
+    if isinstance(prefix, str) and not prefix:
+        return ()
+    return KeyPath.coerce(prefix).keys
+
+
+class Subscriptions:
+    """
+    A prefix trie of change callbacks keyed by path.
+
+    Each trie node is a [callbacks, children] pair.
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self):
+        self._root: List = [[], {}]
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(
+        self,
+        prefix: Union[str, Sequence[Union[str, int]], KeyPath],
+        callback: Callback,
+    ) -> None:
+        """
+        Register a callback for changes at, above or below a path.
+
+        Args:
+            prefix (Union[str, Sequence[Union[str, int]], KeyPath]): A dotted key path, JSON Pointer, sequence of keys or KeyPath. `*` segments match any key, and the empty string matches every change.
+            callback (Callback): Called with the list of changed paths.
+
+        Raises:
+            TypeError: If a key is not a valid type.
+        """
+        node = self._root
+        for key in _prefix_keys(prefix):
+            children = node[1]
+            child = children.get(key)
+            if child is None:
+                child = children[key] = [[], {}]
+            node = child
+        node[0].append(callback)
+        self._size += 1
+
+    def remove(
+        self,
+        prefix: Union[str, Sequence[Union[str, int]], KeyPath],
+        callback: Callback,
+    ) -> bool:
+        """
+        Unregister a callback from a path.
+
+        Args:
+            prefix (Union[str, Sequence[Union[str, int]], KeyPath]): The path the callback was registered with.
+            callback (Callback): The callback to remove.
+
+        Returns:
+            bool: True if the callback was removed, False if it was not registered at the path.
+        """
+        keys = _prefix_keys(prefix)
+        nodes = [self._root]
+        for key in keys:
+            node = nodes[-1][1].get(key)
+            if node is None:
+                return False
+            nodes.append(node)
+
+        try:
+            nodes[-1][0].remove(callback)
+        except ValueError:
+            return False
+        self._size -= 1
+
+        # Prune the nodes left without callbacks or children
+        for depth in range(len(keys), 0, -1):
+            if nodes[depth][0] or nodes[depth][1]:
+                break
+            del nodes[depth - 1][1][keys[depth - 1]]
+        return True
+
+    def match(self, keys: Sequence[Union[str, int]]) -> List[Callback]:
+        """
+        Find the callbacks registered at, above or below a changed path.
+
+        Args:
+            keys (Sequence[Union[str, int]]): The keys of the changed path.
+
+        Returns:
+            List[Callback]: The matching callbacks. A callback registered under several matching prefixes appears once per prefix.
+        """
+        matched = []
+        nodes = [self._root]
+        for key in keys:
+            following = []
+            for callbacks, children in nodes:
+                matched.extend(callbacks)
+                child = children.get(key)
+                if child is None and type(key) is int:
+                    # Dotted prefixes name list items as strings
+                    child = children.get(str(key))
+                if child is not None:
+                    following.append(child)
+                wildcard = children.get(WILDCARD)
+                if wildcard is not None and wildcard is not child:
+                    following.append(wildcard)
+            if not following:
+                return matched
+            nodes = following
+
+        # Everything below the changed path changed with it
+        stack = list(nodes)
+        while stack:
+            callbacks, children = stack.pop()
+            matched.extend(callbacks)
+            stack.extend(children.values())
+        return matched
+
+    def dispatch(self, changes: Iterable[Sequence[Union[str, int]]]) -> None:
+        """
+        Call each matching callback once with every changed path it matches, in order.
+
+        An exception raised by a callback propagates, and the remaining callbacks are skipped.
+
+        Args:
+            changes (Iterable[Sequence[Union[str, int]]]): The keys of each changed path.
+        """
+        if not self._size:
+            return
+
+        batches: Dict[Callback, List[KeyPath]] = {}
+        for keys in changes:
+            path = None
+            for callback in self.match(keys):
+                paths = batches.setdefault(callback, [])
+                if path is None:
+                    path = KeyPath(keys)
+                if not paths or paths[-1] is not path:
+                    paths.append(path)
+
+        for callback, paths in batches.items():
+            callback(paths)
@@ -4,27 +4,129 @@ jsonpycraft/manager/configuration.py
 
 import logging
 import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache
 from logging import Logger
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import Any, Optional
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import dotenv
 
 from jsonpycraft.core.singleton import Singleton
 from jsonpycraft.core.types import JSONMap
+from jsonpycraft.core.undo import UndoLog
+from jsonpycraft.json.layered import LayeredMap
 from jsonpycraft.json.map import JSONMapTemplate
+from jsonpycraft.json.path import PATH_CACHE_SIZE, KeyPath
+from jsonpycraft.json.persistent import PersistentMapTemplate, thaw
+from jsonpycraft.json.query import PathPattern
+from jsonpycraft.json.schema import Schema
+from jsonpycraft.json.subscription import Callback
+from jsonpycraft.manager.handlers import DEFAULT_QUEUE_SIZE, queue_handler
+from jsonpycraft.manager.shared import SharedPublisher
+
+# Sentinel for a dotted key missing from the resolution cache
+_MISSING = object()
+
+# The name of the layer holding the configuration file
+FILE_LAYER = "file"
+
+# The environment variable references expanded by os.path.expandvars
+_ENV_REFERENCE = re.compile(r"\$(\w+|\{[^}]*\})", re.ASCII)
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def _path_variables(path: str) -> Tuple[str, ...]:
+    """Return the names of the environment variables a path expands, HOME included for '~'."""
+    names = [name.strip("{}") for name in _ENV_REFERENCE.findall(path)]
+    if path.startswith("~"):
+        names.append("HOME")
+    return tuple(dict.fromkeys(names))
+
+
+def _changed_key(data: JSONMap, key: str, overwrite: bool) -> str:
+    """
+    Return the dotted key of the topmost value that setting a dotted key replaces.
+
+    Setting a key replaces the intermediate values which are not dictionaries, or every
+    intermediate value when overwriting, along with everything below them.
+    """
+    parts = key.split(".")
+    if overwrite:
+        return parts[0]
+    node = data
+    for position, part in enumerate(parts[:-1]):
+        node = node.get(part) if isinstance(node, Mapping) else None
+        if not isinstance(node, Mapping):
+            return ".".join(parts[: position + 1])
+    return key
+
+
+def _set_nested(
+    data: JSONMap,
+    keys: Tuple[str, ...],
+    value: Any,
+    overwrite: bool,
+    log: Optional[UndoLog] = None,
+) -> bool:
+    """Set a nested value in a plain dictionary layer, as JSONMapTemplate.update_nested does."""
+    for key in keys[:-1]:
+        child = data.get(key)
+        if overwrite or not isinstance(child, dict):
+            if log is not None:
+                log.record(data, key)
+            child = data[key] = {}
+            log = None  # The new dictionary is dropped as a whole on rollback
+        data = child
+    if log is not None:
+        log.record(data, keys[-1])
+    data[keys[-1]] = value
+    return True
 
 
 class ConfigurationManager(Singleton):
     """
-    Singleton class for managing configuration data.
+    Singleton class for managing configuration data, with one instance per configuration file.
     """
 
+    @classmethod
+    def _instance_key(cls, file_path: str, *args, **kwargs) -> str:
+        """
+        Return the absolute path of the configuration file as the instance key.
+
+        Args:
+            file_path (str): The path to the configuration file.
+
+        Returns:
+            str: The absolute file path.
+        """
+        return os.path.abspath(file_path)
+
     def __init__(
         self,
         file_path: str,
         initial_data: Optional[JSONMap] = None,
         indent: int = 2,
+        schema: Optional[Union[Schema, JSONMap]] = None,
+        snapshot_reads: bool = False,
+        path_cache_ttl: Optional[float] = None,
+        binary_cache: bool = False,
     ):
         """
         Initialize the ConfigurationManager instance.
@@ -33,14 +135,62 @@ class ConfigurationManager(Singleton):
             file_path (str): The path to the configuration file.
             initial_data (Optional[JSONMap], optional): Initial configuration data. Defaults to None.
             indent (int, optional): The JSON indentation level for formatting. Defaults to 2.
+            schema (Optional[Union[Schema, JSONMap]], optional): A schema validated on load and save. Defaults to None.
+            snapshot_reads (bool, optional): Serve reads from immutable snapshots published by writers, for lock-free reads under concurrent writes. Defaults to False.
+            path_cache_ttl (Optional[float], optional): Seconds before a path resolved by evaluate_path is checked on the filesystem again. Defaults to None, keeping it until invalidated.
+            binary_cache (bool, optional): Load the file through a binary cache file next to it, rebuilt when the file changes, for faster startup with large files. Defaults to False.
         """
         super(ConfigurationManager, self).__init__()
 
         # Initialize the Configuration map
-        self._map_template = JSONMapTemplate(file_path, initial_data=initial_data)
+        template_class = PersistentMapTemplate if snapshot_reads else JSONMapTemplate
+        self._map_template = template_class(
+            file_path, initial_data=initial_data, schema=schema
+        )
         # NOTE: Removed automated loading to avoid a bug where `initial_data` was unintentionally overridden as a result.
 
         self._indent = indent
+        self._binary_cache = binary_cache
+
+        # Resolved get_value results keyed by dotted key, and the cached keys below each prefix
+        self._cache: Dict[str, Any] = {}
+        self._cache_children: Dict[str, Set[str]] = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+        # Created by the first add_layer, holding the file data as the FILE_LAYER layer
+        self._layers: Optional[LayeredMap] = None
+        self._layer_sources: Dict[str, Union[JSONMapTemplate, JSONMap]] = {}
+        self._layer_callbacks: Dict[str, Callback] = {}
+        # Within transactions, the log of dictionary layer writes, and for each open transaction
+        # the layer transactions it entered and the names of the layers it wrote to
+        self._layer_undo: Optional[UndoLog] = None
+        self._layer_scopes: List[Tuple[ExitStack, Set[str]]] = []
+
+        # With snapshot reads, the (version, resolution cache) pair readers use. Writers hold the
+        # write lock and replace the pair as a whole once their changes are complete.
+        self._published: Optional[Tuple[Any, Dict[str, Any]]] = None
+        self._write_lock = threading.RLock()
+        self._writer: Optional[int] = None
+        self._unpublished: List[str] = []
+        if snapshot_reads:
+            self._published = (self._map_template.snapshot(), {})
+
+        # Paths resolved by evaluate_path, keyed by (key, path type, raw path, variable values),
+        # in least recently used order and bounded to PATH_CACHE_SIZE entries
+        self._path_cache: OrderedDict[Tuple, Tuple[str, Optional[float]]] = (
+            OrderedDict()
+        )
+        self._path_cache_lock = threading.Lock()
+        self._path_cache_ttl = path_cache_ttl
+
+        # Created by the first publish_shared
+        self._shared: Optional[SharedPublisher] = None
+
+        # Parsed .env files keyed by path, with the (mtime, size) they were parsed at
+        self._env_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Optional[str]]]] = (
+            {}
+        )
 
     @property
     def file_path(self) -> Path:
@@ -72,6 +222,237 @@ class ConfigurationManager(Singleton):
         """
         return self._map_template.data
 
+    @property
+    def cache_stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Get the statistics of the get_value resolution cache.
+
+        Returns:
+            Dict[str, Union[int, float]]: The number of hits and misses, the number of cached keys
+            and the hit rate, between 0.0 and 1.0.
+        """
+        lookups = self._cache_hits + self._cache_misses
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._cache if self._published is None else self._published[1]),
+            "hit_rate": self._cache_hits / lookups if lookups else 0.0,
+        }
+
+    def clear_cache(self, reset_stats: bool = False) -> None:
+        """
+        Drop every resolved value from the get_value cache.
+
+        Mutations through the configuration manager invalidate the cache on their own. Clear it
+        after mutating the dictionary returned by `data` directly.
+
+        Args:
+            reset_stats (bool, optional): Also reset the hit and miss counters. Defaults to False.
+        """
+        self._cache.clear()
+        self._cache_children.clear()
+        if self._published is not None:
+            self._published = (self._published[0], {})
+        if reset_stats:
+            self._cache_hits = 0
+            self._cache_misses = 0
+
+    def _invalidate(self, key: str) -> None:
+        """
+        Drop the cached values a change at a dotted key can affect.
+
+        Args:
+            key (str): The dotted key of the changed value. Its ancestors and the keys below it are dropped, and the empty string drops everything.
+        """
+        if self._published is not None:
+            self._unpublished.append(key)  # Applied when the write is published
+            return
+
+        cache = self._cache
+        if not cache:
+            return
+        if not key:
+            self.clear_cache()
+            return
+
+        cache.pop(key, None)
+        for child in self._cache_children.pop(key, ()):
+            cache.pop(child, None)
+
+        # The cached containers above the key hold the old value
+        index = key.find(".")
+        while index != -1:
+            cache.pop(key[:index], None)
+            index = key.find(".", index + 1)
+
+    @property
+    def view(self) -> JSONMap:
+        """
+        Get the configuration values read by get_value and query.
+
+        Returns:
+            JSONMap: The merged view of every layer, or the file data when there are no layers. With
+            snapshot reads, the published snapshot, except for the thread writing. It must not be modified.
+        """
+        if self._published is not None and not self._is_writer():
+            return self._published[0]
+        if self._layers is None:
+            return self._map_template.data
+        return self._layers.merged
+
+    def _is_writer(self) -> bool:
+        """Return whether the current thread holds the write lock of snapshot reads."""
+        writer = self._writer
+        return writer is not None and writer == threading.get_ident()
+
+    @contextmanager
+    def _writing(self) -> Iterator[None]:
+        """
+        Hold the write lock for snapshot reads, and publish the changes made within the block
+        once the outermost write completes. Without snapshot reads, do nothing.
+        """
+        if self._published is None or self._is_writer():
+            yield
+            return
+
+        with self._write_lock:
+            self._writer = threading.get_ident()
+            try:
+                yield
+            finally:
+                changed, self._unpublished = self._unpublished, []
+                self._publish(changed)
+                self._writer = None
+
+    def _publish(self, changed: List[str]) -> None:
+        """
+        Publish the current version along with the cached values the changes left valid.
+
+        Args:
+            changed (List[str]): The dotted keys of the changed values, where the empty string is the root.
+        """
+        if not changed:
+            return
+        cache = self._published[1]
+        if "" in changed:
+            cache = {}
+        elif cache:
+            # Copying is atomic while readers keep adding to the published cache
+            cache = cache.copy()
+            roots = set(changed)
+            for key in list(cache):
+                for root in roots:
+                    if (
+                        key == root
+                        or key.startswith(root + ".")
+                        or root.startswith(key + ".")
+                    ):
+                        del cache[key]
+                        break
+        self._published = (self._map_template.snapshot(), cache)
+
+    @property
+    def layers(self) -> list[str]:
+        """
+        Get the layer names, from lowest to highest precedence.
+
+        Returns:
+            list[str]: The layer names. The configuration file is the FILE_LAYER layer.
+        """
+        if self._layers is None:
+            return [FILE_LAYER]
+        return self._layers.names
+
+    def add_layer(
+        self,
+        name: str,
+        source: Union[JSONMapTemplate, JSONMap],
+        index: Optional[int] = None,
+    ) -> None:
+        """
+        Add a configuration layer merged with the configuration file.
+
+        Values are read from the merged view of every layer, where dictionaries merge key by key
+        and any other value is taken from the highest layer holding it. The view is maintained
+        incrementally: a change to one layer only recomputes the paths it touched. Changes made
+        through a template source, including loading it, are followed automatically, and
+        `set_value` can write to any layer by name. Only the configuration file is saved.
+
+        Args:
+            name (str): The layer name.
+            source (Union[JSONMapTemplate, JSONMap]): The layer data, or a template holding it.
+            index (Optional[int], optional): The position in precedence order, where 0 is the lowest. Defaults to the top.
+
+        Raises:
+            ValueError: If a layer with the name already exists, or with snapshot reads.
+            TypeError: If the layer data is not a dictionary.
+
+        Example Usage:
+
+            config_manager = ConfigurationManager("path/to/site.json")
+            config_manager.add_layer("defaults", {"db": {"port": 5432}}, index=0)
+            config_manager.add_layer("env", environment_layer("APP_"))
+            port = config_manager.get_value("db.port")
+        """
+        if self._published is not None:
+            raise ValueError("Layers are not supported with snapshot reads")
+        if self._layers is None:
+            self._layers = LayeredMap([(FILE_LAYER, self._map_template.data)])
+
+        template = source if isinstance(source, JSONMapTemplate) else None
+        data = source.data if template is not None else source
+        self._layers.insert(name, data, index)
+        self._layer_sources[name] = source
+        self.clear_cache()
+
+        if template is not None:
+
+            def refresh(paths: list[KeyPath]) -> None:
+                self._refresh_layer(name, paths)
+
+            template.subscribe("", refresh)
+            self._layer_callbacks[name] = refresh
+
+    def remove_layer(self, name: str) -> None:
+        """
+        Remove a configuration layer added with add_layer.
+
+        Args:
+            name (str): The layer name.
+
+        Raises:
+            KeyError: If there is no layer with the name.
+            ValueError: If name is FILE_LAYER.
+        """
+        if name == FILE_LAYER:
+            raise ValueError("The configuration file layer cannot be removed")
+        if name not in self._layer_sources:
+            raise KeyError(f"Layer {name!r} does not exist")
+
+        self._layers.remove(name)
+        source = self._layer_sources.pop(name)
+        callback = self._layer_callbacks.pop(name, None)
+        if callback is not None:
+            source.unsubscribe("", callback)
+        self.clear_cache()
+
+    def _refresh_layer(self, name: str, paths: list[KeyPath]) -> None:
+        """Recompute the merged view after a template layer reported changed paths."""
+        for path in paths:
+            if path.keys:
+                self._layers.refresh(path.keys)
+                self._invalidate(str(path))
+            else:
+                # The whole template was replaced, such as on load
+                self._layers.replace(name, self._layer_sources[name].data)
+                self.clear_cache()
+
+    def _replaced_file(self) -> None:
+        """Drop every cached value after the configuration file data was replaced."""
+        self._invalidate("")
+        if self._layers is not None:
+            self._layers.replace(FILE_LAYER, self._map_template.data)
+
     def mkdir(self) -> None:
         """
         Create the directory for the JSON file.
@@ -89,7 +470,9 @@ class ConfigurationManager(Singleton):
             JSONFileErrorHandler: If there is a file-related error accessing the JSON file.
             JSONDecodeErrorHandler: If there is an error loading JSON data from the file.
         """
-        return self._map_template.load_json()
+        with self._writing():
+            self._map_template.load_json(cache=self._binary_cache)
+            self._replaced_file()
 
     def save(self) -> None:
         """
@@ -99,7 +482,50 @@ class ConfigurationManager(Singleton):
             JSONFileErrorHandler: If there is a file-related error accessing the JSON file.
             JSONEncodeErrorHandler: If there is an error saving JSON data to the file.
         """
-        return self._map_template.save_json(indent=self._indent)
+        with self._writing():
+            return self._map_template.save_json(indent=self._indent)
+
+    def publish_shared(self, name: Optional[str] = None) -> str:
+        """
+        Publish the current configuration to shared memory for worker processes.
+
+        Workers read it with a SharedConfiguration attached by the returned name, without
+        loading the file, and pick up each later publish on their next read.
+
+        Args:
+            name (Optional[str]): The name of the shared memory, only used by the first publish. Defaults to a random name.
+
+        Returns:
+            str: The name workers attach with.
+
+        Raises:
+            FileExistsError: If shared memory with the name already exists.
+            ValueError: If the configuration holds a value which is not a JSON type.
+
+        Example Usage:
+
+            config_manager = ConfigurationManager("path/to/config.json")
+            name = config_manager.publish_shared()
+            # In a worker process
+            shared = SharedConfiguration(name)
+            port = shared.get_value("db.port")
+        """
+        data = self.view
+        if self._published is not None:
+            data = thaw(data)
+        if self._shared is None:
+            self._shared = SharedPublisher(name)
+        self._shared.publish(data)
+        return self._shared.name
+
+    def close_shared(self) -> None:
+        """
+        Remove the configuration published to shared memory. Attached workers keep the version
+        they last read.
+        """
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
 
     def backup(self) -> None:
         """
@@ -121,9 +547,107 @@ class ConfigurationManager(Singleton):
             initial_data (Optional[JSONMap]): The new config data to use. If None, uses {}.
             save (bool): Whether to save immediately after reset.
         """
-        self._map_template._data = initial_data if initial_data is not None else {}
-        if save:
-            self.save()
+        with self._writing():
+            template = self._map_template
+            template._data = template._from_json(
+                initial_data if initial_data is not None else {}
+            )
+            template._replaced()
+            self._replaced_file()
+            if save:
+                self.save()
+
+    @contextmanager
+    def transaction(self) -> Iterator["ConfigurationManager"]:
+        """
+        Make every configuration change within the block all-or-nothing.
+
+        If the block raises, the changes it made are rolled back and the exception is re-raised.
+        Only the touched entries are recorded, so the cost scales with the number of changes.
+        Transactions nest as savepoints. Writes to other layers through `set_value` are rolled
+        back along with the configuration file.
+
+        Yields:
+            ConfigurationManager: The configuration manager itself.
+
+        Example Usage:
+
+            with config_manager.transaction():
+                config_manager.set_value("db.host", "db.internal")
+                config_manager.set_value("db.port", 5433)
+        """
+        with self._writing():
+            outermost = self._layer_undo is None
+            if outermost:
+                self._layer_undo = UndoLog()
+            mark = self._layer_undo.mark()
+            touched: Set[str] = set()
+            try:
+                # Template layers written within the block join it through their own transaction
+                with ExitStack() as layers, self._map_template.transaction():
+                    self._layer_scopes.append((layers, touched))
+                    try:
+                        yield self
+                    finally:
+                        self._layer_scopes.pop()
+            except BaseException:
+                self._layer_undo.rollback(mark)
+                # The rollback restored values which may have been cached since they changed
+                self._replaced_file()
+                for name in touched:
+                    source = self._layer_sources.get(name)
+                    if source is not None:
+                        data = (
+                            source.data
+                            if isinstance(source, JSONMapTemplate)
+                            else source
+                        )
+                        self._layers.replace(name, data)
+                raise
+            finally:
+                if outermost:
+                    self._layer_undo = None
+
+    def subscribe(
+        self,
+        key: Union[str, Sequence[Union[str, int]], KeyPath],
+        callback: Callback,
+        on_save: bool = False,
+    ) -> None:
+        """
+        Call a callback when configuration values at, above or below a key change.
+
+        The callback receives the list of changed paths as KeyPaths, where `str(path)` is the
+        dotted key. Changes made within a transaction are delivered in one call when it
+        commits. With `on_save`, changes are delivered when the configuration is saved.
+
+        Args:
+            key (Union[str, Sequence[Union[str, int]], KeyPath]): A dotted key, where `*` segments match any key and the empty string matches every change.
+            callback (Callback): Called with the list of changed paths.
+            on_save (bool, optional): Deliver the changes when the configuration is saved. Defaults to False.
+
+        Example Usage:
+
+            config_manager = ConfigurationManager("path/to/config.json")
+            config_manager.subscribe("db", lambda paths: pool.rebuild(config_manager.get_value("db")))
+            config_manager.set_value("db.port", 5433)  # Rebuilds the pool
+        """
+        self._map_template.subscribe(key, callback, on_save=on_save)
+
+    def unsubscribe(
+        self, key: Union[str, Sequence[Union[str, int]], KeyPath], callback: Callback
+    ) -> bool:
+        """
+        Stop calling a callback subscribed to a key.
+
+        Args:
+            key (Union[str, Sequence[Union[str, int]], KeyPath]): The key the callback was subscribed to.
+            callback (Callback): The callback to remove.
+
+        Returns:
+            bool: True if the callback was subscribed to the key, False otherwise.
+        """
+        return self._map_template.unsubscribe(key, callback)
 
     def get_value(self, key: str, default: Optional[Any] = None) -> Any:
         """
@@ -152,11 +676,74 @@ class ConfigurationManager(Singleton):
         Note:
             - Dot notation is supported for specifying nested keys in the 'key' parameter.
             - If a nested key is not found, the method will return 'None' unless a 'default' value is provided.
+            - Resolved values are cached by key until a change through the manager invalidates them.
+              See `cache_stats` for the hit rate.
+            - With snapshot reads, values are read from the published snapshot without locking, and
+              are immutable: dictionaries are PersistentMap instances and lists are tuples.
         """
-        keys = key.split(".")
-        return self._map_template.read_nested(*keys) or default
+        published = self._published
+        if published is not None:
+            writer = self._writer
+            if writer is None or writer != threading.get_ident():
+                snapshot, cache = published
+                value = cache.get(key, _MISSING)
+                if value is _MISSING:
+                    self._cache_misses += 1
+                    value = cache[key] = KeyPath.from_dotted(key).get(snapshot)
+                else:
+                    self._cache_hits += 1
+                return value or default
+            # The writing thread reads its own unpublished changes
+            return KeyPath.from_dotted(key).get(self._map_template.data) or default
+
+        value = self._cache.get(key, _MISSING)
+        if value is _MISSING:
+            self._cache_misses += 1
+            path = KeyPath.from_dotted(key)
+            if self._layers is None:
+                value = self._map_template.read_nested(path)
+            else:
+                value = path.get(self._layers.merged)
+            self._cache[key] = value
+            # Register the key under each of its prefixes, for invalidating a subtree
+            index = key.find(".")
+            while index != -1:
+                self._cache_children.setdefault(key[:index], set()).add(key)
+                index = key.find(".", index + 1)
+        else:
+            self._cache_hits += 1
+        return value or default
+
+    def query(self, pattern: str) -> Iterator[Tuple[str, Any]]:
+        """
+        Lazily yield every configuration value matching a wildcard key pattern.
+
+        Args:
+            pattern (str): A dotted pattern where `*` matches one level, `**` matches zero or more
+                levels, and `[i]`, `[a:b]` and `[*]` select list items.
+
+        Yields:
+            Tuple[str, Any]: The dotted key and value of each match.
 
-    def set_value(self, key: str, value: Any, overwrite: bool = False) -> bool:
+        Raises:
+            ValueError: If the pattern is empty or a segment is invalid.
+
+        Example Usage:
+
+            config_manager = ConfigurationManager("path/to/config.json")
+            for key, port in config_manager.query("services.*.port"):
+                print(key, port)  # e.g. "services.api.port", 8080
+        """
+        for path, value in PathPattern.compile(pattern).match(self.view):
+            yield str(path), value
+
+    def set_value(
+        self,
+        key: str,
+        value: Any,
+        overwrite: bool = False,
+        layer: Optional[str] = None,
+    ) -> bool:
         """
         Set a configuration value for the provided key.
 
@@ -169,10 +756,14 @@ class ConfigurationManager(Singleton):
                 setting deeply nested values.
             value (Any): The value to set.
             overwrite (bool): Overwrite exiting non-empty dictionaries. Default is False.
+            layer (Optional[str]): The layer to write to. Defaults to the configuration file.
 
         Returns:
             bool: True if the value was set successfully, False otherwise.
 
+        Raises:
+            KeyError: If there is no layer with the name.
+
         Example Usage:
 
             config_manager = ConfigurationManager("path/to/config.json")
@@ -183,11 +774,48 @@ class ConfigurationManager(Singleton):
             - If the specified key does not exist in the configuration, the method will create the
             necessary nested structure to set the value.
         """
-        keys = key.split(".")
-        return self._map_template.update_nested(value, *keys, overwrite=overwrite)
+        with self._writing():
+            return self._set_value(key, value, overwrite, layer)
         # NOTE: Overwriting clears the existing structure and creates unpredictable results.
         # The sanest patch for now is to allow users to opt-in if desired.
 
+    def _set_value(
+        self, key: str, value: Any, overwrite: bool, layer: Optional[str]
+    ) -> bool:
+        """Set a value in a layer, as set_value does, and refresh the caches."""
+        path = KeyPath.from_dotted(key)
+        source = self._map_template
+        if layer is not None and layer != FILE_LAYER:
+            if layer not in self._layer_sources:
+                raise KeyError(f"Layer {layer!r} does not exist")
+            source = self._layer_sources[layer]
+            # Every open transaction rolls the layer back, so each one joins it as a savepoint
+            for layers, touched in self._layer_scopes:
+                if layer not in touched:
+                    touched.add(layer)
+                    if isinstance(source, JSONMapTemplate):
+                        layers.enter_context(source.transaction())
+
+        if isinstance(source, JSONMapTemplate):
+            changed = _changed_key(source.data, key, overwrite)
+            self._invalidate(changed)
+            result = source.update_nested(value, path, overwrite=overwrite)
+        else:
+            changed = _changed_key(source, key, overwrite)
+            self._invalidate(changed)
+            result = _set_nested(source, path.keys, value, overwrite, self._layer_undo)
+
+        # Template layers other than the file refresh the view through their subscription,
+        # which a transaction defers until it commits
+        followed = (
+            isinstance(source, JSONMapTemplate)
+            and source is not self._map_template
+            and not self._layer_scopes
+        )
+        if self._layers is not None and not followed:
+            self._layers.refresh(KeyPath.from_dotted(changed).keys)
+        return result
+
     def evaluate_path(
         self, key: str, default_path: Optional[str] = None, default_type: str = "dir"
     ) -> Optional[str]:
@@ -224,6 +852,11 @@ class ConfigurationManager(Singleton):
             The method will expand '~' to the user's home directory and evaluate environment
             variables in the path string before returning it. If the path does not exist, it
             will be created based on the specified path type.
+
+            Resolved paths are cached by key, path type, raw path and the values of the
+            environment variables it references, so repeated calls make no filesystem calls.
+            They expire after `path_cache_ttl` seconds if set, or when `invalidate_paths` is called,
+            and only the PATH_CACHE_SIZE most recently used paths are kept.
         """
         path_info = self.get_value(key, default_path)
 
@@ -243,6 +876,18 @@ class ConfigurationManager(Singleton):
         if not isinstance(path, str):
             raise TypeError(f"Expected a string for path but got {type(path).__name__}")
 
+        # The resolved path is reused until the raw path or a variable it expands changes
+        variables = tuple(os.environ.get(name) for name in _path_variables(path))
+        cache_key = (key, path_type, path, variables)
+        with self._path_cache_lock:
+            cached = self._path_cache.get(cache_key)
+            if cached is not None:
+                self._path_cache.move_to_end(cache_key)
+        if cached is not None:
+            evaluated_path, expiry = cached
+            if expiry is None or time.monotonic() < expiry:
+                return evaluated_path
+
         evaluated_path = os.path.expanduser(os.path.expandvars(path))
 
         # Create the path if it doesn't exist
@@ -253,9 +898,41 @@ class ConfigurationManager(Singleton):
                 os.makedirs(os.path.dirname(evaluated_path), exist_ok=True)
                 open(evaluated_path, "a").close()
 
+        ttl = self._path_cache_ttl
+        expiry = None if ttl is None else time.monotonic() + ttl
+        with self._path_cache_lock:
+            self._path_cache[cache_key] = (evaluated_path, expiry)
+            self._path_cache.move_to_end(cache_key)
+            if len(self._path_cache) > PATH_CACHE_SIZE:
+                self._path_cache.popitem(last=False)
         return evaluated_path
 
-    def get_environment(self, variable: str, key: Optional[str] = None) -> str:
+    def invalidate_paths(self, key: Optional[str] = None) -> int:
+        """
+        Forget the paths resolved by evaluate_path, so the next call checks the filesystem again.
+
+        Use this after removing a directory or file evaluate_path created.
+
+        Args:
+            key (Optional[str], optional): Only forget the paths resolved for this key. Defaults to None, forgetting every path.
+
+        Returns:
+            int: The number of forgotten paths.
+        """
+        with self._path_cache_lock:
+            if key is None:
+                count = len(self._path_cache)
+                self._path_cache.clear()
+                return count
+
+            stale = [cache_key for cache_key in self._path_cache if cache_key[0] == key]
+            for cache_key in stale:
+                del self._path_cache[cache_key]
+            return len(stale)
+
+    def get_environment(
+        self, variable: str, key: Optional[str] = None, export: bool = False
+    ) -> str:
         """
         Get the value of an environment variable.
 
@@ -268,6 +945,8 @@ class ConfigurationManager(Singleton):
             variable (str): The name of the environment variable.
             key (str, optional): The key in the configuration data where the environment variable is stored.
                 Defaults to None.
+            export (bool, optional): Also set the variables of the `.env` file missing from
+                `os.environ`, as `dotenv.load_dotenv` does. Defaults to False.
 
         Returns:
             str: The value of the environment variable.
@@ -284,18 +963,80 @@ class ConfigurationManager(Singleton):
         Note:
             - When using the 'key' parameter, this method loads environment variables from the specified `.env` file.
             - If 'key' is None, it assumes that a `.env` file exists in the local path.
+            - Variables already set in `os.environ` take precedence over the `.env` file.
+            - The parsed `.env` file is cached and only parsed again when its modification time or
+              size changes. `os.environ` is left untouched unless `export` is set.
         """
-        env_path = self.evaluate_path(key, ".env")
+        return self.get_environment_many((variable,), key, export)[variable]
 
-        if not dotenv.load_dotenv(env_path):
-            raise ValueError("EnvironmentError: Failed to load `.env`")
+    def get_environment_many(
+        self, variables: Sequence[str], key: Optional[str] = None, export: bool = False
+    ) -> Dict[str, str]:
+        """
+        Get the values of several environment variables with a single `.env` lookup.
 
-        value = os.getenv(variable) or ""
+        Args:
+            variables (Sequence[str]): The names of the environment variables.
+            key (str, optional): The key in the configuration data where the `.env` file path is stored.
+                Defaults to None, for a `.env` file in the local path.
+            export (bool, optional): Also set the variables of the `.env` file missing from
+                `os.environ`. Defaults to False.
 
-        if not value:
-            raise ValueError(f"EnvironmentError: Failed to find `{variable}`")
+        Returns:
+            Dict[str, str]: The value of each variable, keyed by name.
+
+        Raises:
+            ValueError: If the `.env` file cannot be loaded or if a variable is not found.
+
+        Example Usage:
+
+            config_manager = ConfigurationManager("path/to/config.json")
+            credentials = config_manager.get_environment_many(["DB_USER", "DB_PASSWORD"], "env_config")
+        """
+        env_path = ".env" if key is None else self.evaluate_path(key, ".env")
+        parsed = self._read_environment(env_path)
+
+        if export:
+            for name, value in parsed.items():
+                if value is not None and name not in os.environ:
+                    os.environ[name] = value
+
+        values = {}
+        for variable in variables:
+            value = os.environ.get(variable) or parsed.get(variable) or ""
+            if not value:
+                raise ValueError(f"EnvironmentError: Failed to find `{variable}`")
+            values[variable] = value
+        return values
+
+    def _read_environment(self, env_path: str) -> Dict[str, Optional[str]]:
+        """
+        Return the parsed variables of a `.env` file, parsing it again only if it changed.
+
+        Args:
+            env_path (str): The path to the `.env` file.
+
+        Returns:
+            Dict[str, Optional[str]]: The variables, keyed by name. It must not be modified.
+
+        Raises:
+            ValueError: If the file is missing or holds no variables.
+        """
+        try:
+            stat = os.stat(env_path)
+        except OSError:
+            raise ValueError("EnvironmentError: Failed to load `.env`")
 
-        return value
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._env_cache.get(env_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        parsed = dict(dotenv.dotenv_values(env_path))
+        if not parsed:
+            raise ValueError("EnvironmentError: Failed to load `.env`")
+        self._env_cache[env_path] = (signature, parsed)
+        return parsed
 
     def get_logger(
         self,
@@ -303,6 +1044,7 @@ class ConfigurationManager(Singleton):
         logger_name: str,
         level: str = "DEBUG",
         logger_format: Optional[str] = None,
+        queued: bool = False,
     ) -> Logger:
         """
         Get a logger instance with specified configuration.
@@ -315,6 +1057,9 @@ class ConfigurationManager(Singleton):
             logger_name (str): The name of the logger.
             level (str, optional): The log level for the logger (default is "DEBUG").
             logger_format (str, optional): The log format as a string (default is None).
+            queued (bool, optional): Write to the file from a background thread through a bounded
+                queue shared by every logger of the file, instead of on the calling thread
+                (default is False).
 
         Returns:
             Logger: A configured logger instance for logging messages.
@@ -333,6 +1078,9 @@ class ConfigurationManager(Singleton):
             - If the logger with the specified 'logger_name' already exists, it returns the existing logger to ensure
             consistent logging across the application.
             - Log messages are written to a log file, and the log format includes timestamp, log level, and the log message itself.
+            - The configuration can set "max_bytes" and "backup_count" to rotate the file by size.
+              Queued loggers also read "queue_size" and "overflow", the policy for a full queue:
+              "block", "drop_new" or "drop_oldest". Queued records are written at interpreter exit.
         """
         log_info = self.get_value(key, None)
 
@@ -349,9 +1097,29 @@ class ConfigurationManager(Singleton):
         logger = logging.getLogger(logger_name)
 
         if not logger.handlers:
-            handler = logging.FileHandler(log_file_path, "a")
             formatter = logging.Formatter(logger_format)
-            handler.setFormatter(formatter)
+            max_bytes = log_info.get("max_bytes", 0)
+            backup_count = log_info.get("backup_count", 0)
+            if queued:
+                handler = queue_handler(
+                    log_file_path,
+                    formatter,
+                    max_bytes=max_bytes,
+                    backup_count=backup_count,
+                    queue_size=log_info.get("queue_size", DEFAULT_QUEUE_SIZE),
+                    overflow=log_info.get("overflow", "block"),
+                )
+            else:
+                if max_bytes:
+                    handler = RotatingFileHandler(
+                        log_file_path,
+                        "a",
+                        maxBytes=max_bytes,
+                        backupCount=backup_count,
+                    )
+                else:
+                    handler = logging.FileHandler(log_file_path, "a")
+                handler.setFormatter(formatter)
             logger.addHandler(handler)
             logger.setLevel(log_level)
 
@@ -0,0 +1,218 @@
+"""
+jsonpycraft/manager/handlers.py
+
+Non-blocking file logging through a bounded queue and one background listener per file.
+
+A `BoundedQueueHandler` formats records and puts them on a queue, so logging calls return
+without touching the disk. A `QueueListener` thread per log file takes the records off the queue
+and writes them with a `FileHandler`, or a `RotatingFileHandler` when a maximum size is given.
+Every logger writing to the same file shares its queue and listener, and loggers using the same
+formatter share a handler.
+
+When the queue is full, the overflow policy decides what happens to a new record:
+- "block": Wait for room on the queue, so no record is lost.
+- "drop_new": Drop the new record.
+- "drop_oldest": Drop the oldest queued record to make room for the new one.
+
+Dropped records are counted by the handler. Listeners are stopped at interpreter exit, which
+writes every queued record before the process ends. Records logged through a handler after its
+listener stopped are dropped under every policy, since nothing would write them.
+
+Example Usage:
+    import logging
+
+    from jsonpycraft.manager.handlers import queue_handler
+
+    logger = logging.getLogger("app")
+    logger.addHandler(queue_handler("app.log", max_bytes=1 << 20, backup_count=3))
+    logger.warning("Written by the listener thread")
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, List, Optional, Tuple
+
+OVERFLOW_POLICIES = ("block", "drop_new", "drop_oldest")
+
+# The number of records a file queue holds before the overflow policy applies
+DEFAULT_QUEUE_SIZE = 10_000
+
+# Seconds a blocked record waits before checking whether the listener stopped
+_BLOCK_INTERVAL = 0.1
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    A QueueHandler applying an overflow policy when its bounded queue is full.
+
+    Attributes:
+        overflow (str): The overflow policy, one of OVERFLOW_POLICIES.
+        dropped (int): The number of records dropped by the overflow policy, or after the listener stopped.
+        stopped (bool): Whether the listener reading the queue stopped.
+    """
+
+    def __init__(self, record_queue: queue.Queue, overflow: str = "block"):
+        """
+        Initialize the handler.
+
+        Args:
+            record_queue (queue.Queue): The queue records are put on.
+            overflow (str): The overflow policy, "block", "drop_new" or "drop_oldest". Defaults to "block".
+
+        Raises:
+            ValueError: If the overflow policy is invalid.
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Invalid overflow policy: {overflow}")
+        super(BoundedQueueHandler, self).__init__(record_queue)
+        self.overflow = overflow
+        self.dropped = 0
+        self.stopped = False
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """
+        Put a record on the queue, applying the overflow policy if it is full.
+
+        Args:
+            record (logging.LogRecord): The prepared record.
+        """
+        if self.stopped:
+            self.dropped += 1
+            return
+
+        if self.overflow == "block":
+            # Wait in steps, so a record blocked when the listener stops is dropped
+            while True:
+                try:
+                    self.queue.put(record, timeout=_BLOCK_INTERVAL)
+                    return
+                except queue.Full:
+                    if self.stopped:
+                        self.dropped += 1
+                        return
+
+        while True:
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                if self.overflow == "drop_new":
+                    self.dropped += 1
+                    return
+            try:
+                self.queue.get_nowait()
+                self.dropped += 1
+            except queue.Empty:
+                pass  # The listener made room in the meantime
+
+
+class _FlushingQueueListener(QueueListener):
+    """A QueueListener whose stop waits for room on a full queue instead of failing."""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+# The listener of each log file and the overflow policy of its handlers, keyed by absolute path
+_listeners: Dict[str, Tuple[QueueListener, str]] = {}
+# The handlers of each log file, keyed by (absolute path, formatter)
+_handlers: Dict[Tuple[str, Optional[logging.Formatter]], BoundedQueueHandler] = {}
+_lock = threading.Lock()
+_registered = False
+
+
+def queue_handler(
+    file_path: str,
+    formatter: Optional[logging.Formatter] = None,
+    max_bytes: int = 0,
+    backup_count: int = 0,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    overflow: str = "block",
+) -> BoundedQueueHandler:
+    """
+    Get the queue handler of a log file and formatter, starting the listener of the file on first use.
+
+    Records are formatted by the handler, so loggers sharing a file can each use their own
+    formatter. The arguments other than file_path and formatter only apply when the listener of
+    the file is created; later calls for the same file share its queue and overflow policy.
+
+    Args:
+        file_path (str): The path to the log file.
+        formatter (Optional[logging.Formatter]): The formatter of the records. Defaults to the logging default.
+        max_bytes (int): Rotate the file once it would exceed this size. Defaults to 0, never rotating.
+        backup_count (int): The number of rotated files kept. Defaults to 0.
+        queue_size (int): The number of records the queue holds. Defaults to DEFAULT_QUEUE_SIZE.
+        overflow (str): The overflow policy, "block", "drop_new" or "drop_oldest". Defaults to "block".
+
+    Returns:
+        BoundedQueueHandler: The handler shared by every logger writing to the file with the formatter.
+
+    Raises:
+        ValueError: If the overflow policy is invalid.
+    """
+    global _registered
+
+    key = os.path.abspath(file_path)
+    handler = _handlers.get((key, formatter))
+    if handler is not None:
+        return handler
+
+    with _lock:
+        handler = _handlers.get((key, formatter))
+        if handler is not None:
+            return handler
+
+        entry = _listeners.get(key)
+        if entry is None:
+            if overflow not in OVERFLOW_POLICIES:
+                raise ValueError(f"Invalid overflow policy: {overflow}")
+            if max_bytes:
+                file_handler: logging.Handler = RotatingFileHandler(
+                    key, "a", maxBytes=max_bytes, backupCount=backup_count
+                )
+            else:
+                file_handler = logging.FileHandler(key, "a")
+            # Records arrive formatted by their handler, so the file handler writes the message
+            listener = _FlushingQueueListener(
+                queue.Queue(maxsize=queue_size),
+                file_handler,
+                respect_handler_level=True,
+            )
+            listener.start()
+            entry = _listeners[key] = (listener, overflow)
+            if not _registered:
+                atexit.register(stop_listeners)
+                _registered = True
+
+        listener, overflow = entry
+        handler = BoundedQueueHandler(listener.queue, overflow)
+        if formatter is not None:
+            handler.setFormatter(formatter)
+        _handlers[(key, formatter)] = handler
+        return handler
+
+
+def stop_listeners() -> None:
+    """
+    Stop every listener after it wrote the records already queued, and close the log files.
+
+    Called at interpreter exit. Handlers of a stopped listener drop the records logged through
+    them, and loggers must get a new handler from queue_handler to keep logging.
+    """
+    with _lock:
+        listeners: List[QueueListener] = [entry[0] for entry in _listeners.values()]
+        handlers = list(_handlers.values())
+        _listeners.clear()
+        _handlers.clear()
+
+    # Mark the handlers first, so no record is left blocked on a queue nobody reads
+    for handler in handlers:
+        handler.stopped = True
+    for listener in listeners:
+        listener.stop()
+        for file_handler in listener.handlers:
+            file_handler.close()
@@ -0,0 +1,345 @@
+"""
+jsonpycraft/manager/shared.py
+
+Configuration shared with worker processes through shared memory.
+
+A `SharedPublisher` writes versions of a configuration into shared memory segments, and any
+process can read them with a `SharedConfiguration` by name, without reading or parsing the
+configuration file.
+
+A small control segment, named after the publisher, holds the current version number and the
+name and size of the data segment holding that version. Each version is written to a new data
+segment, and the previous one is unlinked once the control segment points at the new one.
+Processes which still map an unlinked segment keep reading it until they move to the new version.
+
+The control fields are guarded by a sequence number, which the publisher makes odd while it
+updates them and even once they are consistent. Readers retry until they read the same even
+sequence number before and after the fields, so they never see a half-written update. Checking
+for a new version reads eight bytes and takes no lock.
+
+A data segment holds each top-level value of the configuration encoded separately with
+`marshal`, behind an index of their offsets. Readers keep the segment mapped and decode a
+top-level value on first access, so the undecoded data stays in pages shared by every process
+and each reader only holds the parts of the configuration it uses.
+
+Example Usage:
+    from jsonpycraft.manager.shared import SharedConfiguration, SharedPublisher
+
+    publisher = SharedPublisher()
+    publisher.publish({"db": {"host": "localhost", "port": 5432}})
+
+    # In a worker process, given publisher.name
+    shared = SharedConfiguration(name)
+    shared.get_value("db.port")  # 5432, picking up newer versions as they are published
+"""
+
+import marshal
+import os
+import secrets
+import struct
+import sys
+import threading
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Optional, Tuple
+
+from jsonpycraft.core.types import JSONMap
+from jsonpycraft.json.path import KeyPath
+
+# Sequence number, version, data size and data segment name
+_CONTROL = struct.Struct("<QQQ64s")
+_SEQUENCE = struct.Struct("<Q")
+_VERSION = struct.Struct("<8xQ")
+# The length of the marshalled index at the start of a data segment
+_INDEX_LENGTH = struct.Struct("<Q")
+
+_MISSING = object()
+# Whether attaching registers segments with the resource tracker, which track=False avoids
+_TRACKED = os.name == "posix" and sys.version_info < (3, 13)
+
+
+def _attach(name: str) -> SharedMemory:
+    """
+    Attach to an existing segment without handing it to the resource tracker.
+
+    The resource tracker unlinks the segments a process registered when it exits, which would
+    remove the configuration from every other process as soon as one reader exits.
+
+    Raises:
+        FileNotFoundError: If there is no segment with the name.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)  # Only added in Python 3.13
+
+    # Before Python 3.13, attaching always registers the segment, so undo just that registration
+    segment = SharedMemory(name=name)
+    if _TRACKED:
+        resource_tracker.unregister(segment._name, "shared_memory")
+    return segment
+
+
+def _unlink(segment: SharedMemory) -> None:
+    """
+    Close and unlink a segment created by this process.
+
+    A reader sharing the resource tracker of this process, such as a forked worker, may have
+    dropped the registration of the segment when it attached. Registering it again first keeps
+    the tracker from failing on the unregistration unlink makes.
+    """
+    segment.close()
+    if _TRACKED:
+        resource_tracker.register(segment._name, "shared_memory")
+    segment.unlink()
+
+
+class SharedPublisher:
+    """
+    Publishes versions of a configuration to shared memory.
+
+    Attributes:
+        name (str): The name readers attach with.
+        version (int): The last published version, or 0 before the first publish.
+    """
+
+    def __init__(self, name: Optional[str] = None):
+        """
+        Create the control segment.
+
+        Args:
+            name (Optional[str]): The name of the control segment. Data segments are named after it with the version appended. Defaults to a random name.
+
+        Raises:
+            FileExistsError: If a segment with the name already exists.
+        """
+        if name is None:
+            name = f"jpc_{secrets.token_hex(6)}"
+        self._control = SharedMemory(name=name, create=True, size=_CONTROL.size)
+        _CONTROL.pack_into(self._control.buf, 0, 0, 0, 0, b"")
+        self._segment: Optional[SharedMemory] = None
+        self._lock = threading.Lock()
+        self.name = name
+        self.version = 0
+
+    def publish(self, data: JSONMap) -> int:
+        """
+        Publish a new version of the configuration.
+
+        Args:
+            data (JSONMap): The configuration. Only JSON types can be published.
+
+        Returns:
+            int: The version number of the published configuration.
+
+        Raises:
+            ValueError: If the data holds a value which is not a JSON type, or the publisher is closed.
+        """
+        index: Dict[str, Tuple[int, int]] = {}
+        values = []
+        offset = 0
+        for key, value in data.items():
+            encoded = marshal.dumps(value)
+            index[key] = (offset, len(encoded))
+            values.append(encoded)
+            offset += len(encoded)
+        # Offsets are relative to the end of the index
+        encoded_index = marshal.dumps(index)
+        start = _INDEX_LENGTH.size + len(encoded_index)
+        size = start + offset
+
+        with self._lock:
+            if self._control is None:
+                raise ValueError("The publisher is closed")
+            version = self.version + 1
+            name = f"{self.name}_{version}"
+            segment = SharedMemory(name=name, create=True, size=size)
+            buffer = segment.buf
+            _INDEX_LENGTH.pack_into(buffer, 0, len(encoded_index))
+            buffer[_INDEX_LENGTH.size : start] = encoded_index
+            position = start
+            for encoded in values:
+                buffer[position : position + len(encoded)] = encoded
+                position += len(encoded)
+
+            control = self._control.buf
+            (sequence,) = _SEQUENCE.unpack_from(control, 0)
+            _SEQUENCE.pack_into(control, 0, sequence + 1)
+            _CONTROL.pack_into(control, 0, sequence + 1, version, size, name.encode())
+            _SEQUENCE.pack_into(control, 0, sequence + 2)
+
+            previous, self._segment = self._segment, segment
+            self.version = version
+            if previous is not None:
+                _unlink(previous)
+        return version
+
+    def close(self) -> None:
+        """
+        Unlink the control and data segments. Readers already attached keep their current version.
+        """
+        with self._lock:
+            if self._control is None:
+                return
+            for segment in (self._segment, self._control):
+                if segment is not None:
+                    _unlink(segment)
+            self._segment = None
+            self._control = None
+
+
+class SharedConfiguration:
+    """
+    Reads the configuration published by a SharedPublisher, following new versions.
+
+    Values are decoded from shared memory on first access and cached until a new version is
+    published. A reader is meant for one thread; create one per thread that reads.
+    """
+
+    def __init__(self, name: str):
+        """
+        Attach to a published configuration.
+
+        Args:
+            name (str): The name of the publisher.
+
+        Raises:
+            FileNotFoundError: If there is no publisher with the name.
+        """
+        self._control = _attach(name)
+        self._control_buffer = self._control.buf
+        self._segment: Optional[SharedMemory] = None
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._start = 0
+        self._values: Dict[str, Any] = {}
+        self._cache: Dict[str, Any] = {}
+        self._version = 0
+        self.name = name
+        self.refresh()
+
+    @property
+    def version(self) -> int:
+        """
+        Get the version being read.
+
+        Returns:
+            int: The version number, or 0 if nothing was published yet.
+        """
+        return self._version
+
+    @property
+    def published_version(self) -> int:
+        """
+        Get the latest published version, without moving to it.
+
+        Returns:
+            int: The version number, or 0 if nothing was published yet.
+        """
+        return _VERSION.unpack_from(self._control_buffer)[0]
+
+    def _read_control(self) -> Tuple[int, int, str]:
+        """Return the (version, size, data segment name) of a consistent control update."""
+        buffer = self._control_buffer
+        while True:
+            sequence, version, size, name = _CONTROL.unpack_from(buffer, 0)
+            if sequence & 1 or _SEQUENCE.unpack_from(buffer, 0)[0] != sequence:
+                continue  # The publisher is updating the fields
+            return version, size, name.rstrip(b"\0").decode()
+
+    def refresh(self) -> bool:
+        """
+        Move to the latest published version, if it is newer.
+
+        Returns:
+            bool: True if a new version was loaded, False if the current one is the latest.
+
+        Raises:
+            ValueError: If the reader is closed.
+        """
+        if self._control is None:
+            raise ValueError("The reader is closed")
+        while True:
+            version, size, name = self._read_control()
+            if version == self._version:
+                return False
+            try:
+                segment = _attach(name)
+            except FileNotFoundError:
+                continue  # Replaced and unlinked after the control was read
+            break
+
+        buffer = segment.buf
+        (length,) = _INDEX_LENGTH.unpack_from(buffer, 0)
+        start = _INDEX_LENGTH.size + length
+        with buffer[_INDEX_LENGTH.size : start] as encoded:
+            index = marshal.loads(encoded)
+
+        if self._segment is not None:
+            self._segment.close()
+        self._segment = segment
+        self._index = index
+        self._start = start
+        self._values = {}
+        self._cache = {}
+        self._version = version
+        return True
+
+    def _value(self, key: str) -> Any:
+        """Decode a top-level value, or return _MISSING if there is no such key."""
+        value = self._values.get(key, _MISSING)
+        if value is _MISSING:
+            location = self._index.get(key)
+            if location is None:
+                return _MISSING
+            offset = self._start + location[0]
+            with self._segment.buf[offset : offset + location[1]] as encoded:
+                value = self._values[key] = marshal.loads(encoded)
+        return value
+
+    @property
+    def data(self) -> JSONMap:
+        """
+        Get the whole configuration of the latest version.
+
+        Returns:
+            JSONMap: The configuration. It is shared with later reads and must not be modified.
+        """
+        self.refresh()
+        return {key: self._value(key) for key in self._index}
+
+    def get_value(self, key: str, default: Optional[Any] = None) -> Any:
+        """
+        Get a configuration value of the latest version, as ConfigurationManager.get_value does.
+
+        Args:
+            key (str): The key, using dot notation for nested keys.
+            default (Optional[Any], optional): The value returned if the key is not found. Defaults to None.
+
+        Returns:
+            Any: The configuration value, or the default value if not found. It must not be modified.
+        """
+        if _VERSION.unpack_from(self._control_buffer)[0] != self._version:
+            self.refresh()
+
+        value = self._cache.get(key, _MISSING)
+        if value is _MISSING:
+            keys = KeyPath.from_dotted(key).keys
+            value = self._value(keys[0])
+            if value is _MISSING:
+                value = None
+            elif len(keys) > 1:
+                value = KeyPath(keys[1:]).get(value)
+            self._cache[key] = value
+        return value or default
+
+    def close(self) -> None:
+        """
+        Detach from the shared memory segments.
+        """
+        self._control_buffer = None
+        for segment in (self._segment, self._control):
+            if segment is not None:
+                segment.close()
+        self._segment = None
+        self._control = None
+        self._index = {}
+        self._values = {}
+        self._cache = {}
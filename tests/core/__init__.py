@@ -0,0 +1 @@
+# Empty __init__.py file for the tests/core directory.
@@ -0,0 +1,127 @@
+"""
+tests/core/test_singleton.py
+"""
+
+import os
+import threading
+import time
+
+from jsonpycraft.core.singleton import Singleton
+from jsonpycraft.manager.configuration import ConfigurationManager
+
+
+class Counted(Singleton):
+    created = 0
+
+    def __init__(self, data=None):
+        super().__init__()
+        time.sleep(0.01)  # Widen the window for concurrent first calls
+        type(self).created += 1
+        self.data = data
+
+
+class Flaky(Singleton):
+    calls = 0
+    created = 0
+    started = threading.Event()
+    release = threading.Event()
+
+    def __init__(self):
+        super().__init__()
+        cls = type(self)
+        cls.calls += 1
+        if cls.calls == 1:
+            cls.started.set()
+            cls.release.wait()
+            raise RuntimeError("first construction fails")
+        time.sleep(0.05)
+        cls.created += 1
+
+
+class PerFile(Singleton):
+    @classmethod
+    def _instance_key(cls, path, *args, **kwargs):
+        return os.path.abspath(path)
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+
+
+def run_concurrently(target, count=16):
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def worker(index):
+        barrier.wait()
+        results[index] = target(index)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_single_instance():
+    Counted._instances = {}
+    first = Counted("first")
+    assert Counted("second") is first
+    assert first.data == "first"
+
+
+def test_concurrent_first_use():
+    Counted._instances = {}
+    Counted.created = 0
+    instances = run_concurrently(lambda index: Counted(index))
+    assert Counted.created == 1
+    assert all(instance is instances[0] for instance in instances)
+
+
+def test_failed_construction_keeps_lock():
+    results = {}
+
+    def create(name):
+        try:
+            results[name] = Flaky()
+        except RuntimeError as error:
+            results[name] = error
+
+    first = threading.Thread(target=create, args=("first",))
+    first.start()
+    Flaky.started.wait()
+    # The second call waits on the creation lock held by the failing first call
+    second = threading.Thread(target=create, args=("second",))
+    second.start()
+    time.sleep(0.05)
+    Flaky.release.set()
+    first.join()
+    # A third call arriving while the second one builds the instance must wait for it
+    time.sleep(0.01)
+    third = threading.Thread(target=create, args=("third",))
+    third.start()
+    second.join()
+    third.join()
+
+    assert isinstance(results["first"], RuntimeError)
+    assert Flaky.created == 1
+    assert results["second"] is results["third"]
+
+
+def test_keyed_instances(tmp_path):
+    first = PerFile(tmp_path / "a.json")
+    assert PerFile(str(tmp_path / "a.json")) is first
+    assert PerFile(tmp_path / "b.json") is not first
+
+    instances = run_concurrently(lambda index: PerFile(tmp_path / f"{index % 2}.json"))
+    assert len({id(instance) for instance in instances}) == 2
+
+
+def test_configuration_manager_per_file(tmp_path):
+    ConfigurationManager._instances = {}
+    site = ConfigurationManager(str(tmp_path / "site.json"))
+    host = ConfigurationManager(file_path=str(tmp_path / "host.json"))
+    assert site is not host
+    assert ConfigurationManager(str(tmp_path / "site.json")) is site
+    ConfigurationManager._instances = {}
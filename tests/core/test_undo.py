@@ -0,0 +1,70 @@
+"""
+tests/core/test_undo.py
+"""
+
+from jsonpycraft.core.undo import UndoLog
+
+
+def test_rollback_restores_assigned_and_created_entries():
+    data = {"a": 1}
+    log = UndoLog()
+    log.record(data, "a")
+    data["a"] = 2
+    log.record(data, "b")
+    data["b"] = 3
+    assert len(log) == 2
+    log.rollback()
+    assert data == {"a": 1}
+    assert len(log) == 0
+
+
+def test_rollback_restores_deleted_entries():
+    data = {"a": {"b": 1}}
+    log = UndoLog()
+    log.record(data, "a")
+    del data["a"]
+    log.rollback()
+    assert data == {"a": {"b": 1}}
+
+
+def test_rollback_restores_deleted_key_order():
+    data = {"a": 1, "b": 2, "c": 3, "d": 4}
+    log = UndoLog()
+    log.record_delete(data, "b")
+    del data["b"]
+    log.record_delete(data, "a")
+    del data["a"]
+    log.record_delete(data, "d")
+    del data["d"]
+    log.rollback()
+    assert list(data.items()) == [("a", 1), ("b", 2), ("c", 3), ("d", 4)]
+
+
+def test_rollback_to_savepoint():
+    data = {}
+    log = UndoLog()
+    log.record(data, "a")
+    data["a"] = 1
+    savepoint = log.mark()
+    log.record(data, "b")
+    data["b"] = 2
+    log.rollback(savepoint)
+    assert data == {"a": 1}
+    log.clear()
+    log.rollback()
+    assert data == {"a": 1}
+
+
+def test_rollback_restores_lists():
+    items = ["a", "b", "c"]
+    log = UndoLog()
+    log.record(items, 0)
+    items[0] = "x"
+    log.record_remove(items, 1)
+    del items[1]
+    log.record_insert(items, 2)
+    items.insert(2, "y")
+    log.record_insert(items, 3)
+    items.append("z")
+    log.rollback()
+    assert items == ["a", "b", "c"]
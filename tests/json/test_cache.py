@@ -0,0 +1,121 @@
+"""
+tests/json/test_cache.py
+"""
+
+import json
+import os
+
+import pytest
+
+from jsonpycraft.core.errors import JSONDecodeErrorHandler, JSONFileErrorHandler
+from jsonpycraft.json import cache
+from jsonpycraft.json.cache import cache_path, read_cached_json, write_json_cache
+from jsonpycraft.json.map import JSONMapTemplate
+
+DATA = {"app": {"name": "jsonpycraft", "ports": [80, 443], "debug": False}}
+
+
+@pytest.fixture
+def json_file(tmp_path):
+    file_path = tmp_path / "config.json"
+    file_path.write_text(json.dumps(DATA))
+    return file_path
+
+
+def count_decodes(monkeypatch):
+    calls = []
+    decode = cache._decode
+
+    def counting(*args):
+        calls.append(args[0])
+        return decode(*args)
+
+    monkeypatch.setattr(cache, "_decode", counting)
+    return calls
+
+
+def test_cache_path(json_file):
+    assert cache_path(json_file) == json_file.with_name("config.json.cache")
+    assert cache_path("config.json") == cache_path(json_file).relative_to(
+        json_file.parent
+    )
+
+
+def test_read_cached_json(json_file, monkeypatch):
+    decodes = count_decodes(monkeypatch)
+
+    assert read_cached_json(json_file) == DATA
+    assert cache_path(json_file).exists()
+    assert read_cached_json(json_file) == DATA
+    assert len(decodes) == 1
+
+    # A compact read does not use a cache file built for plain reads
+    assert read_cached_json(json_file, compact=True) == DATA
+    assert len(decodes) == 2
+
+
+def test_stale_cache(json_file, monkeypatch):
+    read_cached_json(json_file)
+    decodes = count_decodes(monkeypatch)
+
+    json_file.write_text(json.dumps({"app": {"name": "changed"}}))
+    assert read_cached_json(json_file) == {"app": {"name": "changed"}}
+    assert len(decodes) == 1
+
+    # Same size and modification time, different content: caught by the hash
+    stat = os.stat(json_file)
+    json_file.write_text(json.dumps({"app": {"name": "CHANGED"}}))
+    os.utime(json_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert read_cached_json(json_file) == {"app": {"name": "CHANGED"}}
+    assert len(decodes) == 2
+
+
+def test_corrupt_cache(json_file):
+    cache_path(json_file).write_bytes(b"not a cache file")
+    assert read_cached_json(json_file) == DATA
+
+    read_cached_json(json_file)
+    cache_file = cache_path(json_file)
+    cache_file.write_bytes(cache_file.read_bytes()[:-5])
+    assert read_cached_json(json_file) == DATA
+
+
+def test_unwritable_cache(json_file, monkeypatch):
+    monkeypatch.setattr(cache.tempfile, "mkstemp", _raise_permission_error)
+    assert read_cached_json(json_file) == DATA
+    assert not cache_path(json_file).exists()
+    assert write_json_cache(json_file) is False
+
+
+def _raise_permission_error(*args, **kwargs):
+    raise PermissionError("read-only directory")
+
+
+def test_write_json_cache(json_file, monkeypatch):
+    assert write_json_cache(json_file) is True
+    decodes = count_decodes(monkeypatch)
+    assert read_cached_json(json_file) == DATA
+    assert not decodes
+
+
+def test_read_cached_json_errors(tmp_path):
+    with pytest.raises(JSONFileErrorHandler):
+        read_cached_json(tmp_path / "missing.json")
+
+    invalid = tmp_path / "invalid.json"
+    invalid.write_text("{invalid")
+    with pytest.raises(JSONDecodeErrorHandler):
+        read_cached_json(invalid)
+    assert not cache_path(invalid).exists()
+
+
+def test_template_load_json_cache(json_file):
+    template = JSONMapTemplate(str(json_file))
+    template.load_json(cache=True)
+    assert template.data == DATA
+    assert cache_path(json_file).exists()
+
+    template.update_nested("saved", "app", "name", overwrite=True)
+    template.save_json()
+    template.load_json(cache=True)
+    assert template.data["app"]["name"] == "saved"
@@ -0,0 +1,74 @@
+"""
+tests/json/test_compact.py
+"""
+
+import json
+import sys
+
+import pytest
+
+from jsonpycraft.json.compact import StringInterner, footprint
+from jsonpycraft.json.io import read_json
+from jsonpycraft.json.list import JSONListTemplate
+
+
+@pytest.fixture
+def records_file(tmp_path):
+    file_path = tmp_path / "records.json"
+    records = [
+        {"status": "active", "region": "us-east", "id": i, "note": "x" * 100}
+        for i in range(100)
+    ]
+    file_path.write_text(json.dumps(records))
+    yield file_path
+    if file_path.exists():
+        file_path.unlink()
+
+
+def test_string_interner_shares_values():
+    interner = StringInterner()
+    first = interner([("status", "".join(["act", "ive"]))])
+    second = interner([("status", "".join(["act", "ive"]))])
+    assert first["status"] is second["status"]
+    assert next(iter(first)) is next(iter(second))
+
+
+def test_string_interner_skips_long_values():
+    interner = StringInterner(max_length=4)
+    first = interner([("key", "".join(["long", "er"]))])
+    second = interner([("key", "".join(["long", "er"]))])
+    assert first["key"] == second["key"]
+    assert first["key"] is not second["key"]
+
+
+def test_string_interner_shares_array_items():
+    text = json.dumps(
+        [{"tags": ["active", "active", ["active"]]}, {"tags": ["active", "x" * 100]}]
+    )
+    first, second = json.loads(text, object_pairs_hook=StringInterner())
+    assert first["tags"][0] is first["tags"][1]
+    assert first["tags"][0] is first["tags"][2][0]
+    assert first["tags"][0] is second["tags"][0]
+    plain = json.loads(text)
+    assert plain[0]["tags"][0] is not plain[1]["tags"][0]
+
+
+def test_read_json_compact(records_file):
+    plain = read_json(records_file)
+    compact = read_json(records_file, compact=True)
+    assert plain == compact
+    assert compact[0]["region"] is compact[1]["region"]
+    assert footprint(compact) < footprint(plain)
+
+
+def test_load_json_compact(records_file):
+    template = JSONListTemplate(str(records_file))
+    template.load_json(compact=True)
+    assert template.length == 100
+    assert template.get(0)["status"] is template.get(99)["status"]
+
+
+def test_footprint_counts_shared_objects_once():
+    value = "shared value"
+    data = [value, value]
+    assert footprint(data) == sys.getsizeof(data) + sys.getsizeof(value)
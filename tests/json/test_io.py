@@ -6,7 +6,16 @@ import os
 
 import pytest
 
-from jsonpycraft.json.io import dump_json, force_read_json, read_json, write_json
+from jsonpycraft.core.errors import JSONDecodeErrorHandler, JSONFileErrorHandler
+from jsonpycraft.json import io
+from jsonpycraft.json.io import (
+    dump_json,
+    force_read_json,
+    read_json,
+    read_path,
+    write_json,
+)
+from jsonpycraft.json.path import KeyPath
 
 
 @pytest.fixture
@@ -34,3 +43,52 @@ def test_write_json(temp_json_file):
 def test_force_read_json(temp_json_file):
     assert force_read_json(temp_json_file, {"another": "data"}) == {"test": "data"}
     assert read_json(temp_json_file) == {"test": "data"}
+
+
+@pytest.fixture
+def nested_document():
+    return {
+        "records": [
+            {"id": i, "note": 'brackets [{ and "quotes" \\ inside', "tags": [[], {}]}
+            for i in range(50)
+        ],
+        'escaped "key"': {"value": 1},
+        "ünïcode": "välue",
+        "build": {"version": "1.2.3", "flags": [True, None, -1.5e3]},
+    }
+
+
+@pytest.mark.parametrize("chunk_size", [1, 256])
+def test_read_path(tmp_path, monkeypatch, nested_document, chunk_size):
+    monkeypatch.setattr(io, "SKIP_CHUNK_SIZE", chunk_size)
+    file_path = tmp_path / "nested.json"
+    write_json(file_path, nested_document)
+
+    assert read_path(file_path, "build.version") == "1.2.3"
+    assert read_path(file_path, "/build/flags") == [True, None, -1.5e3]
+    assert read_path(file_path, "build.flags.2") == -1.5e3
+    assert read_path(file_path, KeyPath(("records", 49, "id"))) == 49
+    assert read_path(file_path, ['escaped "key"', "value"]) == 1
+    assert read_path(file_path, "ünïcode") == "välue"
+    assert read_path(file_path, "records") == nested_document["records"]
+
+
+def test_read_path_missing(tmp_path, nested_document):
+    file_path = tmp_path / "nested.json"
+    write_json(file_path, nested_document)
+
+    assert read_path(file_path, "build.missing") is None
+    assert read_path(file_path, "records.50", default=0) == 0
+    assert read_path(file_path, "records.-1", default=0) == 0
+    assert read_path(file_path, "build.version.major", default=0) == 0
+
+
+def test_read_path_errors(tmp_path):
+    with pytest.raises(JSONFileErrorHandler):
+        read_path(tmp_path / "missing.json", "a")
+
+    file_path = tmp_path / "broken.json"
+    for text in ("", '{"a": [1, 2', '{"a" 1}', '{"b": {"c": 1}, "a": tru}'):
+        file_path.write_text(text)
+        with pytest.raises(JSONDecodeErrorHandler):
+            read_path(file_path, "a")
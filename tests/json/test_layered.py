@@ -0,0 +1,105 @@
+"""
+tests/json/test_layered.py
+"""
+
+import pytest
+
+from jsonpycraft.json.layered import LayeredMap, environment_layer
+
+
+@pytest.fixture
+def layers():
+    defaults = {"db": {"host": "localhost", "port": 5432}, "plugins": ["auth"]}
+    site = {"db": {"host": "db.internal"}, "plugins": ["metrics"]}
+    return LayeredMap([("defaults", defaults), ("site", site)])
+
+
+def test_merged(layers):
+    assert layers.names == ["defaults", "site"]
+    assert layers.merged == {
+        "db": {"host": "db.internal", "port": 5432},
+        "plugins": ["metrics"],
+    }
+
+    # The merged view never shares containers with the layers
+    assert layers.merged["plugins"] is not layers.layer("site")["plugins"]
+    assert layers.merged["db"] is not layers.layer("site")["db"]
+
+
+def test_refresh(layers):
+    site = layers.layer("site")
+    site["db"]["port"] = 5433
+    layers.refresh(("db", "port"))
+    assert layers.merged["db"] == {"host": "db.internal", "port": 5433}
+
+    del site["db"]["port"]
+    layers.refresh(("db", "port"))
+    assert layers.merged["db"] == {"host": "db.internal", "port": 5432}
+
+    # A value which is not a dictionary hides the lower layers
+    site["db"] = "sqlite://"
+    layers.refresh(("db",))
+    assert layers.merged["db"] == "sqlite://"
+
+    layers.layer("defaults")["db"]["port"] = 1
+    layers.refresh(("db", "port"))
+    assert layers.merged["db"] == "sqlite://"
+
+    # A replaced intermediate value is refreshed at its own path
+    site["db"] = {"user": "admin"}
+    layers.refresh(("db",))
+    assert layers.merged["db"] == {"host": "localhost", "port": 1, "user": "admin"}
+
+    del site["db"]
+    del layers.layer("defaults")["db"]
+    layers.refresh(("db",))
+    assert "db" not in layers.merged
+
+
+def test_insert_remove_replace(layers):
+    layers.insert("host", {"db": {"port": 6000}})
+    layers.insert("base", {"db": {"port": 1, "user": "root"}}, index=0)
+    assert layers.names == ["base", "defaults", "site", "host"]
+    assert layers.merged["db"] == {
+        "port": 6000,
+        "user": "root",
+        "host": "db.internal",
+    }
+
+    assert layers.remove("host") == {"db": {"port": 6000}}
+    assert layers.merged["db"]["port"] == 5432
+
+    layers.replace("site", {"cache": {"ttl": 60}})
+    assert layers.merged == {
+        "db": {"host": "localhost", "port": 5432, "user": "root"},
+        "plugins": ["auth"],
+        "cache": {"ttl": 60},
+    }
+
+    # Replacing a layer with its own data rebuilds the whole view
+    layers.layer("site").clear()
+    layers.replace("site", layers.layer("site"))
+    assert "cache" not in layers.merged
+
+    with pytest.raises(ValueError):
+        layers.insert("base", {})
+    with pytest.raises(TypeError):
+        layers.insert("list", [])
+    with pytest.raises(KeyError):
+        layers.remove("missing")
+    with pytest.raises(KeyError):
+        layers.layer("missing")
+
+
+def test_environment_layer():
+    environ = {
+        "APP_DB__PORT": "5433",
+        "APP_DB__HOST": "db.internal",
+        "APP_DEBUG": "true",
+        "APP_": "ignored",
+        "OTHER": "ignored",
+    }
+    assert environment_layer("APP_", environ=environ) == {
+        "db": {"host": "db.internal", "port": 5433},
+        "debug": True,
+    }
@@ -1,6 +1,7 @@
 """
 tests/json/test_list.py
 """
+import json
 from typing import Any, Dict
 
 import pytest
@@ -120,3 +121,109 @@ def test_pop(json_list_template, messages):
 def test_clear(json_list_template):
     assert json_list_template.clear() is None
     assert json_list_template.data is None
+
+
+@pytest.fixture
+def capped_list_template(tmp_path, messages):
+    temp_json_file = tmp_path / "test_capped_list.json"
+    temp_json_file.write_text("[]")
+
+    json_list = JSONListTemplate(
+        str(temp_json_file), initial_data=messages, max_length=len(messages)
+    )
+    yield json_list
+
+    if temp_json_file.exists():
+        temp_json_file.unlink()
+
+
+def test_capped_invalid_max_length(tmp_path):
+    with pytest.raises(ValueError):
+        JSONListTemplate(str(tmp_path / "test.json"), max_length=0)
+
+
+def test_capped_append_evicts_oldest(capped_list_template, messages, message):
+    capped_list_template.append(message)
+    assert capped_list_template.length == len(messages)
+    assert capped_list_template.get(0) == messages[1]
+    assert capped_list_template.get(len(messages) - 1) == message
+
+
+def test_capped_initial_data_keeps_newest(tmp_path, messages):
+    json_list = JSONListTemplate(
+        str(tmp_path / "test.json"), initial_data=messages, max_length=2
+    )
+    assert json_list.data == messages[-2:]
+
+
+def test_capped_push_and_pop_both_ends(capped_list_template, messages, message):
+    assert capped_list_template.popleft() == messages[0]
+    capped_list_template.appendleft(message)
+    assert capped_list_template.get(0) == message
+    assert capped_list_template.pop(capped_list_template.length - 1) == messages[-1]
+    assert capped_list_template.pop(0) == message
+    assert capped_list_template.pop(1) == messages[2]
+    assert capped_list_template.data == [messages[1]]
+
+
+def test_capped_insert_when_full(capped_list_template, messages, message):
+    assert capped_list_template.insert(2, message) is True
+    assert capped_list_template.data == [messages[1], message] + messages[2:]
+
+
+def test_capped_save_writes_live_window(capped_list_template, messages, message):
+    capped_list_template.append(message)
+    capped_list_template.save_json()
+    reloaded = JSONListTemplate(str(capped_list_template.file_path), max_length=2)
+    reloaded.load_json()
+    assert reloaded.data == [messages[-1], message]
+    with open(capped_list_template.file_path) as file:
+        assert json.load(file) == messages[1:] + [message]
+
+
+@pytest.fixture
+def scored_list_template(tmp_path):
+    records = [
+        {"name": "a", "stats": {"score": 3, "age": 30}},
+        {"name": "b", "stats": {"score": 9, "age": 20}},
+        {"name": "c", "stats": {"age": 40}},
+        {"name": "d", "stats": {"score": 3, "age": 10}},
+        {"name": "e", "stats": {"score": 7, "age": 50}},
+    ]
+    return JSONListTemplate(str(tmp_path / "scored.json"), initial_data=records)
+
+
+def test_top_k(scored_list_template):
+    top = scored_list_template.top_k("stats.score", 2)
+    assert [record["name"] for record in top] == ["b", "e"]
+    assert top[0] is scored_list_template.get(1)
+
+    bottom = scored_list_template.top_k(("stats", "score"), 3, largest=False)
+    assert [record["name"] for record in bottom] == ["a", "d", "e"]
+
+    assert len(scored_list_template.top_k("stats.score", 10)) == 4
+
+
+def test_sort_by(scored_list_template):
+    record = scored_list_template.get(0)
+    scored_list_template.sort_by("stats.score", "stats.age")
+    names = [scored_list_template.get(i)["name"] for i in range(5)]
+    assert names == ["c", "d", "a", "e", "b"]
+    assert scored_list_template.get(2) is record
+
+    scored_list_template.sort_by("stats.score", reverse=True)
+    names = [scored_list_template.get(i)["name"] for i in range(5)]
+    assert names == ["b", "e", "d", "a", "c"]
+
+    with pytest.raises(ValueError):
+        scored_list_template.sort_by()
+
+
+def test_sort_by_capped(tmp_path, messages):
+    json_list = JSONListTemplate(
+        str(tmp_path / "test.json"), initial_data=messages, max_length=4
+    )
+    json_list.sort_by("content")
+    assert [json_list.get(i)["content"] for i in range(4)] == sorted(
+        message["content"] for message in messages
+    )
@@ -5,6 +5,7 @@ import pytest
 
 from jsonpycraft.core.types import JSONMap
 from jsonpycraft.json.map import JSONMapTemplate
+from jsonpycraft.json.path import KeyPath
 
 
 @pytest.fixture(scope="function")
@@ -97,6 +98,13 @@ def test_read_nested_nonexistent_key(json_map_template):
     assert json_map_template.read_nested("nested", "nonexistent_key") is None
 
 
+def test_read_nested_only_steps_into_dicts(json_map_template, indexed_map_template):
+    for template in (json_map_template, indexed_map_template):
+        template.update_many({"name": "text", "items": [10, 20]})
+        assert template.read_nested("name", 0) is None
+        assert template.read_nested("items", 0) is None
+
+
 def test_update_and_create_behavior(json_map_template):
     # Update existing key
     assert json_map_template.update("new_key", "updated_value") is True
@@ -136,3 +144,180 @@ def test_nested_operations_with_non_dict(json_map_template):
 
     # Test nested delete on non-dict key
     assert json_map_template.delete_nested("non_dict_key", "key") is True
+
+
+def test_nested_operations_with_key_path(json_map_template):
+    path = KeyPath.parse("nested.deep.key")
+    assert json_map_template.create_nested("value", path) is True
+    assert json_map_template.read_nested(path) == "value"
+    assert json_map_template.update_nested("updated", path) is True
+    assert json_map_template.read_nested(KeyPath.parse("/nested/deep/key")) == "updated"
+    assert json_map_template.delete_nested(path) is True
+    assert json_map_template.read_nested(path) is None
+
+
+def test_nested_operations_require_keys(json_map_template):
+    with pytest.raises(ValueError):
+        json_map_template.read_nested()
+    with pytest.raises(ValueError):
+        json_map_template.update_nested("value", KeyPath(()))
+    with pytest.raises(TypeError):
+        json_map_template.update_nested("value", "nested", 1.5)
+
+
+@pytest.fixture(scope="function")
+def indexed_map_template(tmp_path) -> JSONMapTemplate:
+    data = {"a": {"b": {"c": 1, "d": 2}}, "x": "leaf"}
+    return JSONMapTemplate(str(tmp_path / "indexed.json"), data, indexed=True)
+
+
+def test_index_serves_repeated_reads(indexed_map_template):
+    assert indexed_map_template.indexed is True
+    assert indexed_map_template.read_nested("a", "b", "c") == 1
+    assert indexed_map_template._index[("a", "b", "c")] == 1
+    assert indexed_map_template.read_nested(KeyPath.parse("a.b.c")) == 1
+
+
+def test_index_invalidated_by_update(indexed_map_template):
+    assert indexed_map_template.read_nested("a", "b", "c") == 1
+    assert indexed_map_template.read_nested("a", "b", "d") == 2
+    indexed_map_template.update_nested(10, "a", "b", "c")
+    assert indexed_map_template.read_nested("a", "b", "c") == 10
+    assert ("a", "b", "d") in indexed_map_template._index
+
+
+def test_index_invalidated_by_replaced_intermediate(indexed_map_template):
+    assert indexed_map_template.read_nested("a", "b", "d") == 2
+    assert indexed_map_template.read_nested("a", "b") == {"c": 1, "d": 2}
+    indexed_map_template.update_nested(3, "a", "b", "e", overwrite=True)
+    assert indexed_map_template.read_nested("a", "b", "d") is None
+    assert indexed_map_template.read_nested("a", "b") == {"e": 3}
+
+
+def test_index_invalidates_cached_misses(indexed_map_template):
+    assert indexed_map_template.read_nested("x", "y") is None
+    assert indexed_map_template.read_nested("n", "m") is None
+    indexed_map_template.update_nested("value", "x", "y")
+    assert indexed_map_template.read_nested("x", "y") == "value"
+    indexed_map_template.create_nested("created", "n", "m")
+    assert indexed_map_template.read_nested("n", "m") == "created"
+
+
+def test_index_invalidated_by_delete(indexed_map_template):
+    assert indexed_map_template.read_nested("a", "b", "c") == 1
+    assert indexed_map_template.delete_nested("a", "b") is True
+    assert indexed_map_template.read_nested("a", "b", "c") is None
+    assert indexed_map_template.read_nested("a") == {}
+    indexed_map_template.delete("a")
+    assert indexed_map_template.read_nested("a") is None
+
+
+def test_index_reset_on_load(indexed_map_template):
+    assert indexed_map_template.read_nested("a", "b", "c") == 1
+    indexed_map_template.save_json({"a": {"b": {"c": 5}}})
+    assert indexed_map_template.read_nested("a", "b", "c") == 5
+    indexed_map_template.data["a"]["b"]["c"] = 6
+    indexed_map_template.invalidate_index("a", "b", "c")
+    assert indexed_map_template.read_nested("a", "b", "c") == 6
+
+
+def test_update_many(json_map_template):
+    count = json_map_template.update_many(
+        {
+            "key1": "updated",
+            "nested.key2": "updated",
+            ("nested", "deep", "a"): 1,
+            "/nested/deep/b": 2,
+            "key1.child": 3,
+        }
+    )
+    assert count == 5
+    assert json_map_template.data == {
+        "key1": {"child": 3},
+        "nested": {"key2": "updated", "deep": {"a": 1, "b": 2}},
+    }
+
+
+def test_update_many_is_atomic(json_map_template):
+    with pytest.raises(TypeError):
+        json_map_template.update_many({"key1": "updated", ("nested", 1.5): 2})
+    assert json_map_template.data == {"key1": "value1", "nested": {"key2": "value2"}}
+
+
+def test_update_many_rolls_back_on_failure(json_map_template):
+    class FrozenDict(dict):
+        def __setitem__(self, key, value):
+            raise TypeError("frozen")
+
+    json_map_template.data["frozen"] = FrozenDict()
+    with pytest.raises(TypeError):
+        json_map_template.update_many({"key1": "updated", "frozen.key": 1})
+    assert json_map_template.read("key1") == "value1"
+
+
+def test_delete_many(json_map_template):
+    json_map_template.update_many({"nested.a.b": 1, "nested.c": 2})
+    count = json_map_template.delete_many(
+        ["nested.a", "nested.a.b", "missing.key", ("nested", "c")]
+    )
+    assert count == 3
+    assert json_map_template.data == {"key1": "value1", "nested": {"key2": "value2"}}
+
+
+def test_bulk_operations_invalidate_index(indexed_map_template):
+    assert indexed_map_template.read_nested("a", "b", "c") == 1
+    assert indexed_map_template.read_nested("a", "b", "d") == 2
+    indexed_map_template.update_many({"a.b.c": 5})
+    assert indexed_map_template.read_nested("a", "b", "c") == 5
+    indexed_map_template.delete_many(["a.b.d"])
+    assert indexed_map_template.read_nested("a", "b", "d") is None
+
+
+def test_transaction_commits(json_map_template):
+    with json_map_template.transaction() as template:
+        template.update_nested("a", "nested", "key2")
+        template.create("key3", [1])
+    assert json_map_template.read_nested("nested", "key2") == "a"
+    assert json_map_template.read("key3") == [1]
+
+
+def test_transaction_rolls_back(indexed_map_template):
+    original = {"a": {"b": {"c": 1, "d": 2}}, "x": "leaf"}
+    assert indexed_map_template.read_nested("a", "b", "c") == 1
+    with pytest.raises(RuntimeError):
+        with indexed_map_template.transaction():
+            indexed_map_template.update_nested(5, "a", "b", "c")
+            indexed_map_template.update_nested(1, "x", "y")
+            indexed_map_template.create_nested(2, "new", "path")
+            indexed_map_template.delete_nested("a", "b", "d")
+            indexed_map_template.update_many({"a.e": 3})
+            indexed_map_template.merge({"m": {"n": 1}})
+            indexed_map_template.apply_patch([{"op": "remove", "path": "/a/b"}])
+            raise RuntimeError("abort")
+    assert indexed_map_template.data == original
+    assert indexed_map_template.read_nested("a", "b", "c") == 1
+
+
+def test_transaction_rollback_keeps_key_order(json_map_template):
+    json_map_template.update_many({"z": 1, "y": 2})
+    order = list(json_map_template.data)
+    with pytest.raises(RuntimeError):
+        with json_map_template.transaction():
+            json_map_template.delete("key1")
+            json_map_template.delete_many(["z"])
+            json_map_template.apply_patch([{"op": "remove", "path": "/nested"}])
+            raise RuntimeError("abort")
+    assert list(json_map_template.data) == order
+
+
+def test_transaction_savepoints(json_map_template):
+    with json_map_template.transaction():
+        json_map_template.update("key1", "outer")
+        with pytest.raises(ValueError):
+            with json_map_template.transaction():
+                json_map_template.update("key1", "inner")
+                json_map_template.delete("nested")
+                raise ValueError("abort inner")
+        assert json_map_template.read("key1") == "outer"
+        assert "nested" in json_map_template.data
+    assert json_map_template.read("key1") == "outer"
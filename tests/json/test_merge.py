@@ -0,0 +1,128 @@
+"""
+tests/json/test_merge.py
+"""
+
+import pytest
+
+from jsonpycraft.json.map import JSONMapTemplate
+from jsonpycraft.json.merge import copy_tree, deep_merge
+
+
+@pytest.fixture
+def base():
+    return {
+        "db": {"host": "localhost", "port": 5432},
+        "plugins": ["auth", "cache"],
+        "name": "app",
+    }
+
+
+@pytest.fixture
+def layer():
+    return {
+        "db": {"host": "db.internal", "pool": {"size": 10}},
+        "plugins": ["cache", "metrics"],
+        "name": "site",
+    }
+
+
+def test_overwrite(base, layer):
+    assert deep_merge(base, layer) == 4
+    assert base == {
+        "db": {"host": "db.internal", "port": 5432, "pool": {"size": 10}},
+        "plugins": ["cache", "metrics"],
+        "name": "site",
+    }
+    assert base["db"]["pool"] is not layer["db"]["pool"]
+
+
+def test_keep_existing(base, layer):
+    deep_merge(base, layer, strategy="keep")
+    assert base["db"] == {"host": "localhost", "port": 5432, "pool": {"size": 10}}
+    assert base["name"] == "app"
+    assert base["plugins"] == ["auth", "cache"]
+
+
+def test_keep_with_list_strategy(base, layer):
+    deep_merge(base, layer, strategy="keep", list_strategy="replace")
+    assert base["plugins"] == ["cache", "metrics"]
+    assert base["name"] == "app"
+
+
+def test_list_strategies(base, layer):
+    appended = copy_tree(base)
+    deep_merge(appended, layer, list_strategy="append")
+    assert appended["plugins"] == ["auth", "cache", "cache", "metrics"]
+
+    deep_merge(base, layer, list_strategy="union")
+    assert base["plugins"] == ["auth", "cache", "metrics"]
+
+    records = {"items": [{"id": 1}]}
+    deep_merge(records, {"items": [{"id": 1}, {"id": 2}]}, list_strategy="union")
+    assert records["items"] == [{"id": 1}, {"id": 2}]
+
+
+def test_union_compares_types():
+    target = {"items": [1, {"id": 1}]}
+    source = {"items": [True, 1.0, 1, {"id": True}, {"id": 1}]}
+    deep_merge(target, source, list_strategy="union")
+    assert target["items"] == [1, {"id": 1}, True, 1.0, {"id": True}]
+    assert [type(item) for item in target["items"][:4]] == [int, dict, bool, float]
+
+
+def test_overrides(base, layer):
+    deep_merge(base, layer, overrides={"db": "keep", "plugins": "union"})
+    assert base["db"]["host"] == "localhost"
+    assert base["db"]["pool"] == {"size": 10}
+    assert base["plugins"] == ["auth", "cache", "metrics"]
+    assert base["name"] == "site"
+
+
+def test_invalid_strategy(base, layer):
+    with pytest.raises(ValueError):
+        deep_merge(base, layer, strategy="merge")
+    with pytest.raises(ValueError):
+        deep_merge(base, layer, overrides={"db": "merge"})
+
+
+def test_identical_subtrees_are_skipped(base):
+    shared = {"deep": {"value": 1}}
+    base["shared"] = shared
+    assert deep_merge(base, {"shared": shared}) == 0
+
+
+def test_deep_trees_do_not_recurse():
+    depth = 5000
+    target = node = {}
+    source = other = {}
+    for _ in range(depth):
+        node["child"] = {}
+        other["child"] = {}
+        node, other = node["child"], other["child"]
+    other["leaf"] = True
+    assert deep_merge(target, source) == 1
+    copied = copy_tree(target)
+    for _ in range(depth):
+        copied = copied["child"]
+    assert copied == {"leaf": True}
+
+
+def test_template_merge(tmp_path, base, layer):
+    template = JSONMapTemplate(str(tmp_path / "merge.json"), base, indexed=True)
+    assert template.read_nested("db", "host") == "localhost"
+    other = JSONMapTemplate(str(tmp_path / "other.json"), layer)
+    template.merge(other, list_strategy="union")
+    assert template.read_nested("db", "host") == "db.internal"
+    assert template.read_nested("plugins") == ["auth", "cache", "metrics"]
+
+
+def test_template_merge_is_atomic(tmp_path, base):
+    class FrozenDict(dict):
+        def __setitem__(self, key, value):
+            raise TypeError("frozen")
+
+    base["frozen"] = FrozenDict()
+    template = JSONMapTemplate(str(tmp_path / "merge.json"), base)
+    with pytest.raises(TypeError):
+        template.merge({"name": "site", "frozen": {"key": 1}})
+    assert template.read("name") == "app"
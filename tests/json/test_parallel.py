@@ -0,0 +1,113 @@
+"""
+tests/json/test_parallel.py
+"""
+
+from operator import add
+
+import pytest
+
+from jsonpycraft.json.list import JSONListTemplate
+from jsonpycraft.json.parallel import parallel_filter, parallel_map, parallel_reduce
+
+
+def square(record):
+    return record["value"] ** 2
+
+
+def is_even(record):
+    return record["value"] % 2 == 0
+
+
+def sum_values(total, record):
+    return total + record["value"]
+
+
+def collect_values(values, record):
+    return values + [record["value"]]
+
+
+@pytest.fixture
+def records():
+    return [{"value": i} for i in range(50)]
+
+
+@pytest.fixture
+def json_list_template(tmp_path, records):
+    return JSONListTemplate(str(tmp_path / "records.json"), initial_data=records)
+
+
+def test_parallel_map_keeps_order(records):
+    expected = [square(record) for record in records]
+    assert parallel_map(square, records, serial_threshold=0) == expected
+    assert (
+        parallel_map(square, records, chunk_size=7, max_workers=2, serial_threshold=0)
+        == expected
+    )
+
+
+def test_parallel_filter_returns_original_records(records):
+    result = parallel_filter(
+        is_even, records, chunk_size=7, max_workers=2, serial_threshold=0
+    )
+    assert result == [record for record in records if is_even(record)]
+    assert all(any(r is record for record in records) for r in result)
+
+
+def test_parallel_reduce(records):
+    expected = sum(record["value"] for record in records)
+    assert (
+        parallel_reduce(
+            sum_values,
+            records,
+            0,
+            combine=add,
+            chunk_size=7,
+            max_workers=2,
+            serial_threshold=0,
+        )
+        == expected
+    )
+    assert parallel_reduce(sum_values, [], 0, combine=add, serial_threshold=0) == 0
+
+
+def test_parallel_reduce_changes_type(records):
+    result = parallel_reduce(
+        collect_values,
+        records,
+        [],
+        combine=add,
+        chunk_size=7,
+        max_workers=2,
+        serial_threshold=0,
+    )
+    assert result == list(range(50))
+
+
+def test_parallel_reduce_requires_combine(records):
+    assert parallel_reduce(collect_values, records, []) == list(range(50))
+    with pytest.raises(ValueError):
+        parallel_reduce(collect_values, records, [], serial_threshold=0)
+
+
+def test_serial_fallback_accepts_lambdas(records):
+    assert parallel_map(lambda record: record["value"], records) == list(range(50))
+
+
+def test_invalid_chunk_size(records):
+    with pytest.raises(ValueError):
+        parallel_map(square, records, chunk_size=0, serial_threshold=0)
+
+
+def test_list_template_parallel_methods(json_list_template, records):
+    assert json_list_template.parallel_map(
+        square, max_workers=2, serial_threshold=0
+    ) == [square(record) for record in records]
+    assert json_list_template.parallel_filter(
+        is_even, max_workers=2, serial_threshold=0
+    ) == [record for record in records if is_even(record)]
+    assert (
+        json_list_template.parallel_reduce(
+            sum_values, 0, combine=add, max_workers=2, serial_threshold=0
+        )
+        == 1225
+    )
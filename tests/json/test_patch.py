@@ -0,0 +1,172 @@
+"""
+tests/json/test_patch.py
+"""
+
+import pytest
+
+from jsonpycraft.core.errors import JSONPatchErrorHandler
+from jsonpycraft.json.map import JSONMapTemplate
+from jsonpycraft.json.merge import copy_tree
+from jsonpycraft.json.patch import apply_patch, diff
+
+
+@pytest.fixture
+def old():
+    return {
+        "db": {"host": "localhost", "port": 5432},
+        "plugins": ["auth", "cache", "metrics"],
+        "name": "app",
+    }
+
+
+@pytest.fixture
+def new():
+    return {
+        "db": {"host": "db.internal", "port": 5432, "pool": {"size": 10}},
+        "plugins": ["auth", "tracing"],
+        "a/b~c": True,
+    }
+
+
+def test_diff_identical(old):
+    assert diff(old, old) == []
+    assert diff(old, copy_tree(old)) == []
+
+
+def test_diff_round_trip(old, new):
+    patch = diff(old, new)
+    ops = {(op["op"], op["path"]) for op in patch}
+    assert ops == {
+        ("replace", "/db/host"),
+        ("add", "/db/pool"),
+        ("replace", "/plugins/1"),
+        ("remove", "/plugins/2"),
+        ("remove", "/name"),
+        ("add", "/a~1b~0c"),
+    }
+    assert apply_patch(old, patch) == new
+
+
+def test_diff_type_change():
+    patch = diff({"a": 1, "b": 1}, {"a": True, "b": 2})
+    assert {"op": "replace", "path": "/a", "value": True} in patch
+    assert diff({"a": [1]}, {"a": {"0": 1}}) == [
+        {"op": "replace", "path": "/a", "value": {"0": 1}}
+    ]
+
+
+def test_diff_nested_type_change():
+    assert diff({"a": {"x": 1}}, {"a": {"x": True}}) == [
+        {"op": "replace", "path": "/a/x", "value": True}
+    ]
+    assert diff({"a": [1]}, {"a": [1.0]}) == [
+        {"op": "replace", "path": "/a/0", "value": 1.0}
+    ]
+
+
+def test_diff_copies_values(old, new):
+    patch = diff(old, new)
+    added = next(op for op in patch if op["path"] == "/db/pool")
+    assert added["value"] is not new["db"]["pool"]
+
+
+def test_apply_operations():
+    document = {"a": {"b": 1}, "items": [1, 2, 3]}
+    patch = [
+        {"op": "test", "path": "/a/b", "value": 1},
+        {"op": "add", "path": "/items/-", "value": 4},
+        {"op": "add", "path": "/items/0", "value": 0},
+        {"op": "remove", "path": "/items/1"},
+        {"op": "copy", "from": "/a", "path": "/c"},
+        {"op": "move", "from": "/a/b", "path": "/c/d"},
+        {"op": "replace", "path": "/items/0", "value": -1},
+    ]
+    assert apply_patch(document, patch) is document
+    assert document == {"a": {}, "items": [-1, 2, 3, 4], "c": {"b": 1, "d": 1}}
+
+
+def test_apply_reports_integer_indices():
+    document = {"items": [{"name": "a"}, {"name": "b"}]}
+    changed = []
+    patch = [
+        {"op": "replace", "path": "/items/1/name", "value": "c"},
+        {"op": "remove", "path": "/items/0"},
+    ]
+    apply_patch(document, patch, on_change=changed.append)
+    assert changed == [("items", 1, "name"), ("items",)]
+
+
+def test_apply_root_replacement():
+    document = {"a": 1}
+    result = apply_patch(document, [{"op": "replace", "path": "", "value": {"b": 2}}])
+    assert result == {"b": 2}
+    assert document == {"a": 1}
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        {"op": "remove", "path": "/missing"},
+        {"op": "replace", "path": "/items/9", "value": 1},
+        {"op": "add", "path": "/items/01", "value": 1},
+        {"op": "test", "path": "/a", "value": True},
+        {"op": "move", "from": "/b", "path": "/b/c"},
+        {"op": "add", "path": "/a"},
+        {"op": "invalid", "path": "/a"},
+        {"op": "add", "path": "a", "value": 1},
+    ],
+)
+def test_apply_is_atomic(operation):
+    document = {"a": 1, "b": {}, "items": [1, 2]}
+    expected = copy_tree(document)
+    patch = [
+        {"op": "add", "path": "/items/0", "value": 0},
+        {"op": "remove", "path": "/items/2"},
+        {"op": "replace", "path": "/a", "value": 2},
+        {"op": "add", "path": "/b/c", "value": 3},
+        operation,
+    ]
+    with pytest.raises(JSONPatchErrorHandler):
+        apply_patch(document, patch)
+    assert document == expected
+
+
+def test_map_template_patch(tmp_path):
+    template = JSONMapTemplate(
+        tmp_path / "patch.json",
+        initial_data={"db": {"host": "localhost"}, "items": [1, 2]},
+        indexed=True,
+    )
+    assert template.read_nested("db", "host") == "localhost"
+    assert template.read_nested("items") == [1, 2]
+
+    target = {"db": {"host": "db.internal"}, "items": [1]}
+    template.apply_patch(template.diff(target))
+    assert template.data == target
+    assert template.read_nested("db", "host") == "db.internal"
+    assert template.read_nested("items") == [1]
+
+
+def test_map_template_patch_list_item(tmp_path):
+    template = JSONMapTemplate(
+        tmp_path / "patch.json", initial_data={"items": [1, 2]}, indexed=True
+    )
+    changes = []
+    template.subscribe(["items", 0], changes.extend)
+    assert template.read_nested("items") == [1, 2]
+
+    template.apply_patch([{"op": "replace", "path": "/items/0", "value": 3}])
+    assert template.read_nested("items") == [3, 2]
+    assert [path.keys for path in changes] == [("items", 0)]
+
+
+def test_map_template_root_must_be_object(tmp_path):
+    template = JSONMapTemplate(tmp_path / "patch.json", initial_data={"a": 1})
+    with pytest.raises(JSONPatchErrorHandler):
+        template.apply_patch(
+            [
+                {"op": "add", "path": "/b", "value": 2},
+                {"op": "replace", "path": "", "value": [1]},
+            ]
+        )
+    assert template.data == {"a": 1}
@@ -0,0 +1,62 @@
+"""
+tests/json/test_path.py
+"""
+
+import pytest
+
+from jsonpycraft.json.path import KeyPath
+
+
+def test_from_dotted():
+    path = KeyPath.from_dotted("app.logs.general")
+    assert path.keys == ("app", "logs", "general")
+    assert path.parent == ("app", "logs")
+    assert path.last == "general"
+    assert str(path) == "app.logs.general"
+
+
+def test_parsed_paths_are_cached():
+    assert KeyPath.from_dotted("a.b.c") is KeyPath.from_dotted("a.b.c")
+    assert KeyPath.from_pointer("/a/b") is KeyPath.from_pointer("/a/b")
+
+
+def test_from_pointer():
+    path = KeyPath.from_pointer("/a~1b/m~0n/")
+    assert path.keys == ("a/b", "m~n", "")
+    assert path.to_pointer() == "/a~1b/m~0n/"
+    assert KeyPath.from_pointer("").keys == ()
+
+    with pytest.raises(ValueError):
+        KeyPath.from_pointer("a/b")
+
+
+def test_parse_detects_syntax():
+    assert KeyPath.parse("/a/b") == KeyPath.parse("a.b")
+    assert hash(KeyPath.parse("/a/b")) == hash(KeyPath(("a", "b")))
+
+
+def test_coerce():
+    path = KeyPath(("a", "b"))
+    assert KeyPath.coerce(path) is path
+    assert KeyPath.coerce("a.b") == path
+    assert KeyPath.coerce(["a", "b"]) == path
+
+
+def test_invalid_key_type():
+    with pytest.raises(TypeError):
+        KeyPath(("a", 1.5))
+
+
+def test_get():
+    data = {"a": {"b": {"c": 1}}, "s": "text"}
+    assert KeyPath.parse("a.b.c").get(data) == 1
+    assert KeyPath.parse("a.x.c").get(data) is None
+    assert KeyPath.parse("s.x").get(data, "default") == "default"
+    assert KeyPath(()).get(data) is data
+
+
+def test_get_only_steps_into_mappings():
+    data = {"s": "text", "items": [10, 20]}
+    assert KeyPath(("s", 0)).get(data) is None
+    assert KeyPath(("items", 0)).get(data) is None
+    assert KeyPath(("items", 0)).get(data, "default") == "default"
@@ -0,0 +1,234 @@
+"""
+tests/json/test_persistent.py
+"""
+
+import json
+import random
+
+import pytest
+
+from jsonpycraft.json.map import JSONMapTemplate
+from jsonpycraft.json.persistent import (
+    PersistentMap,
+    PersistentMapTemplate,
+    freeze,
+    thaw,
+)
+
+
+class CollidingKey:
+    """A key type whose instances share a few hash values."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        return self.value % 3
+
+    def __eq__(self, other):
+        return isinstance(other, CollidingKey) and other.value == self.value
+
+
+@pytest.fixture
+def template(tmp_path):
+    return PersistentMapTemplate(
+        tmp_path / "persistent.json",
+        initial_data={
+            "db": {"host": "localhost", "port": 5432},
+            "plugins": ["auth", "cache"],
+        },
+        indexed=True,
+    )
+
+
+def test_persistent_map_matches_dict():
+    rng = random.Random(0)
+    persistent = PersistentMap()
+    expected = {}
+    for _ in range(5000):
+        key = rng.choice(
+            [
+                rng.randrange(1000),
+                str(rng.randrange(100)),
+                CollidingKey(rng.randrange(30)),
+            ]
+        )
+        if key in expected and rng.random() < 0.3:
+            persistent = persistent.delete(key)
+            del expected[key]
+        else:
+            value = rng.random()
+            persistent = persistent.set(key, value)
+            expected[key] = value
+        assert len(persistent) == len(expected)
+
+    assert dict(persistent.items()) == expected
+    assert all(persistent[key] == value for key, value in expected.items())
+    assert PersistentMap(expected) == expected
+
+
+def test_persistent_map_keeps_insertion_order():
+    keys = [f"key{index}" for index in range(100)]
+    keys += [CollidingKey(value) for value in range(10)]
+    persistent = PersistentMap()
+    for key in reversed(keys):
+        persistent = persistent.set(key, 0)
+    persistent = persistent.set(keys[50], 1)  # Updates keep their position
+    persistent = persistent.delete(keys[10]).set(keys[10], 2)
+    expected = list(reversed(keys))
+    expected.remove(keys[10])
+    expected.append(keys[10])
+    assert list(persistent) == expected
+    assert list(PersistentMap(dict.fromkeys(keys))) == keys
+
+
+def test_persistent_map_is_immutable():
+    original = PersistentMap({"a": 1})
+    updated = original.set("b", 2).delete("a")
+    assert dict(original.items()) == {"a": 1}
+    assert dict(updated.items()) == {"b": 2}
+    assert original.set("a", 1) is original
+    with pytest.raises(KeyError):
+        original.delete("missing")
+    assert original.get("missing") is None
+
+
+def test_freeze_thaw_round_trip():
+    data = {"a": {"b": [1, {"c": 2}]}, "d": "e"}
+    frozen = freeze(data)
+    assert isinstance(frozen["a"], PersistentMap)
+    assert isinstance(frozen["a"]["b"], tuple)
+    assert thaw(frozen) == data
+
+
+def test_freeze_thaw_deep_structure():
+    data = leaf = {}
+    for _ in range(3000):
+        leaf["child"] = [{}]
+        leaf = leaf["child"][0]
+    leaf["value"] = 1
+
+    frozen = freeze(data)
+    node = frozen
+    for _ in range(3000):
+        node = node["child"][0]
+    assert node["value"] == 1
+
+    node = thaw(frozen)
+    for _ in range(3000):
+        assert isinstance(node["child"], list)
+        node = node["child"][0]
+    assert node == {"value": 1}
+
+
+def test_diff_keeps_version(template):
+    snapshot = template.snapshot()
+    patch = template.diff({"db": {"port": 1}})
+    assert {"op": "replace", "path": "/db/port", "value": 1} in patch
+    assert template.snapshot() is snapshot
+
+
+def test_snapshot_is_isolated(template):
+    snapshot = template.snapshot()
+    assert template.snapshot() is snapshot
+
+    template.update_nested(5433, "db", "port")
+    template.delete_nested("db", "host")
+    template.create("name", "app")
+
+    assert snapshot["db"]["port"] == 5432
+    assert snapshot["db"]["host"] == "localhost"
+    assert "name" not in snapshot
+    assert template.read_nested("db", "port") == 5433
+    assert template.read_nested("db", "host") is None
+    # Untouched subtrees are shared between versions
+    assert template.snapshot()["plugins"] is snapshot["plugins"]
+
+
+def test_template_api(template):
+    assert template.create("db", {}) is False
+    assert template.create_nested(10, "db", "pool", "size") is True
+    assert template.create_nested(1, "db", "port", "x") is False
+    assert template.update("name", "app") is True
+    assert template.update_nested({"a": 1}, "db", "options", overwrite=True) is True
+    assert template.read_nested("db", "options", "a") == 1
+    assert template.delete("name") is True
+    assert template.delete("name") is False
+    assert template.delete_nested("db", "missing") is False
+
+    assert template.update_many({"db.host": "db.internal", "cache.ttl": 60}) == 2
+    assert template.delete_many(["cache", "cache.ttl", "missing"]) == 2
+    assert template.read_nested("db", "host") == "db.internal"
+    assert "cache" not in template.data
+
+
+def test_merge_and_patch(template):
+    snapshot = template.snapshot()
+    template.merge(
+        {"db": {"user": "admin"}, "plugins": ["metrics"]}, list_strategy="union"
+    )
+    assert template.read_nested("plugins") == ("auth", "cache", "metrics")
+    assert template.read_nested("db", "user") == "admin"
+
+    template.apply_patch(template.diff({"db": {"port": 1}}))
+    assert thaw(template.data) == {"db": {"port": 1}}
+    assert snapshot["db"]["host"] == "localhost"
+
+
+def test_save_and_load(template):
+    template.update_nested(5433, "db", "port")
+    template.save_json()
+    template.update_nested(1, "db", "port")
+    template.load_json()
+    assert isinstance(template.data, PersistentMap)
+    assert template.read_nested("db", "port") == 5433
+    assert thaw(template.data) == {
+        "db": {"host": "localhost", "port": 5433},
+        "plugins": ["auth", "cache"],
+    }
+
+
+@pytest.mark.parametrize("template_class", [JSONMapTemplate, PersistentMapTemplate])
+def test_create_nested_creates_intermediate_maps(tmp_path, template_class):
+    template = template_class(
+        tmp_path / "nested.json", initial_data={"a": {"s": "text"}}
+    )
+    assert template.create_nested(1, "a", "b", "c") is True
+    assert template.create_nested(2, "x", "y", "z") is True
+    assert template.create_nested(3, "a", "s", "z") is False
+    assert template.create_nested(4, "a", "b", "c") is False
+    assert template.read_nested("x", "y", "z") == 2
+    assert thaw(template.data) == {
+        "a": {"s": "text", "b": {"c": 1}},
+        "x": {"y": {"z": 2}},
+    }
+
+
+def test_save_keeps_key_order(tmp_path):
+    data = {name: {"z": 1, "a": 2, name: 3} for name in ("zeta", "alpha", "mid")}
+    file_path = tmp_path / "ordered.json"
+    template = PersistentMapTemplate(file_path, initial_data=data)
+    template.create("beta", 4)
+    template.save_json()
+
+    with open(file_path) as file:
+        saved = json.load(file)
+    assert list(saved) == ["zeta", "alpha", "mid", "beta"]
+    assert [list(value) for value in list(saved.values())[:3]] == [
+        ["z", "a", "zeta"],
+        ["z", "a", "alpha"],
+        ["z", "a", "mid"],
+    ]
+
+    template.load_json()
+    assert list(template.data) == ["zeta", "alpha", "mid", "beta"]
+
+
+def test_transaction_restores_version(template):
+    snapshot = template.snapshot()
+    with pytest.raises(RuntimeError):
+        with template.transaction():
+            template.update_nested(1, "db", "port")
+            template.merge({"db": {"user": "admin"}})
+            raise RuntimeError("abort")
+    assert template.snapshot() is snapshot
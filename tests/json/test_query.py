@@ -0,0 +1,97 @@
+"""
+tests/json/test_query.py
+"""
+
+import pytest
+
+from jsonpycraft.json.map import JSONMapTemplate
+from jsonpycraft.json.path import KeyPath
+from jsonpycraft.json.persistent import PersistentMapTemplate
+from jsonpycraft.json.query import PathPattern, query
+
+
+@pytest.fixture
+def config():
+    return {
+        "services": {
+            "api": {"port": 80, "timeout": 5, "hosts": ["a", "b", "c"]},
+            "db": {"port": 5432, "options": {"timeout": 30}},
+        },
+        "timeout": 60,
+    }
+
+
+def matches(data, pattern):
+    return {str(path): value for path, value in query(data, pattern)}
+
+
+def test_wildcard(config):
+    assert matches(config, "services.*.port") == {
+        "services.api.port": 80,
+        "services.db.port": 5432,
+    }
+    assert matches(config, "services.api.hosts.*") == {
+        "services.api.hosts.0": "a",
+        "services.api.hosts.1": "b",
+        "services.api.hosts.2": "c",
+    }
+
+
+def test_recursive_wildcard(config):
+    assert matches(config, "**.timeout") == {
+        "timeout": 60,
+        "services.api.timeout": 5,
+        "services.db.options.timeout": 30,
+    }
+    assert matches(config, "services.**.options") == {
+        "services.db.options": {"timeout": 30}
+    }
+    assert len(matches(config, "**")) == 14
+
+
+def test_recursive_wildcard_yields_each_path_once():
+    data = {"a": {"x": {"a": {"b": 1}}, "b": 2}}
+    paths = [str(path) for path, _ in query(data, "**.a.**.b")]
+    assert sorted(paths) == ["a.b", "a.x.a.b"]
+
+
+def test_list_selectors(config):
+    assert matches(config, "services.api.hosts[-1]") == {"services.api.hosts.2": "c"}
+    assert matches(config, "services.api.hosts[0:2]") == {
+        "services.api.hosts.0": "a",
+        "services.api.hosts.1": "b",
+    }
+    assert matches(config, "services.api.hosts[::2]") == {
+        "services.api.hosts.0": "a",
+        "services.api.hosts.2": "c",
+    }
+    assert len(matches(config, "services.*.hosts[*]")) == 3
+    assert matches(config, "services.api.hosts[9]") == {}
+    assert matches([[1, 2], [3]], "[*][0]") == {"0.0": 1, "1.0": 3}
+
+
+def test_matches_are_lazy_key_paths(config):
+    results = query(config, "**.port")
+    path, value = next(results)
+    assert isinstance(path, KeyPath)
+    assert path.get(config) == value
+
+
+def test_patterns_are_cached():
+    assert PathPattern.compile("a.*.b") is PathPattern.compile("a.*.b")
+    assert PathPattern.compile("a.**.**.b").steps == PathPattern.compile("a.**.b").steps
+
+
+@pytest.mark.parametrize("pattern", ["", "a..b", "a[x]", "**[0]", "a[1:2:0]", "a]"])
+def test_invalid_patterns(pattern):
+    with pytest.raises(ValueError):
+        PathPattern.compile(pattern)
+
+
+def test_template_query(tmp_path, config):
+    for template_class in (JSONMapTemplate, PersistentMapTemplate):
+        template = template_class(tmp_path / "query.json", initial_data=config)
+        ports = {str(path): value for path, value in template.query("services.*.port")}
+        assert ports == {"services.api.port": 80, "services.db.port": 5432}
+        hosts = [value for _, value in template.query("**.hosts[1:]")]
+        assert hosts == ["b", "c"]
@@ -0,0 +1,134 @@
+"""
+tests/json/test_record.py
+"""
+
+import json
+
+import pytest
+
+from jsonpycraft.json.compact import footprint
+from jsonpycraft.json.list import JSONListTemplate
+from jsonpycraft.json.record import (
+    record_type,
+    record_type_from_sample,
+    record_type_from_schema,
+)
+
+
+def is_user(message):
+    return message["role"] == "user"
+
+
+@pytest.fixture
+def messages():
+    return [
+        {"role": "user", "content": "Hello", "meta": {"lang": "en"}},
+        {"role": "assistant", "content": "Hi"},
+    ]
+
+
+def test_record_round_trip(messages):
+    Message = record_type_from_sample(messages, name="Message")
+    assert Message._fields == ("role", "content", "meta")
+    assert Message._required == {"role", "content"}
+
+    records = [Message.from_dict(message) for message in messages]
+    assert records[0].content == "Hello"
+    assert records[0].meta is messages[0]["meta"]
+    assert not hasattr(records[1], "meta")
+    assert [record.to_dict() for record in records] == messages
+    assert records[1]["role"] == "assistant"
+    assert records[1].get("meta") is None
+    assert records[0] == Message.from_dict(messages[0])
+    assert repr(records[1]) == "Message(role='assistant', content='Hi')"
+    assert not hasattr(records[0], "__dict__")
+
+
+def test_record_validation():
+    Point = record_type("Point", ["x", "y"])
+    with pytest.raises(ValueError, match="missing field 'y'"):
+        Point.from_dict({"x": 1})
+    with pytest.raises(ValueError, match="no field 'z'"):
+        Point.from_dict({"x": 1, "y": 2, "z": 3})
+    with pytest.raises(KeyError):
+        Point.from_dict({"x": 1, "y": 2})["z"]
+    for fields in (["x", "x"], ["class"], ["_private"], ["to_dict"], ["a-b"]):
+        with pytest.raises(ValueError):
+            record_type("Invalid", fields)
+    with pytest.raises(ValueError):
+        record_type("Invalid", ["x"], required=["y"])
+    with pytest.raises(ValueError):
+        record_type_from_sample([])
+
+
+def test_record_type_from_schema():
+    User = record_type_from_schema(
+        {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"id": {"type": "integer"}, "email": {"type": "string"}},
+                "required": ["id"],
+            },
+        },
+        name="User",
+    )
+    assert User._fields == ("id", "email")
+    assert User.from_dict({"id": 1}).to_dict() == {"id": 1}
+    with pytest.raises(ValueError):
+        record_type_from_schema({"type": "object"})
+
+
+@pytest.mark.parametrize("max_length", [None, 10])
+def test_list_template_records(tmp_path, messages, max_length):
+    Message = record_type_from_sample(messages, name="Message")
+    file_path = tmp_path / "records.json"
+    template = JSONListTemplate(
+        file_path, initial_data=messages, max_length=max_length, record_type=Message
+    )
+    assert template.record_type is Message
+    assert template.get(0).role == "user"
+
+    template.append({"role": "user", "content": "Bye"})
+    template.insert(0, Message.from_dict({"role": "system", "content": "Be brief"}))
+    assert isinstance(template.get(3), Message)
+    assert [record.content for record in template.top_k("content", 1)] == ["Hi"]
+    with pytest.raises(ValueError):
+        template.append({"content": "No role"})
+
+    template.save_json()
+    assert json.loads(file_path.read_text())[0] == {
+        "role": "system",
+        "content": "Be brief",
+    }
+    assert template.data[1] == messages[0]
+
+    template.clear()
+    template.load_json()
+    assert template.length == 4
+    assert all(isinstance(record, Message) for record in template._data)
+
+
+@pytest.mark.parametrize("serial_threshold", [0, 100])
+def test_parallel_filter_returns_records(tmp_path, messages, serial_threshold):
+    Message = record_type_from_sample(messages, name="Message")
+    template = JSONListTemplate(
+        tmp_path / "records.json", initial_data=messages * 3, record_type=Message
+    )
+    matches = template.parallel_filter(
+        is_user, max_workers=2, serial_threshold=serial_threshold
+    )
+    assert len(matches) == 3
+    assert all(
+        match is template._data[index] for match, index in zip(matches, (0, 2, 4))
+    )
+
+    matches[0].content = "Changed"
+    assert template.get(0).content == "Changed"
+
+
+def test_records_use_less_memory(messages):
+    records = [dict(messages[1], content=str(i)) for i in range(1000)]
+    Message = record_type_from_sample(records, name="Message")
+    typed = [Message.from_dict(record) for record in records]
+    assert footprint(typed) < footprint(records) * 0.6
@@ -0,0 +1,132 @@
+"""
+tests/json/test_schema.py
+"""
+
+import pytest
+
+from jsonpycraft.core.errors import JSONSchemaErrorHandler
+from jsonpycraft.json.list import JSONListTemplate
+from jsonpycraft.json.map import JSONMapTemplate
+from jsonpycraft.json.schema import Schema
+
+SERVICE = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "minLength": 1, "pattern": "^[a-z]+$"},
+        "port": {"type": "integer", "minimum": 1, "maximum": 65535},
+        "tags": {"type": "array", "items": {"type": "string"}, "uniqueItems": True},
+        "mode": {"enum": ["active", "standby"]},
+    },
+    "required": ["name", "port"],
+    "additionalProperties": False,
+}
+
+
+@pytest.fixture
+def schema():
+    return Schema(SERVICE)
+
+
+def test_valid(schema):
+    assert schema.is_valid({"name": "api", "port": 80, "tags": ["a", "b"]})
+    assert schema.errors({"name": "api", "port": 80.0, "mode": "active"}) == []
+
+
+def test_errors_are_collected(schema):
+    errors = schema.errors(
+        {"name": "API", "port": 0, "tags": ["a", 1, "a"], "extra": True}
+    )
+    assert sorted(errors) == [
+        "Additional property is not allowed at /extra",
+        "Array items are not unique at /tags",
+        "Expected type 'string' at /tags/1",
+        "String does not match pattern '^[a-z]+$' at /name",
+        "Value 0 is less than the minimum of 1 at /port",
+    ]
+
+
+def test_validate_stops_at_first_error(schema):
+    with pytest.raises(JSONSchemaErrorHandler) as error:
+        schema.validate({"port": True})
+    assert str(error.value) == "Missing required property 'name' at \"\""
+
+    with pytest.raises(JSONSchemaErrorHandler) as error:
+        schema.validate({"port": True}, all_errors=True)
+    assert "; " in str(error.value)
+    assert not schema.is_valid([])
+
+
+def test_root_errors_use_empty_pointer():
+    assert Schema({"type": "object"}).errors([]) == ["Expected type 'object' at \"\""]
+
+
+def test_unique_items_compares_numbers_by_value():
+    unique = Schema({"uniqueItems": True})
+    assert not unique.is_valid([1, 1.0])
+    assert not unique.is_valid([[1], [1.0]])
+    assert not unique.is_valid([{"a": 1}, {"a": 1.0}])
+    assert unique.is_valid([1, True])
+    assert unique.is_valid([0, False, None])
+    assert unique.is_valid([{"a": 1}, {"a": True}])
+
+
+def test_combinators_and_constants():
+    schema = Schema(
+        {"anyOf": [{"type": "null"}, {"type": "number", "multipleOf": 0.5}]}
+    )
+    assert schema.is_valid(None) and schema.is_valid(1.5)
+    assert not schema.is_valid(1.2)
+
+    one = Schema({"oneOf": [{"type": "integer"}, {"type": "number", "minimum": 0}]})
+    assert one.is_valid(-1)
+    assert not one.is_valid(1)  # Matches both
+
+    constant = Schema({"const": 1})
+    assert constant.is_valid(1) and not constant.is_valid(True)
+    assert Schema(True).is_valid("anything")
+    assert not Schema(False).is_valid(None)
+
+
+@pytest.mark.parametrize(
+    "invalid",
+    [{"$ref": "#/definitions/a"}, {"type": "text"}, {"minimum": "1"}, "string"],
+)
+def test_invalid_schemas(invalid):
+    with pytest.raises(ValueError):
+        Schema(invalid)
+
+
+def test_map_template_validates_on_load_and_save(tmp_path):
+    path = tmp_path / "service.json"
+    template = JSONMapTemplate(path, {"name": "api", "port": 80}, schema=SERVICE)
+    template.save_json()
+
+    template.update("port", 0)
+    with pytest.raises(JSONSchemaErrorHandler):
+        template.save_json()
+    # The file is left untouched when validation fails
+    template.load_json()
+    assert template.read("port") == 80
+
+    path.write_text('{"name": "api"}')
+    with pytest.raises(JSONSchemaErrorHandler):
+        template.load_json()
+    assert template.read("port") == 80
+
+
+def test_list_template_validates_items(tmp_path):
+    records = JSONListTemplate(
+        tmp_path / "services.json",
+        schema={"type": "array", "items": SERVICE, "maxItems": 2},
+    )
+    records.append({"name": "api", "port": 80})
+    with pytest.raises(JSONSchemaErrorHandler):
+        records.append({"name": "db"})
+    with pytest.raises(JSONSchemaErrorHandler):
+        records.insert(0, {"name": "db", "port": "5432"})
+    assert records.length == 1
+
+    records.append({"name": "db", "port": 5432})
+    records.append({"name": "cache", "port": 6379})
+    with pytest.raises(JSONSchemaErrorHandler):
+        records.save_json()  # Three items exceed maxItems
@@ -0,0 +1,143 @@
+"""
+tests/json/test_subscription.py
+"""
+
+import pytest
+
+from jsonpycraft.json.map import JSONMapTemplate
+from jsonpycraft.json.path import KeyPath
+from jsonpycraft.json.persistent import PersistentMapTemplate
+from jsonpycraft.json.subscription import Subscriptions
+
+
+class Recorder:
+    """Collect the dotted paths of every delivery."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, paths):
+        self.calls.append([str(path) for path in paths])
+
+
+@pytest.fixture(params=[JSONMapTemplate, PersistentMapTemplate])
+def template(request, tmp_path):
+    return request.param(
+        tmp_path / "subscribed.json",
+        initial_data={"db": {"host": "localhost", "port": 5432}, "cache": {"ttl": 60}},
+    )
+
+
+def test_match_ancestors_descendants_and_wildcards():
+    subscriptions = Subscriptions()
+    for prefix in ("", "db", "db.port", "services.*.port", "cache"):
+        subscriptions.add(prefix, prefix)
+    assert len(subscriptions) == 5
+
+    assert set(subscriptions.match(("db", "port"))) == {"", "db", "db.port"}
+    assert set(subscriptions.match(("db",))) == {"", "db", "db.port"}
+    assert set(subscriptions.match(("services", "api", "port"))) == {
+        "",
+        "services.*.port",
+    }
+    assert set(subscriptions.match(("services", "api", "host"))) == {""}
+    assert set(subscriptions.match(())) == {
+        "",
+        "db",
+        "db.port",
+        "services.*.port",
+        "cache",
+    }
+
+
+def test_remove_prunes():
+    subscriptions = Subscriptions()
+    subscriptions.add("a.b.c", print)
+    assert subscriptions.remove("a.b", print) is False
+    assert subscriptions.remove("a.b.c", print) is True
+    assert subscriptions.remove("a.b.c", print) is False
+    assert len(subscriptions) == 0
+    assert subscriptions._root == [[], {}]
+
+
+def test_dispatch_groups_per_callback():
+    subscriptions = Subscriptions()
+    recorder = Recorder()
+    subscriptions.add("db", recorder)
+    subscriptions.add("db.port", recorder)
+    subscriptions.dispatch([("db", "port"), ("cache",), ("db", "host")])
+    assert recorder.calls == [["db.port", "db.host"]]
+
+
+def test_immediate_delivery(template):
+    recorder = Recorder()
+    template.subscribe("db", recorder)
+    template.update_nested(5433, "db", "port")
+    template.create("name", "app")
+    template.delete_nested(KeyPath(("db", "host")))
+    assert recorder.calls == [["db.port"], ["db.host"]]
+
+    assert template.unsubscribe("db", recorder) is True
+    template.update_nested(1, "db", "port")
+    assert len(recorder.calls) == 2
+
+
+def test_batch_operations_deliver_once(template):
+    recorder = Recorder()
+    template.subscribe("db", recorder)
+    template.update_many({"db.host": "db.internal", "db.port": 1, "cache.ttl": 5})
+    template.merge({"db": {"user": "admin"}, "cache": {"size": 1}})
+    template.delete_many(["db.user", "cache.size"])
+    assert [sorted(call) for call in recorder.calls] == [
+        ["db.host", "db.port"],
+        ["db.user"],
+        ["db.user"],
+    ]
+
+
+def test_transaction_delivers_on_commit_only(template):
+    recorder = Recorder()
+    template.subscribe("", recorder)
+    with template.transaction():
+        template.update_nested(1, "db", "port")
+        with pytest.raises(ValueError):
+            with template.transaction():
+                template.update_nested(2, "cache", "ttl")
+                raise ValueError("abort inner")
+        template.update_nested(3, "db", "port")
+        assert recorder.calls == []
+    assert recorder.calls == [["db.port"]]
+
+    with pytest.raises(RuntimeError):
+        with template.transaction():
+            template.delete("db")
+            raise RuntimeError("abort")
+    assert len(recorder.calls) == 1
+
+
+def test_failed_batch_is_not_delivered(template):
+    recorder = Recorder()
+    template.subscribe("", recorder)
+    with pytest.raises(ValueError):
+        template.merge({"db": {"port": 1}}, strategy="invalid")
+    assert recorder.calls == []
+
+
+def test_save_delivery(template):
+    immediate, saved = Recorder(), Recorder()
+    template.subscribe("db", immediate)
+    template.subscribe("db", saved, on_save=True)
+    template.update_nested(1, "db", "port")
+    template.update_nested(2, "db", "port")
+    template.update_nested(3, "cache", "ttl")
+    assert saved.calls == []
+    template.save_json()
+    assert saved.calls == [["db.port"]]
+    template.save_json()
+    assert len(saved.calls) == 1
+
+    template.update_nested(4, "db", "port")
+    template.load_json()
+    assert immediate.calls[-1] == [""]  # The root path
+    template.save_json()
+    assert len(saved.calls) == 1
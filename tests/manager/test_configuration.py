@@ -2,12 +2,21 @@
 tests/manager/test_configuration.py
 """
 
+import logging
+import os
+import threading
+import time
+
+import dotenv
 import pytest
 
 from jsonpycraft.core.singleton import Singleton
 from jsonpycraft.core.types import JSONMap
 from jsonpycraft.json.map import JSONMapTemplate
+from jsonpycraft.manager import configuration
 from jsonpycraft.manager.configuration import ConfigurationManager
+from jsonpycraft.manager.handlers import BoundedQueueHandler, stop_listeners
+from jsonpycraft.manager.shared import SharedConfiguration
 
 
 # Fixture to create a mock configuration data structure for testing
@@ -105,6 +114,155 @@ def test_set_value(config_manager: ConfigurationManager):
     assert config_manager.get_value("app.provider") == "updated_provider"
 
 
+def test_get_value_cache(config_manager: ConfigurationManager):
+    config_manager.clear_cache(reset_stats=True)
+    assert config_manager.get_value("app.provider") == "jsonpycraft"
+    assert config_manager.get_value("app.provider") == "jsonpycraft"
+    assert config_manager.get_value("app.logs.general.level") == "INFO"
+    assert config_manager.get_value("app.missing", "default") == "default"
+    assert config_manager.get_value("app.missing") is None
+    assert config_manager.cache_stats == {
+        "hits": 2,
+        "misses": 3,
+        "size": 3,
+        "hit_rate": 0.4,
+    }
+
+    # Setting a key drops its ancestors and everything below it, but not its siblings
+    general = config_manager.get_value("app.logs.general")
+    config_manager.set_value("app.logs.general.level", "DEBUG")
+    assert config_manager.get_value("app.logs.general.level") == "DEBUG"
+    assert config_manager.get_value("app.logs.general") is general
+    assert "app.provider" in config_manager._cache
+
+    config_manager.set_value("app.logs", {"error": {"level": "ERROR"}})
+    assert config_manager.get_value("app.logs.general.level") is None
+    assert config_manager.get_value("app.logs.error.level") == "ERROR"
+
+    # Replacing a value with a dictionary drops the keys cached below it
+    config_manager.set_value("app.provider.name", "craft")
+    assert config_manager.get_value("app.provider") == {"name": "craft"}
+    config_manager.set_value("app.provider.name", "other", overwrite=True)
+    assert config_manager.get_value("app.logs") is None
+
+    # Rolled back, reset and reloaded values are never served from the cache
+    with pytest.raises(RuntimeError):
+        with config_manager.transaction():
+            config_manager.set_value("app.provider.name", "rolled back")
+            assert config_manager.get_value("app.provider.name") == "rolled back"
+            raise RuntimeError
+    assert config_manager.get_value("app.provider.name") == "other"
+
+    config_manager.save()
+    config_manager.reset({"app": {"provider": "reset"}}, save=False)
+    assert config_manager.get_value("app.provider") == "reset"
+    config_manager.load()
+    assert config_manager.get_value("app.provider") == {"name": "other"}
+
+    config_manager.clear_cache(reset_stats=True)
+    assert config_manager.cache_stats["size"] == 0
+    assert config_manager.cache_stats["hit_rate"] == 0.0
+
+
+def test_layers(config_manager: ConfigurationManager, tmp_path):
+    host = JSONMapTemplate(
+        tmp_path / "host.json", initial_data={"app": {"provider": "host"}}
+    )
+    config_manager.add_layer("defaults", {"app": {"timeout": 30}}, index=0)
+    config_manager.add_layer("host", host)
+    config_manager.add_layer("env", {"app": {"timeout": 60}})
+    assert config_manager.layers == ["defaults", "file", "host", "env"]
+
+    assert config_manager.get_value("app.provider") == "host"
+    assert config_manager.get_value("app.timeout") == 60
+    assert config_manager.get_value("app.logs.general.level") == "INFO"
+    assert config_manager.data["app"]["provider"] == "jsonpycraft"
+
+    # Changes through a template layer are followed
+    host.update_nested("changed", "app", "provider")
+    assert config_manager.get_value("app.provider") == "changed"
+    host.delete_nested("app", "provider")
+    assert config_manager.get_value("app.provider") == "jsonpycraft"
+
+    # Writes go to the file unless a layer is named
+    config_manager.set_value("app.timeout", 10)
+    assert config_manager.get_value("app.timeout") == 60
+    config_manager.set_value("app.timeout", 10, layer="env")
+    assert config_manager.get_value("app.timeout") == 10
+    config_manager.set_value("app.retries", 3, layer="host")
+    assert config_manager.get_value("app.retries") == 3
+    assert dict(config_manager.query("app.ret*")) == {}
+    assert dict(config_manager.query("*.retries")) == {"app.retries": 3}
+
+    with pytest.raises(RuntimeError):
+        with config_manager.transaction():
+            config_manager.set_value("app.added", True)
+            assert config_manager.get_value("app.added") is True
+            raise RuntimeError
+    assert config_manager.get_value("app.added") is None
+
+    config_manager.remove_layer("env")
+    assert config_manager.get_value("app.timeout") == 10
+    config_manager.remove_layer("host")
+    host.update_nested("ignored", "app", "provider")
+    assert config_manager.get_value("app.provider") == "jsonpycraft"
+
+    with pytest.raises(KeyError):
+        config_manager.set_value("app.timeout", 1, layer="host")
+    with pytest.raises(ValueError):
+        config_manager.remove_layer("file")
+
+
+def test_snapshot_reads(tmp_path, mock_config):
+    config_manager = ConfigurationManager(
+        str(tmp_path / "snapshot.json"), initial_data=mock_config, snapshot_reads=True
+    )
+
+    def read_in_thread(key):
+        result = []
+        thread = threading.Thread(
+            target=lambda: result.append(config_manager.get_value(key))
+        )
+        thread.start()
+        thread.join()
+        return result[0]
+
+    assert config_manager.get_value("app.provider") == "jsonpycraft"
+    assert config_manager.get_value("home.type") == "dir"
+    config_manager.set_value("app.provider", "updated")
+    assert read_in_thread("app.provider") == "updated"
+
+    # Unrelated cached values survive a write
+    assert config_manager.cache_stats["size"] == 2
+    assert config_manager.cache_stats["misses"] == 3
+
+    # Other threads see none of a transaction until it commits
+    with config_manager.transaction():
+        config_manager.set_value("app.provider", "first")
+        config_manager.set_value("home.type", "file")
+        assert config_manager.get_value("app.provider") == "first"
+        assert read_in_thread("app.provider") == "updated"
+        assert read_in_thread("home.type") == "dir"
+    assert read_in_thread("app.provider") == "first"
+    assert read_in_thread("home.type") == "file"
+
+    with pytest.raises(RuntimeError):
+        with config_manager.transaction():
+            config_manager.set_value("app.provider", "rolled back")
+            raise RuntimeError
+    assert config_manager.get_value("app.provider") == "first"
+
+    # Snapshots are immutable
+    snapshot = config_manager.view
+    config_manager.reset({"app": {"provider": "reset"}}, save=False)
+    assert snapshot["app"]["provider"] == "first"
+    assert read_in_thread("app.provider") == "reset"
+    assert dict(config_manager.query("app.*")) == {"app.provider": "reset"}
+
+    with pytest.raises(ValueError):
+        config_manager.add_layer("defaults", {})
+
+
 def test_evaluate_path(config_manager: ConfigurationManager, monkeypatch):
     # Simulate the HOME environment variable
     monkeypatch.setenv("HOME", "/home/testuser")
@@ -118,9 +276,243 @@ def test_evaluate_path(config_manager: ConfigurationManager, monkeypatch):
     assert config_manager.evaluate_path("app.local", "tests/tmp") == "tests/local"
 
 
-def test_get_environment(config_manager: ConfigurationManager):
-    ...  # TODO
+def test_evaluate_path_cache(
+    config_manager: ConfigurationManager, monkeypatch, tmp_path
+):
+    monkeypatch.setenv("CONFIG_ROOT", str(tmp_path))
+    config_manager.set_value("cached", {"type": "dir", "path": "${CONFIG_ROOT}/cache"})
+
+    checks = []
+    exists = os.path.exists
+    monkeypatch.setattr(
+        os.path, "exists", lambda path: checks.append(path) or exists(path)
+    )
+
+    expected = str(tmp_path / "cache")
+    assert config_manager.evaluate_path("cached") == expected
+    assert config_manager.evaluate_path("cached") == expected
+    assert checks.count(expected) == 1
+    assert (tmp_path / "cache").is_dir()
+
+    # Changing a referenced variable resolves the path again
+    other = str(tmp_path / "other" / "cache")
+    monkeypatch.setenv("CONFIG_ROOT", str(tmp_path / "other"))
+    assert config_manager.evaluate_path("cached") == other
+    assert checks.count(other) == 1
+
+    # A removed directory is recreated once the cached path is forgotten
+    monkeypatch.setenv("CONFIG_ROOT", str(tmp_path))
+    (tmp_path / "cache").rmdir()
+    assert config_manager.evaluate_path("cached") == expected
+    assert not (tmp_path / "cache").exists()
+    assert config_manager.invalidate_paths("cached") == 2
+    assert config_manager.evaluate_path("cached") == expected
+    assert (tmp_path / "cache").is_dir()
+    assert config_manager.invalidate_paths() == 1
+
+    # Resolved paths expire after the time to live
+    config_manager._path_cache_ttl = 10.0
+    now = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    config_manager.evaluate_path("cached")
+    count = len(checks)
+    now[0] = 109.0
+    config_manager.evaluate_path("cached")
+    assert len(checks) == count
+    now[0] = 110.0
+    config_manager.evaluate_path("cached")
+    assert len(checks) == count + 1
+
+
+def test_evaluate_path_cache_is_bounded(
+    config_manager: ConfigurationManager, monkeypatch, tmp_path
+):
+    monkeypatch.setattr(configuration, "PATH_CACHE_SIZE", 2)
+    for name in ("a", "b", "c"):
+        config_manager.set_value(name, {"type": "dir", "path": str(tmp_path / name)})
+
+    config_manager.evaluate_path("a")
+    config_manager.evaluate_path("b")
+    config_manager.evaluate_path("a")  # Now more recently used than "b"
+    config_manager.evaluate_path("c")
+    assert config_manager.invalidate_paths("b") == 0
+    assert config_manager.invalidate_paths("a") == 1
+    assert config_manager.invalidate_paths() == 1
+
+
+def test_get_environment(config_manager: ConfigurationManager, monkeypatch, tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("API_KEY=first\nAPI_URL=https://example.com\n")
+    config_manager.set_value("env_file", {"type": "file", "path": str(env_file)})
+    monkeypatch.delenv("API_KEY", raising=False)
+    monkeypatch.delenv("API_URL", raising=False)
+
+    parses = []
+    dotenv_values = dotenv.dotenv_values
+    monkeypatch.setattr(
+        dotenv, "dotenv_values", lambda path: parses.append(path) or dotenv_values(path)
+    )
+
+    assert config_manager.get_environment("API_KEY", "env_file") == "first"
+    assert config_manager.get_environment_many(["API_KEY", "API_URL"], "env_file") == {
+        "API_KEY": "first",
+        "API_URL": "https://example.com",
+    }
+    assert len(parses) == 1
+    assert "API_KEY" not in os.environ
+
+    # A modified file is parsed again
+    env_file.write_text("API_KEY=second\n")
+    os.utime(env_file, ns=(0, 1_000_000_000))
+    assert config_manager.get_environment("API_KEY", "env_file") == "second"
+    assert len(parses) == 2
+
+    # The process environment takes precedence, and export fills in the rest
+    monkeypatch.setenv("API_KEY", "process")
+    assert config_manager.get_environment("API_KEY", "env_file") == "process"
+    env_file.write_text("API_KEY=third\nAPI_URL=https://example.org\n")
+    config_manager.get_environment("API_URL", "env_file", export=True)
+    assert os.environ["API_URL"] == "https://example.org"
+    assert os.environ["API_KEY"] == "process"
+
+    with pytest.raises(ValueError):
+        config_manager.get_environment("MISSING", "env_file")
+    config_manager.set_value("env_file.path", str(tmp_path / "missing.env"))
+    with pytest.raises(ValueError):
+        config_manager.get_environment("API_KEY", "env_file")
+
+
+def test_get_logger(config_manager: ConfigurationManager, tmp_path):
+    log_file = tmp_path / "queued.log"
+    config_manager.set_value(
+        "app.logs.queued",
+        {"path": str(log_file), "type": "file", "level": "INFO", "max_bytes": 1024},
+    )
+
+    logger = config_manager.get_logger(
+        "app.logs.queued", "test_get_logger", logger_format="%(message)s", queued=True
+    )
+    assert isinstance(logger.handlers[0], BoundedQueueHandler)
+    assert logger.level == logging.INFO
+    # An existing logger keeps its handler
+    assert config_manager.get_logger("app.logs.queued", "test_get_logger") is logger
+    assert len(logger.handlers) == 1
+
+    try:
+        logger.debug("filtered")
+        logger.info("queued")
+        stop_listeners()
+    finally:
+        logger.handlers.clear()
+    assert log_file.read_text() == "queued\n"
+
+    with pytest.raises(ValueError):
+        config_manager.get_logger("app.logs.missing", "test_get_logger_missing")
+
+
+def test_transaction(config_manager):
+    with config_manager.transaction():
+        config_manager.set_value("app.provider", "other")
+    assert config_manager.get_value("app.provider") == "other"
+
+    with pytest.raises(RuntimeError):
+        with config_manager.transaction():
+            config_manager.set_value("app.provider", "rolled back")
+            config_manager.set_value("app.new.key", 1)
+            raise RuntimeError("abort")
+    assert config_manager.get_value("app.provider") == "other"
+    assert config_manager.get_value("app.new") is None
+
+
+def test_transaction_rolls_back_layers(config_manager, tmp_path):
+    host = JSONMapTemplate(tmp_path / "host.json", initial_data={"a": {"x": 1}})
+    env = {"a": {"y": 2}}
+    config_manager.add_layer("host", host)
+    config_manager.add_layer("env", env)
+
+    with pytest.raises(RuntimeError):
+        with config_manager.transaction():
+            config_manager.set_value("a.x", 99, layer="host")
+            config_manager.set_value("a.y", 99, layer="env")
+            config_manager.set_value("b.c", 99, overwrite=True, layer="env")
+            assert config_manager.get_value("a.x") == 99
+            assert config_manager.get_value("a.y") == 99
+            raise RuntimeError("abort")
+    assert host.data == {"a": {"x": 1}}
+    assert env == {"a": {"y": 2}}
+    assert config_manager.get_value("a") == {"x": 1, "y": 2}
+    assert config_manager.get_value("b") is None
+
+    # A committed inner block is rolled back with the outer one
+    with pytest.raises(RuntimeError):
+        with config_manager.transaction():
+            with config_manager.transaction():
+                config_manager.set_value("a.x", 5, layer="host")
+                config_manager.set_value("a.y", 5, layer="env")
+            raise RuntimeError("abort")
+    assert config_manager.get_value("a") == {"x": 1, "y": 2}
+
+    with config_manager.transaction():
+        config_manager.set_value("a.x", 7, layer="host")
+        config_manager.set_value("a.y", 7, layer="env")
+    assert host.data == {"a": {"x": 7}}
+    assert config_manager.get_value("a") == {"x": 7, "y": 7}
+
+
+def test_query(config_manager):
+    paths = dict(config_manager.query("app.logs.*.path"))
+    assert set(paths) == {
+        f"app.logs.{name}.path" for name in config_manager.get_value("app.logs")
+    }
 
 
-def test_get_logger(config_manager: ConfigurationManager):
-    ...  # TODO
+def test_subscribe(config_manager):
+    changes = []
+    config_manager.subscribe("app.logs.*.level", changes.extend)
+    config_manager.set_value("app.logs.general.level", "DEBUG")
+    config_manager.set_value("app.provider", "other")
+    assert [str(path) for path in changes] == ["app.logs.general.level"]
+    assert config_manager.unsubscribe("app.logs.*.level", changes.extend) is True
+
+
+def test_binary_cache(tmp_path, mock_config):
+    config_file = tmp_path / "cached.json"
+    ConfigurationManager(str(config_file), initial_data=mock_config).save()
+    ConfigurationManager._instances = {}
+
+    config = ConfigurationManager(str(config_file), binary_cache=True)
+    config.load()
+    cache_file = config_file.with_name("cached.json.cache")
+    assert cache_file.exists()
+    assert config.get_value("app.provider") == "jsonpycraft"
+
+    config.set_value("app.provider", "cached", overwrite=True)
+    config.save()
+    config.load()
+    assert config.get_value("app.provider") == "cached"
+    ConfigurationManager._instances = {}
+
+
+@pytest.mark.parametrize("snapshot_reads", [False, True])
+def test_publish_shared(tmp_path, mock_config, snapshot_reads):
+    config = ConfigurationManager(
+        str(tmp_path / "shared.json"),
+        initial_data=mock_config,
+        snapshot_reads=snapshot_reads,
+    )
+    name = config.publish_shared()
+    shared = SharedConfiguration(name)
+    try:
+        assert shared.get_value("app.provider") == "jsonpycraft"
+        assert shared.data == mock_config
+
+        config.set_value("app.provider", "shared", overwrite=True)
+        assert shared.get_value("app.provider") == "jsonpycraft"
+        assert config.publish_shared() == name
+        assert shared.get_value("app.provider") == "shared"
+    finally:
+        shared.close()
+        config.close_shared()
+    with pytest.raises(FileNotFoundError):
+        SharedConfiguration(name)
+    ConfigurationManager._instances = {}
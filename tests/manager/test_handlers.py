@@ -0,0 +1,125 @@
+"""
+tests/manager/test_handlers.py
+"""
+
+import logging
+import queue
+
+import pytest
+
+from jsonpycraft.manager.handlers import (
+    BoundedQueueHandler,
+    queue_handler,
+    stop_listeners,
+)
+
+
+def make_record(message: str) -> logging.LogRecord:
+    return logging.makeLogRecord({"msg": message, "levelno": logging.INFO})
+
+
+def test_invalid_overflow():
+    with pytest.raises(ValueError):
+        BoundedQueueHandler(queue.Queue(), overflow="discard")
+
+
+def test_drop_new():
+    record_queue = queue.Queue(maxsize=2)
+    handler = BoundedQueueHandler(record_queue, overflow="drop_new")
+    for message in ("a", "b", "c", "d"):
+        handler.handle(make_record(message))
+
+    assert handler.dropped == 2
+    assert [record_queue.get_nowait().msg for _ in range(2)] == ["a", "b"]
+
+
+def test_drop_oldest():
+    record_queue = queue.Queue(maxsize=2)
+    handler = BoundedQueueHandler(record_queue, overflow="drop_oldest")
+    for message in ("a", "b", "c", "d"):
+        handler.handle(make_record(message))
+
+    assert handler.dropped == 2
+    assert [record_queue.get_nowait().msg for _ in range(2)] == ["c", "d"]
+
+
+def test_queue_handler_shared_and_flushed(tmp_path):
+    log_file = tmp_path / "app.log"
+    formatter = logging.Formatter("%(message)s")
+    handler = queue_handler(str(log_file), formatter)
+    assert queue_handler(str(log_file), formatter) is handler
+
+    logger = logging.getLogger("test_handlers.shared")
+    logger.propagate = False
+    logger.addHandler(handler)
+    try:
+        for index in range(100):
+            logger.warning("record %d", index)
+        stop_listeners()
+    finally:
+        logger.removeHandler(handler)
+
+    lines = log_file.read_text().splitlines()
+    assert lines == [f"record {index}" for index in range(100)]
+    # A stopped file gets a new handler and listener
+    new_handler = queue_handler(str(log_file))
+    assert new_handler is not handler
+    stop_listeners()
+
+
+def test_queue_handler_formatter_per_logger(tmp_path):
+    log_file = tmp_path / "formatted.log"
+    plain = queue_handler(str(log_file), logging.Formatter("plain %(message)s"))
+    named = queue_handler(str(log_file), logging.Formatter("%(name)s %(message)s"))
+    assert plain is not named
+    assert plain.queue is named.queue
+
+    loggers = []
+    for name, handler in (("formatter.plain", plain), ("formatter.named", named)):
+        logger = logging.getLogger(name)
+        logger.propagate = False
+        logger.addHandler(handler)
+        loggers.append((logger, handler))
+    try:
+        for logger, _ in loggers:
+            logger.warning("record")
+        stop_listeners()
+    finally:
+        for logger, handler in loggers:
+            logger.removeHandler(handler)
+
+    assert log_file.read_text().splitlines() == [
+        "plain record",
+        "formatter.named record",
+    ]
+
+
+def test_blocking_handler_drops_after_stop(tmp_path):
+    handler = queue_handler(str(tmp_path / "stopped.log"), queue_size=1)
+    stop_listeners()
+    assert handler.stopped
+
+    # The queue is never read again, so blocking would hang
+    for message in ("a", "b", "c"):
+        handler.handle(make_record(message))
+    assert handler.dropped == 3
+
+
+def test_queue_handler_rotation(tmp_path):
+    log_file = tmp_path / "rotated.log"
+    handler = queue_handler(str(log_file), max_bytes=200, backup_count=2)
+
+    logger = logging.getLogger("test_handlers.rotation")
+    logger.propagate = False
+    logger.addHandler(handler)
+    try:
+        for index in range(50):
+            logger.warning("a record long enough to rotate %d", index)
+        stop_listeners()
+    finally:
+        logger.removeHandler(handler)
+
+    assert log_file.exists()
+    assert (tmp_path / "rotated.log.1").exists()
+    assert (tmp_path / "rotated.log.2").exists()
+    assert not (tmp_path / "rotated.log.3").exists()
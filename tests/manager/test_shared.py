@@ -0,0 +1,141 @@
+"""
+tests/manager/test_shared.py
+"""
+
+import multiprocessing
+from multiprocessing import resource_tracker
+
+import pytest
+
+from jsonpycraft.manager import shared as shared_module
+from jsonpycraft.manager.shared import SharedConfiguration, SharedPublisher
+
+CONFIG = {
+    "db": {"host": "localhost", "port": 5432},
+    "workers": [{"name": "a"}, {"name": "b"}],
+    "debug": False,
+}
+
+
+@pytest.fixture
+def publisher():
+    publisher = SharedPublisher()
+    yield publisher
+    publisher.close()
+
+
+def read_in_worker(name, results):
+    shared = SharedConfiguration(name)
+    results.put((shared.version, shared.get_value("db.port")))
+    shared.close()
+
+
+def test_publish_and_read(publisher):
+    shared = SharedConfiguration(publisher.name)
+    assert shared.version == 0
+    assert shared.get_value("db.port") is None
+    assert shared.data == {}
+
+    assert publisher.publish(CONFIG) == 1
+    assert shared.get_value("db.port") == 5432
+    assert shared.get_value("workers")[1] == {"name": "b"}
+    assert shared.get_value("db.user", "admin") == "admin"
+    assert shared.get_value("missing.key") is None
+    assert shared.data == CONFIG
+    assert shared.version == 1
+    shared.close()
+
+
+def test_new_versions(publisher):
+    publisher.publish(CONFIG)
+    shared = SharedConfiguration(publisher.name)
+    assert shared.get_value("db.port") == 5432
+    assert shared.refresh() is False
+
+    publisher.publish({"db": {"host": "db.internal"}})
+    assert shared.published_version == 2
+    assert shared.version == 1  # Only moves on the next read
+    assert shared.get_value("db.port") is None
+    assert shared.get_value("db.host") == "db.internal"
+    assert shared.version == 2
+
+    # Skipped versions, whose segments are already unlinked, are never read
+    publisher.publish(CONFIG)
+    publisher.publish({"db": {"port": 1}})
+    assert shared.refresh() is True
+    assert shared.version == 4
+    assert shared.data == {"db": {"port": 1}}
+    shared.close()
+
+
+def test_closed(publisher):
+    publisher.publish(CONFIG)
+    shared = SharedConfiguration(publisher.name)
+    publisher.close()
+
+    # Attached readers keep their version
+    assert shared.get_value("db.port") == 5432
+    with pytest.raises(ValueError):
+        publisher.publish(CONFIG)
+    with pytest.raises(FileNotFoundError):
+        SharedConfiguration(publisher.name)
+
+    shared.close()
+    with pytest.raises(ValueError):
+        shared.refresh()
+
+
+def test_invalid_data(publisher):
+    with pytest.raises(ValueError):
+        publisher.publish({"value": object()})
+    assert publisher.version == 0
+
+
+def test_attach_leaves_tracker_balanced(publisher, monkeypatch):
+    publisher.publish(CONFIG)
+    calls = []
+    register = resource_tracker.register
+    unregister = resource_tracker.unregister
+    monkeypatch.setattr(
+        resource_tracker,
+        "register",
+        lambda name, rtype: calls.append(("register", name)) or register(name, rtype),
+    )
+    monkeypatch.setattr(
+        resource_tracker,
+        "unregister",
+        lambda name, rtype: calls.append(("unregister", name))
+        or unregister(name, rtype),
+    )
+
+    shared = SharedConfiguration(publisher.name)
+    assert shared.get_value("db.port") == 5432
+    shared.close()
+    if shared_module._TRACKED:
+        # Each attach undoes its own registration, without replacing the tracker functions
+        names = [f"/{publisher.name}", f"/{publisher.name}_1"]
+        assert calls == [
+            (call, name) for name in names for call in ("register", "unregister")
+        ]
+    else:
+        assert calls == []
+
+
+@pytest.mark.parametrize("method", ["fork", "spawn"])
+def test_worker_process(publisher, method):
+    if method not in multiprocessing.get_all_start_methods():
+        pytest.skip(f"{method} is not available")
+    publisher.publish(CONFIG)
+
+    context = multiprocessing.get_context(method)
+    results = context.Queue()
+    worker = context.Process(target=read_in_worker, args=(publisher.name, results))
+    worker.start()
+    assert results.get(timeout=30) == (1, 5432)
+    worker.join(timeout=30)
+    assert worker.exitcode == 0
+
+    # The segments outlive the worker
+    shared = SharedConfiguration(publisher.name)
+    assert shared.get_value("db.host") == "localhost"
+    shared.close()